@@ -0,0 +1,133 @@
+# benchmarks/bench_annotate.py
+#
+# Tag synthetic menus with the compiled FoodTagMatcher and with the previous
+# per-keyword substring search, check they agree and report the speedup.
+# The old loop only tagged whole restaurants; per-item tags with it means
+# running the same loop over every item, which is the fair baseline.
+#
+#   python -m benchmarks.bench_annotate
+#   python -m benchmarks.bench_annotate --items 50000 --seed 7
+
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from utils.annotate_food_types import FoodTagMatcher, load_keywords
+
+FILLER = [
+    "serveras", "med", "och", "rostad", "potatis", "ris", "sås", "krämig", "färsk", "örter",
+    "citron", "vitlök", "smör", "grädde", "pressgurka", "lingon", "bröd", "dagens", "husets",
+    "ugnsbakad", "stekt", "pocherad", "syltad", "rödlök", "chili", "koriander", "sesam",
+]
+
+def synthetic_menus(tag_data: dict, items: int, seed: int) -> Dict[str, dict]:
+    """Restaurants of 10-40 items whose texts mix filler words with food keywords."""
+    rng = random.Random(seed)
+    keywords = [kw for info in tag_data.values() for kw in info["keywords"]]
+
+    def text(words: int) -> str:
+        parts = [rng.choice(FILLER) for _ in range(words)]
+        for _ in range(rng.randint(0, 2)):
+            keyword = rng.choice(keywords)
+            # Glue some keywords into compounds, like "laxfilé" on real menus
+            parts.insert(rng.randrange(len(parts) + 1), keyword + rng.choice(["", "", "filé", "gryta"]))
+        return " ".join(parts)
+
+    menus = {}
+    remaining = items
+    while remaining > 0:
+        count = min(remaining, rng.randint(10, 40))
+        menus[f"Restaurant{len(menus):04d}"] = {
+            "day": "monday",
+            "items": [
+                {"name": text(3), "category": rng.choice(["Lunch", "Veckans", "VEG", ""]),
+                 "description": text(12), "price": "129 kr"}
+                for _ in range(count)
+            ],
+        }
+        remaining -= count
+    return menus
+
+def legacy_emojis(tag_data: dict, items: List[dict]) -> List[str]:
+    """The previous annotate_file loop: every keyword searched in the items' joined text."""
+    text_parts = []
+    for item in items:
+        text_parts.append(item.get("name", ""))
+        text_parts.append(item.get("description", ""))
+        text_parts.append(item.get("category", ""))
+    full_text = " ".join(text_parts).lower()
+
+    matched_tags = []
+    for tag, info in tag_data.items():
+        keywords = [kw.lower() for kw in info["keywords"]]
+        if any(kw in full_text for kw in keywords):
+            matched_tags.append((info.get("priority", 100), info["emoji"]))
+
+    sorted_emojis = []
+    seen = set()
+    for _, emoji in sorted(matched_tags):
+        if emoji not in seen:
+            sorted_emojis.append(emoji)
+            seen.add(emoji)
+    return sorted_emojis
+
+def legacy_restaurant_tags(tag_data: dict, menus: Dict[str, dict]):
+    return {name: legacy_emojis(tag_data, menu["items"]) for name, menu in menus.items()}
+
+def legacy_item_tags(tag_data: dict, menus: Dict[str, dict]):
+    return {name: [legacy_emojis(tag_data, [item]) for item in menu["items"]] for name, menu in menus.items()}
+
+def matcher_tags(tag_data: dict, menus: Dict[str, dict]):
+    """(per-item emojis, restaurant emojis) by restaurant, with a freshly compiled matcher."""
+    matcher = FoodTagMatcher(tag_data)
+    return {name: matcher.tag_items(menu["items"]) for name, menu in menus.items()}
+
+def best_of(repeat: int, func, *args):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark food tag annotation on synthetic menus.")
+    parser.add_argument("--items", type=int, default=12000, help="Number of synthetic menu items (default: 12000)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation, best is reported")
+    args = parser.parse_args()
+
+    tag_data = load_keywords()
+    menus = synthetic_menus(tag_data, args.items, args.seed)
+    print(f"{args.items} items in {len(menus)} restaurants, "
+          f"{sum(len(info['keywords']) for info in tag_data.values())} keywords in {len(tag_data)} tags")
+
+    restaurant_seconds, legacy_restaurants = best_of(args.repeat, legacy_restaurant_tags, tag_data, menus)
+    item_seconds, legacy_items = best_of(args.repeat, legacy_item_tags, tag_data, menus)
+    # Includes compiling the matcher, as annotate_file does
+    matcher_seconds, compiled = best_of(args.repeat, matcher_tags, tag_data, menus)
+    # The same menus again on one matcher: every item text is memoized, like weekly dishes on day 2-5
+    matcher = FoodTagMatcher(tag_data)
+    for menu in menus.values():
+        matcher.tag_items(menu["items"])
+    repeat_seconds, _ = best_of(args.repeat, lambda: [matcher.tag_items(menu["items"]) for menu in menus.values()])
+
+    print(f"{'old loop, restaurant tags only':<34} {restaurant_seconds * 1000:9.1f} ms")
+    print(f"{'old loop, per-item tags':<34} {item_seconds * 1000:9.1f} ms")
+    print(f"{'compiled matcher, item + restaurant':<34} {matcher_seconds * 1000:9.1f} ms  "
+          f"({item_seconds / matcher_seconds:.1f}x faster than per-item old loop)")
+    print(f"{'compiled matcher, repeated items':<34} {repeat_seconds * 1000:9.1f} ms")
+
+    item_mismatches = sum(
+        legacy != new
+        for name in menus
+        for legacy, new in zip(legacy_items[name], compiled[name][0])
+    )
+    # Restaurant tags can only differ where a multi-word keyword spans two items in the joined text
+    restaurant_mismatches = sum(legacy_restaurants[name] != compiled[name][1] for name in menus)
+    print(f"items with different tags: {item_mismatches}, restaurants with different tags: {restaurant_mismatches}")
+
+if __name__ == "__main__":
+    main()
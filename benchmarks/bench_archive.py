@@ -0,0 +1,77 @@
+# benchmarks/bench_archive.py
+#
+# Fill a temporary menu archive with a synthetic year (52 weeks x 5 days) for
+# many restaurants and time the archive's query helper on typical questions.
+#
+#   python -m benchmarks.bench_archive
+#   python -m benchmarks.bench_archive --restaurants 15 --items 6
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from utils import archive
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday"]
+# Tagged by the archive from food_tags.json, like scraped items
+DISHES = [
+    "Bakad lax med dillsås",
+    "Kycklinggryta med ris",
+    "Pasta carbonara",
+    "Falafel med hummus",
+    "Biff med bearnaise",
+    "Räksallad",
+]
+
+def synthetic_week(restaurants: int, items: int, rng: random.Random) -> dict:
+    days = {}
+    for day in WEEKDAYS:
+        days[day] = {
+            f"Restaurant{index}Scraper": {"day": day, "items": [
+                {"name": f"{name} {rng.randrange(1000)}", "category": "Lunch", "description": "",
+                 "price": "125 kr"}
+                for name in rng.sample(DISHES, min(items, len(DISHES)))
+            ] + [
+                {"name": f"Dagens {rng.randrange(1000)}", "category": "Dagens", "description": "",
+                 "price": "119 kr"}
+                for _ in range(max(0, items - len(DISHES)))
+            ]}
+            for index in range(restaurants)
+        }
+    return days
+
+def timed(label: str, run) -> None:
+    start = time.perf_counter()
+    rows = run()
+    elapsed = time.perf_counter() - start
+    count = len(rows) if isinstance(rows, list) else rows
+    print(f"{label:<44} {count:>7}   {elapsed * 1000:7.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark menu archive queries on a synthetic year.")
+    parser.add_argument("--restaurants", type=int, default=100)
+    parser.add_argument("--items", type=int, default=6, help="Items per restaurant and day (default: 6)")
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "archive.sqlite3")
+        start = time.perf_counter()
+        menus = sum(archive.ingest_days(synthetic_week(args.restaurants, args.items, rng), f"2025-W{week:02d}", path)
+                   for week in range(1, args.weeks + 1))
+        print(f"Archived {menus} restaurant menus in {time.perf_counter() - start:.1f} s "
+              f"({os.path.getsize(path) / 1024 / 1024:.1f} MiB)")
+
+        timed("fish days at one restaurant", lambda: archive.count_days("Restaurant7", tag="fish", path=path))
+        timed("one restaurant, one quarter", lambda: archive.query("Restaurant7", since="2025-W10",
+                                                                   until="2025-W22", path=path))
+        timed("one week, every restaurant", lambda: archive.query(since="2025-W30", until="2025-W30", path=path))
+        timed("carbonara days, every restaurant", lambda: archive.count_days(text="carbonara", path=path))
+        timed("carbonara items at one restaurant", lambda: archive.query("Restaurant7", text="carbonara", path=path))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_menus.py
+#
+# Build a synthetic week for many restaurants with the slotted, shared menu
+# records and with the previous dict-backed classes (one list copy per day),
+# and report memory (tracemalloc) and the time to serialize every day.
+#
+#   python -m benchmarks.bench_menus
+#   python -m benchmarks.bench_menus --restaurants 300 --items 40
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from scrapers.base import WEEKDAYS, MenuItem, WeeklyMenu
+
+CATEGORIES = ["Lunch", "Veckans", "VEG", "Dagens", "Sallad"]
+PRICES = ["119 kr", "125 kr", "129 kr", "135 kr", "149 kr"]
+
+class LegacyMenuItem:
+    """The previous MenuItem: a plain instance with a __dict__."""
+    def __init__(self, name, category=None, description=None, price=None):
+        self.name = name.strip()
+        self.category = category.strip() if category else None
+        self.description = description.strip() if description else None
+        self.price = price.strip() if price else None
+
+class LegacyDailyMenu:
+    def __init__(self, day, items):
+        self.day = day.lower()
+        self.items = items
+
+def legacy_serialize(menu) -> dict:
+    """The previous main._serialize_menu."""
+    return {
+        "day": menu.day,
+        "items": [
+            {"name": item.name,
+             "category": item.category or "",
+             "description": item.description or "",
+             "price": item.price or ""}
+            for item in menu.items
+        ]
+    }
+
+def raw_week(restaurants: int, items: int, seed: int):
+    """Item fields per restaurant, padded like scraped text so every item strips to new string objects."""
+    rng = random.Random(seed)
+    return [
+        [(f"Rätt {index} {rng.random():.6f} ", f"{rng.choice(CATEGORIES)} ",
+          f"Beskrivning {rng.random():.12f} ", f"{rng.choice(PRICES)} ")
+         for index in range(items)]
+        for _ in range(restaurants)
+    ]
+
+def build_legacy(week):
+    menus = []
+    for restaurant in week:
+        items = [LegacyMenuItem(*fields) for fields in restaurant]
+        menus.append({day: LegacyDailyMenu(day, list(items)) for day in WEEKDAYS})
+    return menus
+
+def build_shared(week):
+    return [WeeklyMenu([MenuItem(*fields) for fields in restaurant]).menus() for restaurant in week]
+
+def measure(build, week):
+    tracemalloc.start()
+    menus = build(week)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, menus
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark menu records on a synthetic week.")
+    parser.add_argument("--restaurants", type=int, default=100)
+    parser.add_argument("--items", type=int, default=20, help="Weekly items per restaurant (default: 20)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    week = raw_week(args.restaurants, args.items, args.seed)
+    print(f"{args.restaurants} restaurants x {args.items} weekly items, {len(WEEKDAYS)} days")
+
+    for label, build, serialize in [
+        ("dict-backed, list copy per day", build_legacy, legacy_serialize),
+        ("slotted, shared week", build_shared, lambda menu: menu.to_dict()),
+    ]:
+        size, menus = measure(build, week)
+        start = time.perf_counter()
+        for restaurant in menus:
+            for menu in restaurant.values():
+                serialize(menu)
+        serialize_seconds = time.perf_counter() - start
+        print(f"{label:<32} {size / 1024:9.0f} KiB   serialize {serialize_seconds * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# benchmarks/bench_parsers.py
+#
+# Parse the stored raw pages of every scraper with each BeautifulSoup backend
+# and report time and peak memory per scraper. Nothing is fetched.
+#
+#   python -m benchmarks.bench_parsers                  # this week's snapshots
+#   python -m benchmarks.bench_parsers --week 2025-W23
+#   python -m benchmarks.bench_parsers --pages fixtures/  # <ScraperName>.<ext> files
+
+import argparse
+import logging
+import os
+import time
+import tracemalloc
+from typing import Dict, Optional
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+import scrapers.base as base
+from main import SCRAPERS
+
+BACKENDS = ["html.parser", "lxml", "html5lib"]
+
+def available_backends() -> list:
+    backends = []
+    for backend in BACKENDS:
+        try:
+            BeautifulSoup("<p></p>", backend)
+        except FeatureNotFound:
+            print(f"Skipping {backend} (not installed)")
+            continue
+        backends.append(backend)
+    return backends
+
+def load_pages(week: Optional[str], pages_dir: Optional[str]) -> Dict[str, bytes]:
+    """Raw page per scraper name, from `pages_dir` when given, else from the snapshot store."""
+    pages = {}
+    for scraper_cls in SCRAPERS:
+        name = scraper_cls.__name__
+        raw = None
+        if pages_dir:
+            for filename in sorted(os.listdir(pages_dir)):
+                if os.path.splitext(filename)[0] == name:
+                    with open(os.path.join(pages_dir, filename), "rb") as f:
+                        raw = f.read()
+                    break
+        else:
+            raw = base.snapshot_store.latest(name, week)
+        if raw is not None:
+            pages[name] = raw
+    return pages
+
+def bench_scraper(scraper_cls, raw: bytes, repeat: int):
+    """Return (seconds per parse, peak traced bytes, items parsed) for the current backend."""
+    tracemalloc.start()
+    scraper = scraper_cls(raw=raw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    items = sum(len(menu.items) for menu in scraper.get_all_menus().values())
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        scraper_cls(raw=raw)
+    return (time.perf_counter() - start) / repeat, peak, items
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on stored scraper pages.")
+    parser.add_argument("--week", help="ISO week of the snapshots to parse (default: this week)")
+    parser.add_argument("--pages", help="Directory of <ScraperName>.<ext> pages to parse instead of snapshots")
+    parser.add_argument("--repeat", type=int, default=20, help="Parses per scraper and backend (default: 20)")
+    args = parser.parse_args()
+
+    # Scrapers log every parse at INFO; keep the report readable
+    logging.getLogger().setLevel(logging.WARNING)
+
+    pages = load_pages(args.week, args.pages)
+    if not pages:
+        print("No pages found. Run the scrapers once (or pass --pages) to record some.")
+        return
+    backends = available_backends()
+    default_backend = base.HTML_PARSER
+
+    print(f"{'scraper':<28} {'KiB':>7}  " + "  ".join(f"{b + ' ms':>14} {'peak KiB':>9} {'items':>5}" for b in backends))
+    totals = {backend: 0.0 for backend in backends}
+    for scraper_cls in SCRAPERS:
+        name = scraper_cls.__name__
+        if name not in pages:
+            continue
+
+        columns = []
+        reference_items = None
+        for backend in backends:
+            base.HTML_PARSER = backend
+            seconds, peak, items = bench_scraper(scraper_cls, pages[name], args.repeat)
+            totals[backend] += seconds
+            # Flag backends that parse a different number of items than the first one
+            reference_items = items if reference_items is None else reference_items
+            marker = "!" if items != reference_items else " "
+            columns.append(f"{seconds * 1000:14.2f} {peak / 1024:9.0f} {items:>4}{marker}")
+        print(f"{name:<28} {len(pages[name]) / 1024:7.1f}  " + "  ".join(columns))
+
+    base.HTML_PARSER = default_backend
+    print(f"{'total':<28} {'':>7}  " + "  ".join(f"{totals[b] * 1000:14.2f} {'':>9} {'':>5}" for b in backends))
+    print("(! = item count differs from the first backend)")
+
+if __name__ == "__main__":
+    main()
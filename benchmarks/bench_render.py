@@ -0,0 +1,82 @@
+# benchmarks/bench_render.py
+#
+# Render the index page for a synthetic 50-restaurant, 1,000-item day and
+# report template compile, bytecode-cache load and warm render times.
+#
+#   python -m benchmarks.bench_render
+#   python -m benchmarks.bench_render --restaurants 100 --items 4000
+
+import argparse
+import random
+import time
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+import generate_html
+from utils.annotate_food_types import annotate_menus
+
+WORDS = [
+    "lax", "kyckling", "tofu", "curry", "sallad", "ris", "potatis", "sås", "rostad", "krämig",
+    "vitlök", "citron", "örter", "biff", "pasta", "svamp", "chili", "koriander", "sesam", "naan",
+]
+
+def synthetic_day(restaurants: int, items: int, seed: int) -> dict:
+    """`items` menu items spread evenly over `restaurants` restaurants, annotated like scraped data."""
+    rng = random.Random(seed)
+
+    def text(words: int) -> str:
+        return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+    per_restaurant = max(1, items // restaurants)
+    data = {
+        f"Restaurant{index:03d}Scraper": {
+            "day": "monday",
+            "items": [
+                {"name": text(3), "category": rng.choice(["Lunch", "VEG", "Veckans", ""]),
+                 "description": text(10), "price": f"{rng.randint(95, 160)} kr"}
+                for _ in range(per_restaurant)
+            ],
+        }
+        for index in range(restaurants)
+    }
+    return annotate_menus(data)
+
+def render(data: dict) -> str:
+    assets = {name: f"static/{name}" for name in generate_html.HASHED_ASSETS}
+    return generate_html.render_index_page(data, {}, "monday", "2025-01-01 10:30", assets)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark index page rendering on a synthetic day.")
+    parser.add_argument("--restaurants", type=int, default=50)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20, help="Warm renders to average (default: 20)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    data = synthetic_day(args.restaurants, args.items, args.seed)
+
+    # Compiling from source, as every call did with a fresh Environment before
+    start = time.perf_counter()
+    env = Environment(loader=FileSystemLoader("templates"), autoescape=select_autoescape(["html"]))
+    env.get_template("index_template.html")
+    compile_seconds = time.perf_counter() - start
+
+    # A new process: fresh shared environment, template loaded from the bytecode cache
+    render(data)  # make sure the cache is populated
+    generate_html._env = None
+    start = time.perf_counter()
+    generate_html.get_environment().get_template("index_template.html")
+    cached_load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        html = render(data)
+    render_seconds = (time.perf_counter() - start) / args.repeat
+
+    print(f"{args.restaurants} restaurants, {args.items} items -> {len(html.encode('utf-8')) / 1024:.0f} KiB of HTML")
+    print(f"{'compile template from source':<34} {compile_seconds * 1000:8.2f} ms")
+    print(f"{'load template from bytecode cache':<34} {cached_load_seconds * 1000:8.2f} ms")
+    print(f"{'render (warm, shared environment)':<34} {render_seconds * 1000:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_search.py
+#
+# Build the menu search index (utils/search.py) over a year of menus and time
+# the build, the published size and queries. The year is read from the menu
+# archive (data/menu_archive.sqlite3) when it holds one, or generated: dishes
+# made of food_tags.json keywords, half of each restaurant's items weekly.
+#
+#   python -m benchmarks.bench_search
+#   python -m benchmarks.bench_search --synthetic --restaurants 15
+
+import argparse
+import gzip
+import json
+import os
+import random
+import statistics
+import time
+
+from utils import archive, search
+from utils.annotate_food_types import load_keywords
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday"]
+QUERIES = ["curry", "kyckling", "chicken", "fish", "lax", "räkor", "pasta carbonara", "veg", "soppa", "tikka masala",
+           "bi", "kött"]
+
+def archived_year(path: str) -> dict:
+    """{"<week> <day>": lunch data} for every archived day, oldest first."""
+    days: dict = {}
+    for row in archive.query(path=path):
+        menu = days.setdefault(f"{row['week']} {row['day']}", {}).setdefault(row["restaurant"], {"items": []})
+        menu["items"].append({field: row[field] for field in ("name", "category", "description", "price")})
+    return days
+
+def synthetic_year(restaurants: int, items: int, weeks: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    words = sorted({keyword for info in load_keywords().values() for keyword in info["keywords"]})
+
+    def dish():
+        return {"name": f"{rng.choice(words).capitalize()} med {rng.choice(words)}",
+                "description": f"Serveras med {rng.choice(words)} och {rng.choice(words)}",
+                "category": rng.choice(["Lunch", "Veckans", "VEG", "Dagens"]), "price": "125 kr"}
+
+    days = {}
+    for week in range(1, weeks + 1):
+        weekly = [[dish() for _ in range(items // 2)] for _ in range(restaurants)]
+        for day in WEEKDAYS:
+            days[f"2025-W{week:02d} {day}"] = {
+                f"Restaurant{index}Scraper": {"items": weekly[index] + [dish() for _ in range(items - items // 2)]}
+                for index in range(restaurants)
+            }
+    return days
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the menu search index on a year of menus.")
+    parser.add_argument("--archive", default=archive.ARCHIVE_PATH)
+    parser.add_argument("--synthetic", action="store_true", help="Generate the year even if the archive exists")
+    parser.add_argument("--restaurants", type=int, default=100)
+    parser.add_argument("--items", type=int, default=6, help="Items per restaurant and day (default: 6)")
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    days = {}
+    if not args.synthetic and os.path.exists(args.archive):
+        days = archived_year(args.archive)
+    source = args.archive
+    if not days:
+        days = synthetic_year(args.restaurants, args.items, args.weeks, args.seed)
+        source = f"synthetic, {args.restaurants} restaurants x {args.items} items, {args.weeks} weeks"
+    items = sum(len(menu["items"]) for data in days.values() for menu in data.values())
+    print(f"{len(days)} days, {items} items ({source})")
+
+    start = time.perf_counter()
+    index = search.build_index(days)
+    build_seconds = time.perf_counter() - start
+    payload = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    print(f"build {build_seconds * 1000:.0f} ms: {len(index['docs'])} documents, {len(index['terms'])} terms, "
+          f"{len(payload) / 1024:.0f} KiB JSON, {len(gzip.compress(payload, 9)) / 1024:.0f} KiB gzip")
+
+    index = search.decode(index)
+    day = next(iter(days))
+    print(f"{'query':<18} {'results':>7} {'median ms':>10} {'max ms':>8}")
+    for query in QUERIES:
+        timings = []
+        for _ in range(20):
+            start = time.perf_counter()
+            results = search.search(index, query, day)
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f"{query:<18} {len(results):>7} {statistics.median(timings):>10.2f} {max(timings):>8.2f}")
+
+if __name__ == "__main__":
+    main()
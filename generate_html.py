@@ -1,993 +1,307 @@
 # file: lindholmen_lunch/generate_html.py
 
+import argparse
+import hashlib
 import json
 import os
-from jinja2 import Environment, FileSystemLoader
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
-from utils.annotate_food_types import annotate_file
+from utils import manifest, metrics, precompress, search, store
+from utils.minify import minify_html
 from utils.utils import get_today_english
 
-def load_restaurant_links() -> dict:
-    try:
-        with open("data/restaurant_links.json", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        print("[WARN] restaurant_links.json missing or malformed, skipping links.")
-        return {}
+OUTPUT_DIR = "docs"
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday"]
+RENDER_WORKERS = 4
 
-def generate_lunch_summary(day: str):
-    data_path = f"data/lunch_data_{day}.json"
-    if not os.path.exists(data_path):
-        print(f"[WARN] No data file for {day}: {data_path}")
-        return
-    
-    # Annotate food types in the data file
-    annotate_file(data_path)
+# Production output (LUNCH_PRODUCTION=1 or --production): pages are minified before writing
+PRODUCTION = os.environ.get("LUNCH_PRODUCTION") == "1"
 
-    with open(data_path, encoding="utf-8") as f:
-        lunch_data = json.load(f)
+# English and Swedish UI text of the index page, applied client-side by app.js
+I18N_PATH = os.path.join("templates", "i18n.json")
 
-    restaurant_links = load_restaurant_links()
-
-    env = Environment(loader=FileSystemLoader("templates"))
-    template = env.get_template("summary_template.html")
-
-    # CEST / Sweden local time (UTC+2)
-    sweden_tz = timezone(timedelta(hours=2))
-
-    output_html = template.render(
-        day=day.capitalize(),
-        lunch_data=lunch_data,
-        restaurant_links=restaurant_links,
-        last_updated=datetime.now(sweden_tz).strftime("%Y-%m-%d %H:%M")
-    )
+# Sources of the index page's CSS/JS, published as docs/static/<name>.<hash>.<ext>
+STATIC_SOURCE_DIR = os.path.join("templates", "static")
+HASHED_ASSETS = ("styles.css", "app.js", "icon.svg")
 
-    os.makedirs("docs", exist_ok=True)
-    output_path = f"docs/lunch_{day}.html"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(output_html)
+# Written from templates/sw.js; must sit at the site root to control every page
+SERVICE_WORKER = "sw.js"
+WEB_MANIFEST = "manifest.webmanifest"
+THEME_COLOR = "#030213"
 
-    print(f"[INFO] Generated HTML summary for {day}: {output_path}")
+# JSON feed of the week's menus for the day switcher and other clients.
+# Bump API_VERSION (here and in app.js) on incompatible changes to its format.
+API_DIR = os.path.join(OUTPUT_DIR, "api")
+API_VERSION = 1
+API_ITEM_FIELDS = ("name", "description", "category", "price", "emoji_tags")
 
+# Cache rules for hosts that read a `_headers` file (Netlify, Cloudflare Pages).
+# Hashed assets never change under the same name; pages are revalidated.
+CACHE_HEADERS = """/static/*
+  Cache-Control: public, max-age=31536000, immutable
 
-def generate_index_page():
-    output_dir = Path("docs")
-    output_dir.mkdir(exist_ok=True)
+/*
+  Cache-Control: public, max-age=0, must-revalidate
+"""
 
-    # Get today's day and load today's data
-    today = get_today_english().lower()
-    
-    # Load today's lunch data
-    today_data_path = f"data/lunch_data_{today}.json"
-    lunch_data = {}
-    if os.path.exists(today_data_path):
-        with open(today_data_path, encoding="utf-8") as f:
-            lunch_data = json.load(f)
-    
-    restaurant_links = load_restaurant_links()
+# CEST / Sweden local time (UTC+2)
+SWEDEN_TZ = timezone(timedelta(hours=2))
 
-    # CEST / Sweden local time (UTC+2)
-    sweden_tz = timezone(timedelta(hours=2))
-    last_updated = datetime.now(sweden_tz).strftime("%Y-%m-%d %H:%M")
-
-    # Create restaurant list for random selection
-    restaurant_names = list(lunch_data.keys()) if lunch_data else []
-
-    html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <!-- Google Analytics -->
-    <script async src="https://www.googletagmanager.com/gtag/js?id=G-LMDT71XZ0C"></script>
-    <script>
-      window.dataLayer = window.dataLayer || [];
-      function gtag(){dataLayer.push(arguments);}
-      gtag('js', new Date());
-      gtag('config', 'G-LMDT71XZ0C');
-    </script>
-    <script async src="https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client=ca-pub-7499028717075061"
-     crossorigin="anonymous"></script>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="google-site-verification" content="iUNSsOQ8Uw21911zTxrbq0FNyaY7uwQu6iq8XffofsA" />
-    <title>Today's lunch in Lindholmen</title>
-    <meta name="description" content="Today's lunch from restaurants in Lindholmen – updated daily." />
-    
-    <style>
-        /* CSS Variables matching reference design */
-        :root {
-            --background: #ffffff;
-            --foreground: #0a0a0a;
-            --card: #ffffff;
-            --card-foreground: #0a0a0a;
-            --primary: #030213;
-            --primary-foreground: #ffffff;
-            --secondary: #f3f4f6;
-            --secondary-foreground: #030213;
-            --muted: #f9fafb;
-            --muted-foreground: #6b7280;
-            --accent: #f3f4f6;
-            --accent-foreground: #030213;
-            --border: rgba(0, 0, 0, 0.1);
-            --radius: 0.625rem;
-            --blue-50: #eff6ff;
-            --indigo-100: #e0e7ff;
-            --blue-600: #2563eb;
-            --orange-500: #f97316;
-            --red-500: #ef4444;
-            --green-50: #f0fdf4;
-            --green-700: #15803d;
-        }
-
-        * {
-            box-sizing: border-box;
-            margin: 0;
-            padding: 0;
-        }
-
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif;
-            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-            min-height: 100vh;
-            color: var(--foreground);
-            line-height: 1.5;
-        }
-
-        /* Header */
-        .header {
-            background: rgba(255, 255, 255, 0.8);
-            backdrop-filter: blur(20px) saturate(180%);
-            -webkit-backdrop-filter: blur(20px) saturate(180%);
-            border-bottom: 1px solid rgba(255, 255, 255, 0.6);
-            position: sticky;
-            top: 0;
-            z-index: 10;
-            box-shadow: 0 1px 20px rgba(0, 0, 0, 0.05);
-        }
-
-        .header-container {
-            max-width: 1792px;
-            margin: 0 auto;
-            padding: 1rem 1.5rem;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }
-
-        .header-left {
-            display: flex;
-            align-items: center;
-            gap: 0.75rem;
-        }
-
-        .icon-utensils {
-            width: 2rem;
-            height: 2rem;
-            color: var(--blue-600);
-        }
-
-        .header-title {
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #1d1d1f;
-            margin: 0;
-            text-shadow: 0 1px 2px rgba(255, 255, 255, 0.5);
-        }
-
-        .header-subtitle {
-            font-size: 0.875rem;
-            color: #6e6e73;
-            margin: 0;
-        }
-
-        .header-right {
-            display: flex;
-            align-items: center;
-            gap: 0.75rem;
-        }
-
-        .language-toggle {
-            background: rgba(255, 255, 255, 0.6);
-            backdrop-filter: blur(10px);
-            -webkit-backdrop-filter: blur(10px);
-            border: 0.5px solid rgba(0, 0, 0, 0.1);
-            border-radius: 12px;
-            padding: 0.5rem 0.75rem;
-            cursor: pointer;
-            font-size: 0.875rem;
-            font-weight: 500;
-            color: #1d1d1f;
-            transition: all 0.2s ease;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }
-
-        .language-toggle:hover {
-            background: rgba(255, 255, 255, 0.8);
-            border: 0.5px solid rgba(0, 0, 0, 0.15);
-        }
-
-        .badge {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.25rem;
-            padding: 0.5rem 0.75rem;
-            background: rgba(255, 255, 255, 0.6);
-            backdrop-filter: blur(10px);
-            -webkit-backdrop-filter: blur(10px);
-            color: #1d1d1f;
-            border: 0.5px solid rgba(0, 0, 0, 0.1);
-            border-radius: 12px;
-            font-size: 0.875rem;
-            font-weight: 500;
-        }
-
-        /* Main Content */
-        .main-container {
-            max-width: 1792px;
-            margin: 0 auto;
-            padding: 2rem 1.5rem;
-        }
-
-        .hero-section {
-            text-align: center;
-            margin-bottom: 3rem;
-            max-width: 42rem;
-            margin-left: auto;
-            margin-right: auto;
-        }
-
-        .hero-section h1 {
-            font-size: 1.875rem;
-            font-weight: 700;
-            color: #1d1d1f;
-            margin-bottom: 1rem;
-            text-shadow: 0 1px 3px rgba(255, 255, 255, 0.5);
-        }
-
-        .hero-section p {
-            font-size: 1.125rem;
-            color: #6e6e73;
-            margin-bottom: 2rem;
-            text-shadow: 0 1px 2px rgba(255, 255, 255, 0.3);
-        }
-
-        /* Random Selection */
-        .random-section {
-            text-align: center;
-            margin-bottom: 3rem;
-        }
-
-        /* Floating Random Button */
-        .floating-random-button {
-            position: fixed;
-            bottom: 2rem;
-            left: 50%;
-            transform: translateX(-50%);
-            z-index: 100;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            background: linear-gradient(135deg, #ff6b35 0%, #f7931e 100%);
-            color: white;
-            border: none;
-            border-radius: 2rem;
-            padding: 0.75rem 1.5rem;
-            font-size: 0.875rem;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            box-shadow: 0 4px 20px rgba(255, 107, 53, 0.4);
-            white-space: nowrap;
-            min-width: 200px;
-            max-width: 280px;
-            height: 48px;
-        }
-
-        .floating-random-button:hover {
-            transform: translateX(-50%) translateY(-2px);
-            background: linear-gradient(135deg, #ff8a5b 0%, #ffa726 100%);
-            box-shadow: 0 6px 25px rgba(255, 107, 53, 0.5);
-        }
-
-        .floating-random-button:active {
-            transform: translateX(-50%) translateY(0px) scale(0.98);
-            transition: all 0.1s ease;
-        }
-
-        /* Mobile adjustments */
-        @media (max-width: 768px) {
-            .floating-random-button {
-                bottom: 1.5rem;
-                font-size: 0.8rem;
-                padding: 0.625rem 1.25rem;
-                min-width: 180px;
-                max-width: 250px;
-                height: 44px;
-            }
-        }
+SWEDISH_DAY_NAMES = {
+    "monday": "Måndag",
+    "tuesday": "Tisdag",
+    "wednesday": "Onsdag",
+    "thursday": "Torsdag",
+    "friday": "Fredag",
+}
 
+_env: Optional[Environment] = None
+_env_lock = threading.Lock()
 
+def get_environment() -> Environment:
+    """
+    Return the process-wide Jinja environment. Templates are compiled once per
+    process, their bytecode is cached on disk across runs, and HTML is autoescaped.
+    """
+    global _env
+    with _env_lock:
+        if _env is None:
+            _env = Environment(
+                loader=FileSystemLoader("templates"),
+                bytecode_cache=FileSystemBytecodeCache(),
+                autoescape=select_autoescape(["html"]),
+                # Keep {% %} lines from leaving blank lines and indentation in the output
+                trim_blocks=True,
+                lstrip_blocks=True,
+            )
+            with open(I18N_PATH, encoding="utf-8") as f:
+                _env.globals["i18n"] = json.load(f)
+        return _env
 
-        .icon-shuffle {
-            width: 1.25rem;
-            height: 1.25rem;
-        }
+def load_restaurant_links() -> dict:
+    try:
+        with open("data/restaurant_links.json", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        print("[WARN] restaurant_links.json missing or malformed, skipping links.")
+        return {}
 
-        /* Restaurant Grid - Simple Masonry Layout */
-        .restaurant-grid {
-            column-count: 1;
-            column-gap: 1.5rem;
-            width: 100%;
-        }
+def load_lunch_data(day: str) -> Optional[dict]:
+    """A day's lunch data from the menu store, tagged, or None if the day was never scraped."""
+    return store.get_store().load_day(day)
 
-        /* Responsive Columns */
-        @media (min-width: 768px) {
-            .restaurant-grid {
-                column-count: 2;
-            }
-        }
+def last_updated_for(day: str) -> str:
+    """When the day's menus last changed (from the data manifest), so unchanged data renders identical pages."""
+    updated = store.get_store().last_updated(day) or datetime.now(timezone.utc)
+    return updated.astimezone(SWEDEN_TZ).strftime("%Y-%m-%d %H:%M")
 
-        @media (min-width: 1024px) {
-            .restaurant-grid {
-                column-count: 3;
-            }
-        }
-
-        .restaurant-card {
-            background: rgba(255, 255, 255, 0.7);
-            backdrop-filter: blur(20px) saturate(180%);
-            -webkit-backdrop-filter: blur(20px) saturate(180%);
-            border-radius: 20px;
-            border: 0.5px solid rgba(255, 255, 255, 0.8);
-            overflow: hidden;
-            transition: all 0.3s ease;
-            box-shadow: 
-                0 8px 32px rgba(0, 0, 0, 0.08),
-                0 2px 8px rgba(0, 0, 0, 0.04),
-                inset 0 1px 0 rgba(255, 255, 255, 0.9);
-            display: flex;
-            flex-direction: column;
-            gap: 1.5rem;
-            break-inside: avoid;
-            margin-bottom: 1.5rem;
-            width: 100%;
-        }
-
-        .restaurant-card:hover {
-            transform: translateY(-2px);
-            box-shadow: 
-                0 12px 40px rgba(0, 0, 0, 0.12),
-                0 4px 12px rgba(0, 0, 0, 0.08),
-                inset 0 1px 0 rgba(255, 255, 255, 1);
-            background: rgba(255, 255, 255, 0.85);
-            border: 0.5px solid rgba(255, 255, 255, 1);
-        }
-
-        .restaurant-card.highlighted {
-            border: 2px solid var(--orange-500);
-            box-shadow: 0 10px 25px rgba(249, 115, 22, 0.3);
-            transform: translateY(-1px);
-        }
-
-        .restaurant-header {
-            padding: 1.5rem 1.5rem 0;
-            display: grid;
-            grid-template-columns: 1fr auto;
-            grid-template-rows: auto auto;
-            gap: 1rem 1.5rem;
-            align-items: start;
-        }
-
-        .restaurant-info {
-            flex: 1;
-            min-width: 0;
-        }
-
-        .restaurant-name {
-            font-size: 1.25rem;
-            font-weight: 600;
-            margin: 0 0 0.25rem 0;
-            color: #1d1d1f;
-            word-wrap: break-word;
-            overflow-wrap: break-word;
-            hyphens: auto;
-            text-shadow: 0 1px 2px rgba(255, 255, 255, 0.5);
-        }
-
-        .restaurant-meta {
-            display: flex;
-            flex-direction: column;
-            gap: 0.25rem;
-            font-size: 0.875rem;
-            color: #6e6e73;
-        }
-
-        .restaurant-meta-item {
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }
-
-        .cuisine-badge {
-            display: inline-block;
-            padding: 0.25rem 0.5rem;
-            background: var(--secondary);
-            color: var(--secondary-foreground);
-            border-radius: calc(var(--radius) - 2px);
-            font-size: 0.75rem;
-            font-weight: 500;
-            margin-top: 0.5rem;
-        }
-
-        .restaurant-links {
-            display: flex;
-            gap: 0.5rem;
-            align-items: flex-start;
-            flex-shrink: 0;
-        }
-
-        .restaurant-links a {
-            color: var(--primary);
-            text-decoration: none;
-            font-size: 1.2rem;
-            opacity: 0.8;
-            transition: opacity 0.2s ease;
-        }
-
-        .restaurant-links a:hover {
-            opacity: 1;
-        }
-
-        .restaurant-content {
-            padding: 0 1.5rem 1.5rem;
-            flex-grow: 1;
-            display: flex;
-            flex-direction: column;
-        }
-
-        .menu-section h3 {
-            font-size: 1rem;
-            font-weight: 600;
-            color: #1d1d1f;
-            margin-bottom: 1rem;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            text-shadow: 0 1px 2px rgba(255, 255, 255, 0.5);
-        }
-
-        .menu-items {
-            display: flex;
-            flex-direction: column;
-            gap: 0.75rem;
-        }
-
-        .menu-item {
-            display: flex;
-            justify-content: space-between;
-            align-items: flex-start;
-            gap: 1rem;
-            padding: 0.75rem;
-            background: rgba(255, 255, 255, 0.4);
-            border-radius: 12px;
-            border: 0.5px solid rgba(255, 255, 255, 0.6);
-            transition: all 0.2s ease;
-            min-height: fit-content;
-        }
-
-        .menu-item:hover {
-            background: rgba(255, 255, 255, 0.6);
-            border: 0.5px solid rgba(255, 255, 255, 0.8);
-        }
-
-        .menu-item-details {
-            flex: 1;
-            min-width: 0;
-        }
-
-        .menu-item-name {
-            font-weight: 600;
-            color: #1d1d1f;
-            margin-bottom: 0.25rem;
-            word-wrap: break-word;
-            overflow-wrap: break-word;
-            hyphens: auto;
-            line-height: 1.4;
-        }
-
-        .menu-item-description {
-            font-size: 0.875rem;
-            color: #6e6e73;
-            word-wrap: break-word;
-            overflow-wrap: break-word;
-            hyphens: auto;
-            line-height: 1.4;
-        }
-
-        .menu-item-price {
-            font-weight: 600;
-            color: #1d1d1f;
-            align-self: flex-start;
-            flex-shrink: 0;
-            margin-left: 0.5rem;
-            max-width: 180px; /* Set maximum width */
-            text-align: right;
-            line-height: 1.3;
-            word-wrap: break-word;
-            overflow-wrap: break-word;
-            hyphens: auto;
-        }
-
-        .emoji-tags {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.25rem;
-            margin-top: 0.5rem;
-        }
-
-        .emoji-tag {
-            font-size: 1.1rem;
-        }
-
-        /* Separator */
-        .separator {
-            height: 1px;
-            background: var(--border);
-            margin: 1.5rem 0;
-        }
-
-        /* Special Offer */
-        .special-offer {
-            background: var(--green-50);
-            color: var(--green-700);
-            padding: 0.75rem;
-            border-radius: var(--radius);
-            font-weight: 500;
-            font-size: 0.875rem;
-            margin-top: auto;
-        }
-
-
-
-        /* Footer */
-        .footer {
-            max-width: 1280px;
-            margin: 3rem auto 0;
-            padding: 2rem 1.5rem;
-            border-top: 1px solid rgba(0, 0, 0, 0.1);
-            text-align: center;
-            color: #6e6e73;
-        }
-
-        .footer p {
-            margin: 0.5rem 0;
-        }
-
-        .footer a {
-            color: #1d1d1f;
-            text-decoration: none;
-        }
-
-        .footer a:hover {
-            text-decoration: underline;
-        }
-
-        /* Icons using CSS */
-        .icon-utensils::before { content: "🍽️"; }
-        .icon-clock::before { content: "🕐"; }
-        .icon-map::before { content: "📍"; }
-        .icon-menu::before { content: "📋"; }
-        .icon-shuffle::before { content: "🎲"; }
-        .icon-language::before { content: "🌐"; }
-
-        /* No Data Message */
-        .no-data {
-            text-align: center;
-            padding: 3rem;
-            color: var(--muted-foreground);
-        }
-
-        .no-data h2 {
-            font-size: 1.5rem;
-            margin-bottom: 1rem;
-            color: var(--foreground);
-        }
-
-        /* Hidden class for language switching */
-        .hidden {
-            display: none;
-        }
-
-        /* Responsive Design */
-        @media (max-width: 768px) {
-            .header-container {
-                flex-direction: column;
-                align-items: flex-start;
-            }
-            
-            .hero-section h1 {
-                font-size: 2rem;
-            }
-            
-            .restaurant-grid {
-                grid-template-columns: 1fr;
-            }
-            
-            .restaurant-header {
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 0.75rem;
-            }
-            
-            .restaurant-links {
-                align-self: flex-end;
-            }
-        }
-
-        @media (max-width: 480px) {
-            .restaurant-grid {
-                grid-template-columns: 1fr;
-                gap: 1rem;
-            }
-            
-            .menu-item {
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 0.5rem;
-                padding: 1rem;
-            }
-            
-            .menu-item-details {
-                width: 100%;
-            }
-            
-            .menu-item-name {
-                font-size: 0.95rem;
-                line-height: 1.3;
-            }
-            
-            .menu-item-description {
-                font-size: 0.8rem;
-                line-height: 1.3;
-            }
-            
-            .menu-item-price {
-                align-self: flex-end;
-                margin-left: 0;
-                margin-top: 0.25rem;
-                max-width: 100%; /* Allow full width on mobile */
-                text-align: left; /* Left align on mobile */
-            }
-
-            .restaurant-header {
-                flex-direction: column;
-                align-items: stretch;
-            }
+def render_lunch_summary(day: str, lunch_data: dict, restaurant_links: dict, last_updated: str) -> str:
+    """Render templates/summary_template.html for one day's (annotated) lunch data."""
+    return get_environment().get_template("summary_template.html").render(
+        day=day.capitalize(),
+        day_sv=SWEDISH_DAY_NAMES.get(day, day.capitalize()),
+        lunch_data=lunch_data,
+        restaurant_links=restaurant_links,
+        last_updated=last_updated,
+    )
 
-            .restaurant-links {
-                align-self: flex-start;
+def restaurant_display_name(scraper_name: str) -> str:
+    return scraper_name.replace("Scraper", "").replace("_", " ")
+
+def api_day(day: str, lunch_data: dict, restaurant_links: dict) -> dict:
+    """One day's (annotated) lunch data in the published API format."""
+    updated = store.get_store().last_updated(day)
+    return {
+        "day": day,
+        "updated": updated.isoformat() if updated else None,
+        "restaurants": [
+            {
+                "id": scraper_name,
+                "name": restaurant_display_name(scraper_name),
+                "links": restaurant_links.get(scraper_name.replace("Scraper", ""), {}),
+                "emoji_tags": menu.get("emoji_tags", []),
+                "items": [{field: item.get(field) for field in API_ITEM_FIELDS} for item in menu.get("items", [])],
             }
-        }
-    </style>
-</head>
-
-<body>
-    <!-- Header -->
-    <header class="header">
-        <div class="header-container">
-            <div class="header-left">
-                <span class="icon-utensils" style="font-size: 2rem; color: var(--primary);"></span>
-                <div>
-                    <h1 class="header-title" onclick="goToTop()">Lindholmen Lunch</h1>
-                    <p class="header-subtitle">
-                        <span class="en">Today's lunch in Lindholmen, Gothenburg</span>
-                        <span class="sv hidden">Dagens lunch i Lindholmen, Göteborg</span>
-                    </p>
-                </div>
-            </div>
-            <div class="header-right">
-                <button class="language-toggle" onclick="toggleLanguage()">
-                    <span class="icon-language"></span>
-                    <span class="en">Svenska</span>
-                    <span class="sv hidden">English</span>
-                </button>
-                <div class="badge">
-                    <span class="icon-clock"></span>
-                    <span class="en">Today: """ + today.capitalize() + """</span>
-                    <span class="sv hidden">Idag: """ + today.replace("monday", "Måndag").replace("tuesday", "Tisdag").replace("wednesday", "Onsdag").replace("thursday", "Torsdag").replace("friday", "Fredag") + """</span>
-                </div>
-            </div>
-        </div>
-    </header>
-
-    <!-- Main Content -->
-    <main class="main-container">
-        <div class="hero-section">
-            <h1>
-                <span class="en">What should you eat today?</span>
-                <span class="sv hidden">Vad ska du äta idag?</span>
-            </h1>
-            <p>
-                <span class="en">Explore today's lunch offers in Lindholmen or let us choose for you!</span>
-                <span class="sv hidden">Upptäck dagens luncherbjudanden i Lindholmen eller låt oss välja åt dig!</span>
-            </p>
-        </div>
-
-
+            for scraper_name, menu in lunch_data.items()
+        ],
+    }
+
+def _write_json(path: str, data: dict) -> None:
+    # Compact: the feed is fetched by browsers, not read by people
+    if manifest.write_if_changed(path, json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")):
+        print(f"[INFO] Generated {path}")
+
+@metrics.stage("generate_api")
+def build_api(lunch_data: Dict[str, Optional[dict]], restaurant_links: dict) -> None:
+    """Write docs/api/<day>.json for every day with data, and all of them together as docs/api/week.json."""
+    days = {
+        day: api_day(day, data, restaurant_links)
+        for day, data in lunch_data.items()
+        if day in WEEKDAYS and data is not None
+    }
+    for day, data in days.items():
+        _write_json(os.path.join(API_DIR, f"{day}.json"), {"version": API_VERSION, **data})
+    _write_json(os.path.join(API_DIR, "week.json"), {"version": API_VERSION, "days": days})
+
+@metrics.stage("generate_search")
+def build_search(lunch_data: Dict[str, Optional[dict]]) -> None:
+    """Write docs/api/search.json, the week's search index for the index page (see utils/search.py)."""
+    days = {day: data for day, data in lunch_data.items() if day in WEEKDAYS}
+    _write_json(os.path.join(API_DIR, "search.json"), search.build_index(days, API_VERSION))
+
+def build_static_assets() -> Dict[str, str]:
+    """
+    Publish the index page's CSS/JS under content-hashed names in docs/static,
+    removing earlier builds, and write the `_headers` cache rules.
+    Returns the URLs relative to docs/ of these, the week feed and the search index, by source name.
+    """
+    static_dir = os.path.join(OUTPUT_DIR, "static")
+    os.makedirs(static_dir, exist_ok=True)
+    urls = {}
+    for name in HASHED_ASSETS:
+        with open(os.path.join(STATIC_SOURCE_DIR, name), "rb") as f:
+            data = f.read()
+        stem, ext = os.path.splitext(name)
+        hashed_name = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+        manifest.write_if_changed(os.path.join(static_dir, hashed_name), data)
+        for existing in os.listdir(static_dir):
+            if existing != hashed_name and existing.startswith(f"{stem}.") and existing.endswith(ext):
+                os.remove(os.path.join(static_dir, existing))
+        urls[name] = f"static/{hashed_name}"
+    # Not hashed: the feed changes daily under a fixed, documented URL, and the
+    # service worker and manifest must keep theirs for browsers to find updates
+    urls["week.json"] = "api/week.json"
+    urls["search.json"] = "api/search.json"
+    urls[SERVICE_WORKER] = SERVICE_WORKER
+    urls[WEB_MANIFEST] = WEB_MANIFEST
+
+    manifest.write_if_changed(os.path.join(OUTPUT_DIR, "_headers"), CACHE_HEADERS.encode("utf-8"))
+    return urls
+
+def build_service_worker(today: str, assets: Dict[str, str]) -> None:
+    """
+    Write docs/sw.js, precaching the index, the week feed and the hashed assets
+    under a cache version derived from today's menu data and the asset names,
+    and the web app manifest it installs with.
     """
+    precache = ["./", "index.html", WEB_MANIFEST] + [
+        url for name, url in sorted(assets.items()) if name not in (SERVICE_WORKER, WEB_MANIFEST)
+    ]
+    digest = hashlib.sha256(store.get_store().day_key(today).encode("ascii"))
+    digest.update("\n".join(precache).encode("utf-8"))
+    worker = get_environment().get_template(SERVICE_WORKER).render(
+        cache_version=digest.hexdigest()[:16],
+        precache=precache,
+    )
+    if manifest.write_if_changed(os.path.join(OUTPUT_DIR, SERVICE_WORKER), worker.encode("utf-8")):
+        print(f"[INFO] Generated {OUTPUT_DIR}/{SERVICE_WORKER}")
+
+    _write_json(os.path.join(OUTPUT_DIR, WEB_MANIFEST), {
+        "name": "Lindholmen Lunch",
+        "short_name": "Lunch",
+        "description": "Today's lunch from restaurants in Lindholmen – updated daily.",
+        "start_url": "./",
+        "scope": "./",
+        "display": "standalone",
+        "background_color": "#f5f7fa",
+        "theme_color": THEME_COLOR,
+        "icons": [{"src": assets["icon.svg"], "sizes": "any", "type": "image/svg+xml"}],
+    })
+
+def render_index_page(lunch_data: dict, restaurant_links: dict, today: str, last_updated: str,
+                      assets: Dict[str, str]) -> str:
+    """Render templates/index_template.html for one day's (annotated) lunch data, linking `assets`."""
+    return get_environment().get_template("index_template.html").render(
+        lunch_data=lunch_data,
+        restaurant_links=restaurant_links,
+        today=today,
+        weekdays=WEEKDAYS,
+        theme_color=THEME_COLOR,
+        last_updated=last_updated,
+        assets=assets,
+    )
 
-    if lunch_data:
-        html += '<div class="restaurant-grid">'
-        
-        for restaurant_name, restaurant_data in lunch_data.items():
-            clean_name = restaurant_name.replace('Scraper', '').replace('_', ' ')
-            
-            html += f"""
-            <div class="restaurant-card" id="restaurant-{restaurant_name}">
-                <div class="restaurant-header">
-                    <div class="restaurant-info">
-                        <h2 class="restaurant-name">{clean_name}</h2>
-                        <div class="restaurant-meta">
-                            <div class="restaurant-meta-item">
-                                <span class="icon-map"></span>
-                                <span class="en">Lindholmen</span>
-                                <span class="sv hidden">Lindholmen</span>
-                            </div>
-                            <div class="restaurant-meta-item">
-                                <span class="icon-clock"></span>
-                                <span class="en">11:00 - 14:00</span>
-                                <span class="sv hidden">11:00 - 14:00</span>
-                            </div>
-                        </div>
-                        <div class="cuisine-badge">
-                            <span class="en">Restaurant</span>
-                            <span class="sv hidden">Restaurang</span>
-                        </div>
-                    </div>
-                    <div class="restaurant-links">"""
-            
-            if restaurant_links.get(restaurant_name.replace('Scraper', '')):
-                links = restaurant_links[restaurant_name.replace('Scraper', '')]
-                if links.get('url'):
-                    html += f'<a href="{links["url"]}" target="_blank" title="Website">🔗</a>'
-                if links.get('map'):
-                    html += f'<a href="{links["map"]}" target="_blank" title="Google Maps">🗺️</a>'
-            
-            html += """</div>
-                </div>
-                
-                <div class="restaurant-content">"""
-            
-            if restaurant_data.get("items"):
-                html += """
-                    <div class="menu-section">
-                        <h3>
-                            <span class="icon-menu"></span>
-                            <span class="en">Today's lunch</span>
-                            <span class="sv hidden">Dagens lunch</span>
-                        </h3>
-                        <div class="menu-items">"""
-                
-                for item in restaurant_data["items"]:
-                    html += f"""
-                            <div class="menu-item">
-                                <div class="menu-item-details">"""
-                    
-                    # Handle long menu names (LsKitchen fix)
-                    name = item.get("name", "")
-                    description = item.get("description", "")
-                    
-                    if len(name) > 50 and not description:
-                        html += f"""
-                                    <div class="menu-item-name">
-                                        <span class="en">Today's Special</span>
-                                        <span class="sv hidden">Dagens Special</span>
-                                    </div>
-                                    <div class="menu-item-description">{name}</div>"""
-                    else:
-                        html += f'<div class="menu-item-name">{name}</div>'
-                        if description:
-                            html += f'<div class="menu-item-description">{description}</div>'
-                    
-                    if item.get("category"):
-                        html += f'<div class="emoji-tags"><span class="emoji-tag">{item["category"]}</span></div>'
-                    
-                    html += '</div>'
-                    
-                    if item.get("price"):
-                        html += f'<div class="menu-item-price">{item["price"]}</div>'
-                    
-                    html += '</div>'
-                
-                html += """
-                        </div>
-                    </div>
-                    
-                    <div class="separator"></div>"""
-            else:
-                html += """<div class="menu-section">
-                    <p style="color: var(--muted-foreground); font-style: italic;">
-                        <span class="en">No menu available today</span>
-                        <span class="sv hidden">Ingen meny tillgänglig idag</span>
-                    </p>
-                </div>"""
-            
-            html += f"""
-                    <div class="special-offer">
-                        ✨ <span class="en">Last updated: {last_updated}</span>
-                        <span class="sv hidden">Senast uppdaterad: {last_updated}</span>
-                    </div>
-                </div>
-            </div>"""
-        
-        html += '</div>'
-    else:
-        html += f"""
-        <div class="no-data">
-            <h2>
-                <span class="en">No menu data available for today</span>
-                <span class="sv hidden">Ingen menydata tillgänglig för idag</span>
-            </h2>
-            <p>
-                <span class="en">We couldn't find any lunch menus for today. Please try again later.</span>
-                <span class="sv hidden">Vi kunde inte hitta några lunchmenyer för idag. Försök igen senare.</span>
-            </p>
-        </div>"""
-
-    html += f"""
-    </main>
-    
-    <!-- Floating Random Button -->
-    <button class="floating-random-button" onclick="selectRandomRestaurant()">
-        <span class="en">I am feeling hungry!</span>
-        <span class="sv hidden">Jag är hungrig!</span>
-    </button>
-    
-    <!-- Footer -->
-    <footer class="footer">
-        <p>
-            <span class="icon-map"></span> 
-            <span class="en">Lindholmen, Gothenburg</span>
-            <span class="sv hidden">Lindholmen, Göteborg</span>
-        </p>
-        <p>
-            <span class="en">Discover the best lunch options in the Lindholmen area</span>
-            <span class="sv hidden">Upptäck de bästa lunchalternativen i Lindholmen området</span>
-        </p>
-        <p>
-            <span class="en">Enhanced version with modern UI/UX improvements –</span>
-            <span class="sv hidden">Förbättrad version med modern UI/UX –</span>
-            <a href="https://github.com/designestjay/lindholmen-lunch" target="_blank">GitHub - Lindholmen Lunch</a>
-        </p>
-        <p>
-            <span class="en">Based on original work by</span>
-            <span class="sv hidden">Baserat på ursprungligt arbete av</span>
-            <a href="https://github.com/Fawenah/lindholmen_lunch" target="_blank">Fawenah</a>
-            <span class="en">with design overhaul and UX enhancements</span>
-            <span class="sv hidden">med designomarbetning och UX-förbättringar</span>
-        </p>
-        <p>
-            <span class="en">Questions, feedback or suggestions? Feel free to open an issue or contact via GitHub</span>
-            <span class="sv hidden">Frågor, feedback eller förslag? Öppna gärna ett issue eller kontakta via GitHub</span>
-        </p>
-        <p style="margin-top: 1rem; font-size: 0.8rem;">
-            <a href="privacy.html">
-                <span class="en">Privacy Policy</span>
-                <span class="sv hidden">Integritetspolicy</span>
-            </a>
-        </p>
-    </footer>
-
-    <script>
-        // Language switching
-        function toggleLanguage() {{
-            const enElements = document.querySelectorAll('.en');
-            const svElements = document.querySelectorAll('.sv');
-            
-            enElements.forEach(el => el.classList.toggle('hidden'));
-            svElements.forEach(el => el.classList.toggle('hidden'));
-            
-            // Update page language attribute
-            const isSwedish = document.querySelector('.sv:not(.hidden)') !== null;
-            document.documentElement.lang = isSwedish ? 'sv' : 'en';
-            
-            // Save language preference
-            localStorage.setItem('language', isSwedish ? 'sv' : 'en');
-        }}
-
-
-
-        // Random restaurant selection
-        function selectRandomRestaurant() {{
-            const restaurants = {restaurant_names};
-            if (restaurants.length === 0) return;
-            
-            // Clear previous highlights
-            document.querySelectorAll('.restaurant-card.highlighted').forEach(card => {{
-                card.classList.remove('highlighted');
-            }});
-            
-            // Update floating button
-            const floatingButton = document.querySelector('.floating-random-button');
-            
-            const isSwedish = document.querySelector('.sv:not(.hidden)') !== null;
-            const choosingText = isSwedish ? 
-                '<span class="sv">Väljer...</span><span class="en hidden">Choosing...</span>' : 
-                '<span class="en">Choosing...</span><span class="sv hidden">Väljer...</span>';
-            
-            if (floatingButton) {{
-                // Store original dimensions to prevent size changes
-                const originalWidth = floatingButton.offsetWidth;
-                const originalHeight = floatingButton.offsetHeight;
-                floatingButton.style.width = originalWidth + 'px';
-                floatingButton.style.height = originalHeight + 'px';
-                floatingButton.innerHTML = choosingText;
-            }}
-            
-            setTimeout(() => {{
-                const randomRestaurant = restaurants[Math.floor(Math.random() * restaurants.length)];
-                const restaurantCard = document.getElementById('restaurant-' + randomRestaurant);
-                
-                if (restaurantCard) {{
-                    restaurantCard.classList.add('highlighted');
-                    restaurantCard.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                }}
-                
-                // Reset button
-                const finalText = isSwedish ? 
-                    '<span class="sv">Jag är hungrig!</span><span class="en hidden">I am feeling hungry!</span>' : 
-                    '<span class="en">I am feeling hungry!</span><span class="sv hidden">Jag är hungrig!</span>';
-                
-                if (floatingButton) {{
-                    floatingButton.innerHTML = finalText;
-                    // Remove fixed dimensions to allow natural sizing again
-                    floatingButton.style.width = '';
-                    floatingButton.style.height = '';
-                }}
-            }}, 1000);
-        }}
-
-        // Go to top and reset random selection
-        function goToTop() {{
-            // Clear any highlighted restaurants
-            document.querySelectorAll('.restaurant-card.highlighted').forEach(card => {{
-                card.classList.remove('highlighted');
-            }});
-            
-            // Scroll to top
-            window.scrollTo({{ top: 0, behavior: 'smooth' }});
-        }}
-
-        // Load saved language preference
-        document.addEventListener('DOMContentLoaded', function() {{
-            const savedLanguage = localStorage.getItem('language');
-            if (savedLanguage === 'sv') {{
-                // Switch to Swedish if saved
-                const enElements = document.querySelectorAll('.en');
-                const svElements = document.querySelectorAll('.sv');
-                
-                enElements.forEach(el => el.classList.add('hidden'));
-                svElements.forEach(el => el.classList.remove('hidden'));
-                
-                document.documentElement.lang = 'sv';
-            }}
-        }});
-    </script>
-</body>
-</html>
+def _write_page(paths: list, html: str) -> None:
+    data = html.encode("utf-8")
+    note = ""
+    if PRODUCTION:
+        size = len(data)
+        data = minify_html(html).encode("utf-8")
+        note = f" (minified {size} -> {len(data)} bytes, -{100 * (size - len(data)) / size:.0f}%)"
+    for path in paths:
+        if manifest.write_if_changed(path, data):
+            print(f"[INFO] Generated {path}{note}")
+        else:
+            print(f"[INFO] {path} unchanged, not rewritten")
+
+def _remove_day_outputs(day: str) -> None:
+    """Delete the page and feed of a day without data, so no earlier run's menus stay published."""
+    for path in (f"{OUTPUT_DIR}/lunch_{day}.html", os.path.join(API_DIR, f"{day}.json")):
+        if os.path.exists(path):
+            os.remove(path)
+            print(f"[INFO] Removed {path} (no data for {day})")
+
+def _write_index_pages(today: str, lunch_data: Optional[dict], restaurant_links: dict,
+                       assets: Dict[str, str]) -> None:
+    last_updated = last_updated_for(today)
+    html = render_index_page(lunch_data or {}, restaurant_links, today, last_updated, assets)
+    _write_page([f"{OUTPUT_DIR}/index.html"], html)
+    # Also written to the root directory for GitHub Pages, so asset URLs point into docs/
+    root_assets = {name: f"{OUTPUT_DIR}/{url}" for name, url in assets.items()}
+    html = render_index_page(lunch_data or {}, restaurant_links, today, last_updated, root_assets)
+    _write_page(["index.html"], html)
+
+@metrics.stage("generate_pages", profile=False)
+def generate_all_pages(workers: int = RENDER_WORKERS) -> None:
     """
+    Render docs/lunch_<day>.html for every weekday with data, plus the index,
+    in one batch: links, food tags and templates are loaded once, pages render
+    in parallel, and files whose bytes did not change are left untouched.
+    The week's data is also published as JSON in docs/api/, with its search index;
+    the page and feed of a day without data are removed.
+    Finally every text file in docs/ gets .gz and .br siblings for static servers.
+    """
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    assets = build_static_assets()
+    restaurant_links = load_restaurant_links()
+    env = get_environment()
+    for name in ("summary_template.html", "index_template.html"):
+        env.get_template(name)
 
-    # Write to docs directory
-    index_path = output_dir / "index.html"
-    index_path.write_text(html, encoding="utf-8")
-    print(f"[INFO] Generated weekly index page: {index_path}")
-    
-    # Also write to root directory for GitHub Pages
-    root_index_path = Path("index.html")
-    root_index_path.write_text(html, encoding="utf-8")
-    print(f"[INFO] Generated root index page: {root_index_path}")
+    today = get_today_english().lower()
+    lunch_data: Dict[str, Optional[dict]] = {day: load_lunch_data(day) for day in WEEKDAYS}
+    if today not in lunch_data:
+        lunch_data[today] = load_lunch_data(today)
+    # After loading: that exports the day files the cache version is derived from
+    build_service_worker(today, assets)
+
+    def summary_job(day: str):
+        with metrics.stage(f"render.lunch_{day}"):
+            html = render_lunch_summary(day, lunch_data[day], restaurant_links, last_updated_for(day))
+        _write_page([f"{OUTPUT_DIR}/lunch_{day}.html"], html)
+
+    def index_job():
+        with metrics.stage("render.index"):
+            _write_index_pages(today, lunch_data[today], restaurant_links, assets)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="render") as executor:
+        futures = [executor.submit(build_api, lunch_data, restaurant_links), executor.submit(build_search, lunch_data)]
+        futures += [executor.submit(summary_job, day) for day in WEEKDAYS if lunch_data[day] is not None]
+        futures.append(executor.submit(index_job))
+        for future in futures:
+            future.result()
+    for day in WEEKDAYS:
+        if lunch_data[day] is None:
+            _remove_day_outputs(day)
+
+    precompress.print_size_report(precompress.compress_tree(OUTPUT_DIR))
 
 if __name__ == "__main__":
-    generate_index_page()
+    parser = argparse.ArgumentParser(description="Render the lunch pages from data/ into docs/.")
+    parser.add_argument("--production", action="store_true", help="Minify the pages (same as LUNCH_PRODUCTION=1)")
+    args = parser.parse_args()
+    PRODUCTION = PRODUCTION or args.production
+    generate_all_pages()
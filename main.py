@@ -1,11 +1,12 @@
 # file: lindholmen_lunch/main.py
 
 import argparse
-import json
 import logging
 import os
+import sys
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from scrapers.kooperativet import KooperativetScraper
 from scrapers.district_one import DistrictOneScraper
@@ -22,8 +23,10 @@ from scrapers.mat_minnen import MatMinnenScraper
 from scrapers.encounter_asian import EncounterAsianScraper
 from scrapers.masala import MasalaScraper
 from scrapers.restaurant_pier_11 import RestaurantPier11Scraper
+from scrapers.base import week_key
+from utils import archive, metrics, store
 from utils.utils import get_today_english
-from generate_html import generate_index_page
+from generate_html import generate_all_pages
 
 logging.basicConfig(level=logging.INFO)
 
@@ -50,104 +53,215 @@ SCRAPERS = [
 
 WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday"]
 
-def scrape_for_day(day: str, refresh: bool = False, cache: dict = None):
-    logging.info(f"Scraping lunch menus for {day.capitalize()}")
+DEFAULT_WORKERS = 8
 
-    filepath = f"data/lunch_data_{day}.json"
-    if os.path.exists(filepath) and not refresh:
-        logging.info(f"Skipping scraping for {day} (cached file exists).")
-        return
+RUN_METRICS_PATH = "data/run_metrics.json"
+PROFILE_PATH = "data/run_profile.prof"
+
+def scrape_restaurant(scraper_cls, days: list, snapshot_week: str = None):
+    """
+    Run a single scraper once, with retries, and collect its menus for `days`.
+    With `snapshot_week`, the stored raw page for that ISO week is parsed instead of fetching.
+    Returns ({day: serialized menu}, 1 if the scraper fetched its page, however many attempts it took, else 0).
+    """
+    attempts = 0
+    max_retries = 2
+    fetches = 0
+
+    while attempts <= max_retries:
+        try:
+            if snapshot_week:
+                scraper = scraper_cls.from_snapshot(snapshot_week)
+                if scraper is None:
+                    logging.warning(f"No snapshot of {scraper_cls.__name__} for {snapshot_week}")
+                    return {}, fetches
+            else:
+                fetches = 1
+                scraper = scraper_cls()
+
+            # Reuse get_all_menus if possible, otherwise fall back to the per-day method
+            all_menus = scraper.get_all_menus()
+            menus = {}
+            for day in days:
+                menu = all_menus.get(day) if all_menus else scraper.get_menu_for_day(day)
+                if not menu:
+                    logging.warning(f"No menu found for {scraper_cls.__name__} on {day}")
+                    continue
+                menus[day] = menu.to_dict()
+                metrics.increment(f"items.{scraper_cls.__name__}", len(menu.items))
+            return menus, fetches
+        except Exception as e:
+            attempts += 1
+            metrics.increment(f"retries.{scraper_cls.__name__}")
+            logging.error(f"[{scraper_cls.__name__}] Error on attempt {attempts}: {e}")
+            traceback.print_exc()
+            if attempts > max_retries:
+                logging.warning(f"[{scraper_cls.__name__}] Gave up after {max_retries} retries.")
+            else:
+                delay = 2 + attempts
+                logging.info(f"[{scraper_cls.__name__}] Retrying in {delay} seconds...")
+                time.sleep(delay)
+    return {}, fetches
+
+def _timed_scrape(scraper_cls, days: list, snapshot_week: str = None, run_id: int = None):
+    start = time.perf_counter()
+    menus, fetches = scrape_restaurant(scraper_cls, days, snapshot_week)
+    # Each worker commits its own results (a no-op for the JSON store, which is written once per run)
+    if run_id is not None and menus:
+        store.get_store().save_menus(run_id, scraper_cls.__name__, menus)
+    return menus, fetches, time.perf_counter() - start
+
+def log_timings(label: str, timings: dict, wall_clock: float):
+    """Log a per-scraper timing breakdown, slowest first."""
+    logging.info(f"Scraper timings for {label} (slowest first):")
+    for name, elapsed in sorted(timings.items(), key=lambda kv: kv[1], reverse=True):
+        logging.info(f"  {name:<28} {elapsed:7.2f}s")
+    logging.info(f"  {'total (sum)':<28} {sum(timings.values()):7.2f}s")
+    logging.info(f"  {'wall clock':<28} {wall_clock:7.2f}s")
 
-    results = {}
+def run_scrapers(days: list, workers: int = DEFAULT_WORKERS, snapshot_week: str = None, run_id: int = None):
+    """
+    Run every scraper in SCRAPERS once for `days`, in parallel when workers > 1.
+    With `run_id` (from store.start_run), each scraper's menus are saved as soon as it finishes.
+    Returns ({day: {scraper name: menu}} in SCRAPERS order, number of scrapers that fetched their page).
+    """
+    scraped = {}
+    fetch_counts = {}
+    timings = {}
+    run_start = time.perf_counter()
 
+    if workers <= 1:
+        for scraper_cls in SCRAPERS:
+            name = scraper_cls.__name__
+            scraped[name], fetch_counts[name], timings[name] = _timed_scrape(scraper_cls, days, snapshot_week, run_id)
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper") as executor:
+            futures = {
+                executor.submit(_timed_scrape, scraper_cls, days, snapshot_week, run_id): scraper_cls.__name__
+                for scraper_cls in SCRAPERS
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                scraped[name], fetch_counts[name], timings[name] = future.result()
+
+    label = days[0].capitalize() if len(days) == 1 else "the week"
+    log_timings(label, timings, time.perf_counter() - run_start)
+
+    # Keep the SCRAPERS order regardless of completion order
+    results = {day: {} for day in days}
     for scraper_cls in SCRAPERS:
-        attempts = 0
-        max_retries = 2
-
-        while attempts <= max_retries:
-            try:
-                # Try to use cached instance if available
-                if cache is not None and scraper_cls.__name__ in cache:
-                    scraper = cache[scraper_cls.__name__]
-                else:
-                    scraper = scraper_cls()
-                    # Cache weekly scraper if it has get_all_menus()
-                    if cache is not None and hasattr(scraper, "get_all_menus"):
-                        all_menus = scraper.get_all_menus()
-                        if all_menus:
-                            cache[scraper_cls.__name__] = scraper
-
-                # Reuse get_all_menus if possible
-                all_menus = scraper.get_all_menus()
-                if all_menus:
-                    menu = all_menus.get(day.lower())
-                    if not menu:
-                        logging.warning(f"No menu found in get_all_menus() for {scraper_cls.__name__} on {day}")
-                        break
-                    results[scraper_cls.__name__] = {
-                        "day": menu.day,
-                        "items": [
-                            {"name": item.name,
-                             "category": item.category or "",
-                             "description": item.description or "",
-                             "price": item.price or ""}
-                            for item in menu.items
-                        ]
-                    }
-                    break
-                else:
-                    # Fallback to per-day method
-                    menu = scraper.get_menu_for_day(day)
-                    if not menu:
-                        logging.warning(f"No menu found for {scraper_cls.__name__} on {day}")
-                        break
-                    results[scraper_cls.__name__] = {
-                        "day": menu.day,
-                        "items": [
-                            {"name": item.name,
-                             "category": item.category or "",
-                             "description": item.description or "",
-                             "price": item.price or ""}
-                            for item in menu.items
-                        ]
-                    }
-                    break
-            except Exception as e:
-                attempts += 1
-                logging.error(f"[{scraper_cls.__name__}] Error on attempt {attempts} for {day}: {e}")
-                traceback.print_exc()
-                if attempts > max_retries:
-                    logging.warning(f"[{scraper_cls.__name__}] Gave up after {max_retries} retries.")
-                else:
-                    delay = 2 + attempts
-                    logging.info(f"[{scraper_cls.__name__}] Retrying in {delay} seconds...")
-                    time.sleep(delay)
-
-    if results:
-        os.makedirs("data", exist_ok=True)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        for day, menu in scraped.get(scraper_cls.__name__, {}).items():
+            results[day][scraper_cls.__name__] = menu
+    return results, sum(fetch_counts.values())
+
+def scrape_days(days: list, workers: int, week: str, snapshot_week: str = None) -> int:
+    """
+    Scrape `days` as one store run: each scraper's menus are saved as it
+    finishes, then the run is closed and the days are added to the history
+    archive under `week`. Returns the number of scrapers that fetched their page.
+    """
+    menu_store = store.get_store()
+    run_id = menu_store.start_run(week, days)
+    results_by_day, fetches = run_scrapers(days, workers, snapshot_week, run_id)
+
+    for day, results in results_by_day.items():
+        if not results:
+            logging.warning(f"No results to write for {day}. Skipping JSON and HTML.")
+    for filepath in menu_store.finish_run(run_id, results_by_day):
         logging.info(f"Wrote lunch data to {filepath}")
-    else:
-        logging.warning(f"No results to write for {day}. Skipping JSON and HTML.")
+    changed = archive.ingest_days({day: results for day, results in results_by_day.items() if results}, week)
+    logging.info(f"Archived {changed} new or changed menus in {archive.ARCHIVE_PATH}")
+    return fetches
+
+def scrape_for_day(day: str, refresh: bool = False, workers: int = DEFAULT_WORKERS):
+    logging.info(f"Scraping lunch menus for {day.capitalize()}")
+
+    menu_store = store.get_store()
+    if menu_store.has_day(day) and not refresh:
+        logging.info(f"Skipping scraping for {day} (already in {menu_store.path}).")
         return
 
+    with metrics.stage(f"scrape.{day}", profile=False):
+        scrape_days([day], workers, week_key())
+
+def scrape_week(refresh: bool = False, workers: int = DEFAULT_WORKERS):
+    """Scrape every weekday in a single pass: each scraper is instantiated (and fetched) once."""
+    menu_store = store.get_store()
+    days = [day for day in WEEKDAYS if refresh or not menu_store.has_day(day)]
+    if not days:
+        logging.info("Skipping scraping for the week (every day is already stored).")
+        return
+
+    logging.info(f"Scraping lunch menus for {', '.join(day.capitalize() for day in days)} in one pass")
+    requests_before = metrics.get_counters().get("http_requests", 0)
+    with metrics.stage("scrape.week", profile=False):
+        fetched = scrape_days(days, workers, week_key())
+    http_requests = metrics.get_counters().get("http_requests", 0) - requests_before
+
+    # The per-day path fetches every scraper once per day
+    avoided = fetched * (len(days) - 1)
+    metrics.increment("fetches_avoided", avoided)
+    logging.info(f"Weekly pass fetched {fetched} scrapers once each: {avoided} fetches avoided "
+                 f"({http_requests} HTTP requests made, Chrome page loads not counted)")
+
+def reparse_week(week: str = None, workers: int = DEFAULT_WORKERS) -> bool:
+    """
+    Re-run every parser on the stored snapshots of `week` (default: this week), offline.
+    Any other week only goes to the history archive: the store and the pages keep
+    serving this week. Returns True when the store was updated.
+    """
+    week = week or week_key()
+    logging.info(f"Re-parsing lunch menus for {week} from snapshots")
+    if week == week_key():
+        with metrics.stage("reparse.week", profile=False):
+            scrape_days(WEEKDAYS, workers, week, snapshot_week=week)
+        return True
+
+    with metrics.stage("reparse.archive", profile=False):
+        results_by_day, _ = run_scrapers(WEEKDAYS, workers, week)
+    changed = archive.ingest_days({day: results for day, results in results_by_day.items() if results}, week)
+    logging.info(f"Archived {changed} new or changed menus for {week} in {archive.ARCHIVE_PATH} "
+                 f"(past week: store and pages left untouched)")
+    return False
+
 def main():
     parser = argparse.ArgumentParser(description="Run Lindholmen lunch scrapers.")
     parser.add_argument("--day", type=str, help="Weekday to scrape (e.g., monday)", choices=WEEKDAYS)
-    parser.add_argument("--all", action="store_true", help="Scrape all weekdays (mon–fri)")
+    parser.add_argument("--all", action="store_true", help="Scrape all weekdays (mon–fri) in a single pass")
     parser.add_argument("--refresh", action="store_true", help="Force re-scraping even if data exists")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Number of scrapers to run in parallel (default: {DEFAULT_WORKERS}, 1 = serial)")
+    parser.add_argument("--from-snapshots", nargs="?", const="", metavar="WEEK",
+                        help="Re-parse the whole week from stored raw pages instead of fetching "
+                             "(optionally for an ISO week like 2025-W23; other weeks than this one "
+                             "only update the history archive)")
+    parser.add_argument("--profile", action="store_true",
+                        help=f"Run scrapers serially under cProfile and dump the slowest stage to {PROFILE_PATH}")
 
     args = parser.parse_args()
 
-    if args.all:
-        weekly_scraper_cache = {}
-        for day in WEEKDAYS:
-            scrape_for_day(day, refresh=args.refresh, cache=weekly_scraper_cache)
+    if args.profile:
+        # cProfile only sees the thread it runs in, so profile a serial run
+        metrics.enable_profiling()
+        args.workers = 1
+
+    publish = True
+    if args.from_snapshots is not None:
+        publish = reparse_week(args.from_snapshots or None, workers=args.workers)
+    elif args.all:
+        scrape_week(refresh=args.refresh, workers=args.workers)
     else:
         day = args.day or get_today_english()
-        scrape_for_day(day, refresh=args.refresh)
+        scrape_for_day(day, refresh=args.refresh, workers=args.workers)
+
+    if publish:
+        generate_all_pages()
+
+    report = metrics.write_report(RUN_METRICS_PATH, argv=sys.argv[1:])
+    logging.info(f"Wrote run metrics to {RUN_METRICS_PATH} "
+                 f"({report['wall_seconds']:.1f}s, peak RSS {report['peak_rss_mb']} MiB)")
+    if args.profile:
+        metrics.dump_slowest_profile(PROFILE_PATH)
 
 if __name__ == "__main__":
     main()
-    generate_index_page()
@@ -1,6 +1,136 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional
+import atexit
+import hashlib
+import json
 import os
+import sys
+import threading
+import time
+from datetime import date
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+from utils import manifest, metrics
+
+# One User-Agent for every outgoing request, HTTP and Selenium alike
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/122.0.0.0 Safari/537.36"
+)
+
+HTTP_TIMEOUT = (5, 20)  # (connect, read) seconds
+HTTP_POOL_HOSTS = 20  # Number of per-host pools kept alive
+HTTP_POOL_PER_HOST = 4  # Max concurrent connections to a single host
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session shared by all scrapers.
+
+    The session keeps connections alive between requests, caps the number of
+    connections per host, and advertises every content encoding urllib3 can
+    decode (gzip/deflate always, brotli when the `brotli` package is installed).
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_HOSTS,
+                pool_maxsize=HTTP_POOL_PER_HOST,
+                pool_block=True,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(make_headers(accept_encoding=True))
+            session.headers["User-Agent"] = USER_AGENT
+            _session = session
+        return _session
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET `url` through the shared session, with default connect/read timeouts."""
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    # Counted before sending, so requests that time out or fail are counted too
+    metrics.increment("http_requests")
+    response = get_http_session().get(url, **kwargs)
+    # Time until the response headers arrived: DNS, connect, TLS and server time
+    metrics.record("http_wait_seconds", response.elapsed.total_seconds())
+    if not kwargs.get("stream"):
+        metrics.increment("bytes_downloaded", len(response.content))
+    return response
+
+HTTP_CACHE_DIR = os.path.join("data", "http_cache")
+
+class CachedResponse:
+    """Body returned by `cached_get`, fresh or (after a 304) from the cache."""
+    def __init__(self, url: str, content: bytes, encoding: Optional[str]):
+        self.url = url
+        self.content = content
+        self.encoding = encoding
+
+def _cache_paths(url: str):
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+    base = os.path.join(HTTP_CACHE_DIR, key)
+    return base + ".json", base + ".body"
+
+def _read_json(path: str) -> Optional[dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def cached_get(url: str) -> CachedResponse:
+    """
+    GET `url`, revalidating against the on-disk cache in `HTTP_CACHE_DIR`.
+
+    Stored ETag / Last-Modified validators are sent as If-None-Match /
+    If-Modified-Since; on a 304 the cached body is returned instead.
+    """
+    meta_path, body_path = _cache_paths(url)
+    meta = _read_json(meta_path) or {}
+    cached_body = None
+    if os.path.exists(body_path):
+        with open(body_path, "rb") as f:
+            cached_body = f.read()
+
+    headers = {}
+    if cached_body is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = http_get(url, headers=headers)
+    if response.status_code == 304 and cached_body is not None:
+        return CachedResponse(url, cached_body, meta.get("encoding"))
+
+    response.raise_for_status()
+    content = response.content
+    digest = hashlib.sha256(content).hexdigest()
+    encoding = response.encoding or response.apparent_encoding
+
+    new_meta = {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "encoding": encoding,
+        "sha256": digest,
+    }
+    if digest != meta.get("sha256") or cached_body is None:
+        manifest.write_bytes_atomic(body_path, content)
+    if new_meta != meta:
+        manifest.write_bytes_atomic(meta_path, json.dumps(new_meta, indent=2).encode("utf-8"))
+
+    return CachedResponse(url, content, encoding)
 
 def get_chrome_options(enable_javascript=True, load_images=False):
     """
@@ -48,7 +178,7 @@ def get_chrome_options(enable_javascript=True, load_images=False):
         chrome_options.add_argument("--start-maximized")
         
         # User agent to appear more like a real browser
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Linux; Ubuntu) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36")
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
         
         # Memory and performance options
         chrome_options.add_argument("--memory-pressure-off")
@@ -64,7 +194,196 @@ def get_chrome_options(enable_javascript=True, load_images=False):
         # Return None if selenium is not available
         return None
 
+BROWSER_POOL_SIZE = 2  # Max headless Chrome instances alive at once
+
+class BrowserPool:
+    """
+    Shared pool of headless Chrome drivers for JS-rendered scrapers.
+
+    Browsers are started lazily on the first lease, handed back to the pool
+    afterwards and reused by later scrapers (and later days in --all mode).
+    All browsers are shut down when the process exits.
+    """
+    def __init__(self, size: int = BROWSER_POOL_SIZE):
+        self._idle = []
+        self._started = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        atexit.register(self.shutdown)
+
+    @property
+    def available(self) -> bool:
+        """Whether selenium is installed, i.e. whether a browser can be leased at all."""
+        return get_chrome_options() is not None
+
+    def _start_browser(self):
+        from selenium import webdriver
+        driver = webdriver.Chrome(options=get_chrome_options(enable_javascript=True, load_images=False))
+        with self._lock:
+            self._started.append(driver)
+        return driver
+
+    def _discard(self, driver) -> None:
+        with self._lock:
+            if driver in self._started:
+                self._started.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_healthy(driver) -> bool:
+        try:
+            driver.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    @contextmanager
+    def lease(self, page_load_timeout: int = 30):
+        """Borrow a driver for the duration of a `with` block."""
+        self._slots.acquire()
+        driver = None
+        try:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                driver = self._start_browser()
+            driver.set_page_load_timeout(page_load_timeout)
+            yield driver
+        finally:
+            if driver is not None:
+                if self._is_healthy(driver):
+                    with self._lock:
+                        self._idle.append(driver)
+                else:
+                    self._discard(driver)
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        """Quit every browser the pool has started."""
+        with self._lock:
+            drivers, self._started, self._idle = self._started, [], []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+browser_pool = BrowserPool()
+
+def wait_for_selector(driver, css_selector: str, text: Optional[str] = None,
+                      timeout: float = 10.0, poll_interval: float = 0.1) -> float:
+    """
+    Block until `css_selector` is present in the page (and contains `text`, if given).
+
+    Returns the number of seconds spent waiting. Raises selenium's
+    TimeoutException if the deadline passes first.
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    locator = (By.CSS_SELECTOR, css_selector)
+    if text is None:
+        condition = EC.presence_of_element_located(locator)
+    else:
+        condition = EC.text_to_be_present_in_element(locator, text)
+
+    start = time.perf_counter()
+    WebDriverWait(driver, timeout, poll_frequency=poll_interval).until(condition)
+    return time.perf_counter() - start
+
+SNAPSHOT_DIR = os.path.join("data", "snapshots")
+
+def week_key(day: Optional[date] = None) -> str:
+    """ISO week label used to group snapshots, e.g. "2025-W23"."""
+    year, week, _ = (day or date.today()).isocalendar()
+    return f"{year}-W{week:02d}"
+
+class SnapshotStore:
+    """
+    Content-addressed store of the raw pages scrapers download.
+
+    Bodies live under `objects/<sha256[:2]>/<sha256>`, so identical pages are
+    stored once; `index/<iso-week>.json` maps each scraper name to the digest of
+    the latest page fetched that week. `parsed/<scraper>.json` memoizes the menus
+    parsed from a digest for scrapers that opt into reusing them.
+    """
+    def __init__(self, root: str = SNAPSHOT_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], digest)
+
+    def _index_path(self, week: str) -> str:
+        return os.path.join(self.root, "index", f"{week}.json")
+
+    def parsed_path(self, name: str) -> str:
+        return os.path.join(self.root, "parsed", f"{name}.json")
+
+    def put(self, name: str, raw: bytes, week: Optional[str] = None) -> str:
+        """Store `raw` as the latest snapshot for scraper `name`. Returns its digest."""
+        digest = hashlib.sha256(raw).hexdigest()
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            manifest.write_bytes_atomic(object_path, raw)
+
+        index_path = self._index_path(week or week_key())
+        with self._lock:
+            index = _read_json(index_path) or {}
+            if index.get(name) != digest:
+                index[name] = digest
+                manifest.write_bytes_atomic(index_path, json.dumps(index, indent=2, sort_keys=True).encode("utf-8"))
+        return digest
+
+    def get(self, digest: str) -> Optional[bytes]:
+        try:
+            with open(self._object_path(digest), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def latest(self, name: str, week: Optional[str] = None) -> Optional[bytes]:
+        """Raw page last stored for scraper `name` in `week` (default: this week)."""
+        digest = self.week_index(week).get(name)
+        return self.get(digest) if digest else None
+
+    def week_index(self, week: Optional[str] = None) -> Dict[str, str]:
+        return _read_json(self._index_path(week or week_key())) or {}
+
+snapshot_store = SnapshotStore()
+
+# BeautifulSoup tree builder used by every HTML scraper ("lxml", "html.parser", "html5lib")
+HTML_PARSER = os.environ.get("LUNCH_HTML_PARSER", "lxml")
+
+def make_soup(markup, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parse `markup` with the configured HTML_PARSER backend.
+
+    Pass a SoupStrainer as `parse_only` when the scraper only reads one
+    container: everything outside it is skipped instead of built into the tree.
+    """
+    return BeautifulSoup(markup, HTML_PARSER, parse_only=parse_only)
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday")
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Strip `value`, mapping empty to None; short repeated strings are interned so items share them."""
+    if not value:
+        return None
+    value = value.strip()
+    return sys.intern(value) if value else None
+
 class MenuItem:
+    """
+    One dish. Items are immutable, so the same instance can sit in every day of a
+    weekly menu. Categories and prices repeat across a menu and are interned.
+    """
+    __slots__ = ("name", "category", "description", "price")
+
     def __init__(
         self,
         name: str,
@@ -72,10 +391,32 @@ class MenuItem:
         description: Optional[str] = None,
         price: Optional[str] = None
     ):
-        self.name = name.strip()
-        self.category = category.strip() if category else None
-        self.description = description.strip() if description else None
-        self.price = price.strip() if price else None
+        set_field = object.__setattr__
+        set_field(self, "name", name.strip())
+        set_field(self, "category", _intern(category))
+        set_field(self, "description", description.strip() or None if description else None)
+        set_field(self, "price", _intern(price))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"MenuItem is immutable, use replace() to change {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError("MenuItem is immutable")
+
+    def replace(self, **changes) -> "MenuItem":
+        """A copy of this item with some fields changed."""
+        fields = {field: getattr(self, field) for field in self.__slots__}
+        fields.update(changes)
+        return MenuItem(**fields)
+
+    def _key(self):
+        return (self.name, self.category, self.description, self.price)
+
+    def __eq__(self, other):
+        return isinstance(other, MenuItem) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
 
     def __repr__(self):
         return (
@@ -99,19 +440,115 @@ class MenuItem:
         }
 
 class DailyMenu:
-    def __init__(self, day: str, items: List[MenuItem]):
-        self.day = day.lower()  # e.g. "monday", "tuesday"
-        self.items = items
+    """One day's items, held as a tuple: views of the same week share it instead of copying."""
+    __slots__ = ("day", "items")
+
+    def __init__(self, day: str, items: Iterable[MenuItem]):
+        object.__setattr__(self, "day", sys.intern(day.lower()))  # e.g. "monday", "tuesday"
+        # tuple() of a tuple is the same object, so passing a shared tuple does not copy it
+        object.__setattr__(self, "items", tuple(items))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DailyMenu is immutable")
 
     def __repr__(self):
         return f"DailyMenu(day={self.day!r}, items={self.items!r})"
 
+    def to_dict(self) -> dict:
+        """The day as stored in data/lunch_data_<day>.json (missing fields as empty strings)."""
+        return {
+            "day": self.day,
+            "items": [
+                {"name": item.name,
+                 "category": item.category or "",
+                 "description": item.description or "",
+                 "price": item.price or ""}
+                for item in self.items
+            ]
+        }
+
+class WeeklyMenu:
+    """
+    A week stored once: `items` served every day, after each day's own
+    `daily` items. Day menus are views sharing these tuples, not copies.
+    """
+    __slots__ = ("items", "daily")
+
+    def __init__(self, items: Iterable[MenuItem] = (), daily: Optional[Dict[str, Iterable[MenuItem]]] = None):
+        self.items = tuple(items)
+        self.daily = {day.lower(): tuple(day_items) for day, day_items in (daily or {}).items()}
+
+    def for_day(self, day: str) -> DailyMenu:
+        day = day.lower()
+        own = self.daily.get(day)
+        return DailyMenu(day, own + self.items if own and self.items else own or self.items)
+
+    def menus(self, days: Iterable[str] = WEEKDAYS) -> Dict[str, DailyMenu]:
+        """A DailyMenu for each of `days`."""
+        return {day.lower(): self.for_day(day) for day in days}
+
 class LunchScraper(ABC):
+    """
+    A scraper runs in two stages: `fetch_raw` downloads the page (network only)
+    and `parse` turns those bytes into menus (no network). `fetch` chains them and
+    keeps a snapshot of every downloaded page in `snapshot_store`, so parsing can
+    be re-run offline with `Scraper(raw=...)` or `Scraper.from_snapshot()`.
+    """
+    URL: str = ""
+    # Revalidate the page with conditional GETs and reuse the last parse while it is unchanged
+    CONDITIONAL_GET = False
+
+    def __init__(self, raw: Optional[bytes] = None, week: Optional[str] = None):
+        self._menus: Dict[str, DailyMenu] = {}
+        # ISO week the menus are for: the snapshot's week, or this week for a live fetch
+        self.week = week or week_key()
+        if raw is None:
+            self.fetch()
+        else:
+            with metrics.stage(f"parse.{self.__class__.__name__}"):
+                self.parse(raw)
+
+    @classmethod
+    def from_snapshot(cls, week: Optional[str] = None) -> Optional["LunchScraper"]:
+        """Parse the latest stored snapshot for `week` instead of hitting the site."""
+        raw = snapshot_store.latest(cls.__name__, week)
+        return cls(raw=raw, week=week) if raw is not None else None
+
+    @property
+    def week_number(self) -> int:
+        """ISO week number of `self.week` (23 for "2025-W23"), for menus that rotate by week."""
+        return int(self.week.rsplit("W", 1)[1])
+
+    def fetch_raw(self) -> Optional[bytes]:
+        """Download the raw page. Returns None when the source is unavailable."""
+        if self.CONDITIONAL_GET:
+            return cached_get(self.URL).content
+        response = http_get(self.URL)
+        response.raise_for_status()
+        return response.content
+
     @abstractmethod
-    def fetch(self) -> None:
-        """Fetch and parse the menu data. Must be called before accessing menu."""
+    def parse(self, raw: bytes) -> None:
+        """Parse raw page bytes into `self._menus`. Must not touch the network."""
         pass
 
+    def fetch(self) -> None:
+        """Fetch the page, snapshot it and parse it. Must be called before accessing menu."""
+        name = self.__class__.__name__
+        with metrics.stage(f"fetch.{name}"):
+            raw = self.fetch_raw()
+        if raw is None:
+            return
+        metrics.increment(f"page_bytes.{name}", len(raw))
+        digest = snapshot_store.put(name, raw)
+        # Restoring memoized menus counts as this scraper's parse time
+        with metrics.stage(f"parse.{name}"):
+            if self.CONDITIONAL_GET and self.restore_menus(digest):
+                return
+            self.parse(raw)
+        if self.CONDITIONAL_GET:
+            self.remember_menus(digest)
+
     @abstractmethod
     def get_menu_for_day(self, day: str) -> Optional[DailyMenu]:
         """Return the menu for the given day (e.g., 'monday')."""
@@ -122,3 +559,54 @@ class LunchScraper(ABC):
         """Return a dictionary of all parsed menus by day (default: empty)."""
         return {}
 
+    def _parser_fingerprint(self) -> str:
+        """
+        Hash of the scraper's source, this module (the menu records and make_soup)
+        and the parser backend, so parser changes invalidate cached menus.
+        """
+        module_file = getattr(sys.modules.get(type(self).__module__), "__file__", None)
+        if not module_file:
+            return ""
+        digest = hashlib.sha256()
+        for path in (module_file, __file__):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        digest.update(HTML_PARSER.encode("utf-8"))
+        return digest.hexdigest()
+
+    def restore_menus(self, digest: str) -> bool:
+        """
+        Reuse the menus parsed from the page with this digest on a previous run.
+        Returns True (and fills `self._menus`) when parsing can be skipped.
+        """
+        cached = _read_json(snapshot_store.parsed_path(self.__class__.__name__))
+        if (not cached or cached.get("sha256") != digest
+                or cached.get("parser") != self._parser_fingerprint()):
+            return False
+        # Days (and items) that were shared when parsed are shared again
+        shared_items: Dict[tuple, MenuItem] = {}
+        shared_days: Dict[tuple, tuple] = {}
+        self._menus = {}
+        for day, items in cached["menus"].items():
+            day_items = []
+            for item in items:
+                key = tuple(item.values())
+                if key not in shared_items:
+                    shared_items[key] = MenuItem(**item)
+                day_items.append(shared_items[key])
+            day_items = tuple(day_items)
+            self._menus[day] = DailyMenu(day=day, items=shared_days.setdefault(day_items, day_items))
+        return True
+
+    def remember_menus(self, digest: str) -> None:
+        """Store the freshly parsed menus for the page with this digest."""
+        payload = {
+            "sha256": digest,
+            "parser": self._parser_fingerprint(),
+            "menus": {
+                day: [item.to_dict() for item in menu.items]
+                for day, menu in self.get_all_menus().items()
+            },
+        }
+        manifest.write_bytes_atomic(snapshot_store.parsed_path(self.__class__.__name__),
+                                    json.dumps(payload, ensure_ascii=False).encode("utf-8"))
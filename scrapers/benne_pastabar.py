@@ -1,26 +1,14 @@
-from bs4 import BeautifulSoup
-from scrapers.base import LunchScraper, MenuItem, DailyMenu
+from scrapers.base import LunchScraper, MenuItem, DailyMenu, WeeklyMenu, make_soup
 from typing import Dict, Optional
-import requests
 from datetime import date
 import re
 
 class BennePastabarScraper(LunchScraper):
     URL = "https://bennepastabar.se/#menu"
+    CONDITIONAL_GET = True
 
-    def __init__(self):
-        self._menus: Dict[str, DailyMenu] = {}
-        self.fetch()
-
-    def fetch(self) -> None:
-        try:
-            response = requests.get(self.URL)
-            response.raise_for_status()
-        except Exception as e:
-            print(f"Failed to fetch Benne Pastabar page: {e}")
-            return
-
-        soup = BeautifulSoup(response.text, "html.parser")
+    def parse(self, raw: bytes) -> None:
+        soup = make_soup(raw)
 
         categorized_items = {
             "Benne Pasta": [],
@@ -70,8 +58,7 @@ class BennePastabarScraper(LunchScraper):
         for items in categorized_items.values():
             all_items.extend(items)
 
-        for day in ["monday", "tuesday", "wednesday", "thursday", "friday"]:
-            self._menus[day] = DailyMenu(day=day, items=all_items.copy())
+        self._menus = WeeklyMenu(all_items).menus()
 
 
     def get_menu_for_day(self, day: str) -> Optional[DailyMenu]:
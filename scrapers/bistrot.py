@@ -1,13 +1,13 @@
 # scrapers/bistrot.py
 import unicodedata
-from bs4 import BeautifulSoup
-from scrapers.base import LunchScraper, MenuItem, DailyMenu
+from bs4 import SoupStrainer
+from scrapers.base import LunchScraper, MenuItem, DailyMenu, make_soup
 from typing import Dict, List, Optional
-import requests
 
 class BistrotScraper(LunchScraper):
     URL = "https://bistrot.se/"
     _PRICE = "130 kr"
+    _MENU = SoupStrainer("div", class_="fdm-the-menu")
 
     SWEDISH_TO_ENGLISH = {
         "Måndag": "monday",
@@ -17,19 +17,8 @@ class BistrotScraper(LunchScraper):
         "Fredag": "friday",
     }
 
-    def __init__(self):
-        self._menus: Dict[str, DailyMenu] = {}
-        self.fetch()
-
-    def fetch(self) -> None:
-        try:
-            response = requests.get(self.URL)
-            response.raise_for_status()
-        except Exception as e:
-            print(f"Failed to fetch Bistrot page: {e}")
-            return
-
-        soup = BeautifulSoup(response.text, "html.parser")
+    def parse(self, raw: bytes) -> None:
+        soup = make_soup(raw, parse_only=self._MENU)
         menu = soup.select_one("div.fdm-the-menu")
         if not menu:
             print("No menu found on Bistrot page.")
@@ -40,6 +29,7 @@ class BistrotScraper(LunchScraper):
 
         section = menu.select_one("ul.fdm-menu")
         current_category = None
+        swe_to_eng = {normalize_day_name(k): v for k, v in self.SWEDISH_TO_ENGLISH.items()}
 
         for item in section.select("li.fdm-item"):
             title = item.select_one("p.fdm-item-title")
@@ -53,7 +43,6 @@ class BistrotScraper(LunchScraper):
 
             # Determine category context from header (e.g., "Meny vecka 21", "Vegetarisk Måndag–Tis", etc.)
             normalized = normalize_day_name(header)
-            swe_to_eng = {normalize_day_name(k): v for k, v in self.SWEDISH_TO_ENGLISH.items()}
 
             if "vecka" in header.lower():
                 current_category = "Veckans"
@@ -65,7 +54,7 @@ class BistrotScraper(LunchScraper):
                 eng_day = swe_to_eng[normalized]
                 for name, desc in groups:
                     daily_items[eng_day].append(MenuItem(name=name, description=desc, price=self._PRICE, category="Lunch"))
-            elif normalize_day_name(header) == "caesarsallad":
+            elif normalized == "caesarsallad":
                 self._add_to_all_days(shared_items_by_day, groups, category="Caesarsallad")
 
 
@@ -1,35 +1,29 @@
-from bs4 import BeautifulSoup
-from datetime import date
 import re
 import logging
-import requests
 import unicodedata
 
-from scrapers.base import LunchScraper, MenuItem, DailyMenu
+from scrapers.base import LunchScraper, MenuItem, DailyMenu, WeeklyMenu, make_soup
 from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+LUNCH_HEADER = re.compile(r"LUNCH \d+", re.IGNORECASE)
+ALT_HEADER = re.compile("ANDRA ALTERNATIV", re.IGNORECASE)
+ALT_SECTION_END = re.compile(r"\b(LUNCH|MÅNDAG|TISDAG|ONSDAG|TORSDAG|FREDAG|DAGENS VEG)\b", re.IGNORECASE)
+
 class BombayBistroScraper(LunchScraper):
     URL = "https://www.bombaybistro.se/lunch/"
 
-    def __init__(self):
-        self._menus = {}
-        self.fetch()
-
-    def fetch(self):
-        response = requests.get(self.URL)
-        response.raise_for_status()
-        html = response.text
-        soup = BeautifulSoup(html, "html.parser")
+    def parse(self, raw: bytes) -> None:
+        soup = make_soup(raw)
 
-        current_week = date.today().isocalendar().week
+        current_week = self.week_number
         lunch_number = ((current_week) % 4) + 1
         lunch_header_text = f"LUNCH {lunch_number}"
         logger.debug(f"Current week: {current_week}, selecting: {lunch_header_text}")
 
         # Find all H2s to locate correct lunch cycle
-        lunch_headers = soup.find_all("h2", string=re.compile(r"LUNCH \d+", re.IGNORECASE))
+        lunch_headers = soup.find_all("h2", string=LUNCH_HEADER)
         if lunch_number > len(lunch_headers):
             logger.debug("Lunch number out of range.")
             return
@@ -46,7 +40,7 @@ class BombayBistroScraper(LunchScraper):
         content = []
         for sibling in container.find_parent().find_next_siblings():
             logger.debug(f"Scanning sibling: {sibling.name} - class: {sibling.get('class')}")
-            if sibling.find("h2", string=re.compile(r"LUNCH \d+", re.IGNORECASE)):
+            if sibling.find("h2", string=LUNCH_HEADER):
                 break  # Stop when reaching the next lunch section
             content.append(sibling)
 
@@ -114,7 +108,7 @@ class BombayBistroScraper(LunchScraper):
 
         # ALSO include "ANDRA ALTERNATIV" — available every day
         alt_items = []
-        alt_heading = soup.find("h5", string=re.compile("ANDRA ALTERNATIV", re.IGNORECASE))
+        alt_heading = soup.find("h5", string=ALT_HEADER)
         if alt_heading:
             logger.debug("Found ANDRA ALTERNATIV heading")
 
@@ -124,7 +118,8 @@ class BombayBistroScraper(LunchScraper):
                 # Look for the next <p> tags within the same parent section
                 for p in section_container.find_all_next("p"):
                     # Stop if we reach a new section like "LUNCH 2", "MÅNDAG", etc.
-                    if p.find_previous("h5") and re.search(r"\b(LUNCH|MÅNDAG|TISDAG|ONSDAG|TORSDAG|FREDAG|DAGENS VEG)\b", p.text, re.IGNORECASE):
+                    # (no find_previous("h5") walk: the weekday h5 headings always precede these <p>s)
+                    if ALT_SECTION_END.search(p.text):
                         break
                     text = p.get_text(separator="\n", strip=True)
                     for line in text.split("\n"):
@@ -133,11 +128,8 @@ class BombayBistroScraper(LunchScraper):
                             logger.debug(f"Adding ANDRA ALTERNATIV item: {clean}")
                             alt_items.append(MenuItem(name=clean, category="ANDRA ALTERNATIV"))
 
-        # Add them to all existing weekday menus
-        for day in weekday_map:
-            if not alt_items:
-                continue
-
+        # Add them to all weekday menus (parsed once, shared by every day)
+        if alt_items:
             alt_lines = [item.name for item in alt_items]
             merged_items = []
             i = 0
@@ -156,10 +148,9 @@ class BombayBistroScraper(LunchScraper):
                     merged_items.append(MenuItem(name=clean_name, price=price, category="ANDRA ALTERNATIV"))
                     i += 1
 
-            if day in self._menus:
-                self._menus[day].items.extend(merged_items)
-            else:
-                self._menus[day] = DailyMenu(day=day, items=merged_items)
+            daily = {day: menu.items for day, menu in self._menus.items()}
+            days = list(daily) + [day for day in weekday_map if day not in daily]
+            self._menus = WeeklyMenu(merged_items, daily).menus(days)
 
 
     def get_menu_for_day(self, day: str) -> Optional[DailyMenu]:
@@ -1,24 +1,19 @@
 # lindholmen_lunch/scrapers/cuckoos_nest.py
 
-from bs4 import BeautifulSoup
-import requests
+from bs4 import SoupStrainer
 import logging
-from scrapers.base import LunchScraper, DailyMenu, MenuItem
+from scrapers.base import LunchScraper, DailyMenu, MenuItem, WeeklyMenu, make_soup
 from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
 class CuckoosNestScraper(LunchScraper):
     URL = "https://www.cuckoosnest.se/menyer/lunch"
+    CONDITIONAL_GET = True
+    _MENU = SoupStrainer("div", class_="content-region")
 
-    def __init__(self):
-        self._menus: Dict[str, DailyMenu] = {}
-        self.fetch()
-
-    def fetch(self):
-        response = requests.get(self.URL)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+    def parse(self, raw: bytes) -> None:
+        soup = make_soup(raw, parse_only=self._MENU)
 
         left_column = soup.select_one("div.content-region")
         if not left_column:
@@ -57,8 +52,7 @@ class CuckoosNestScraper(LunchScraper):
 
         if items:
             # The menu is weekly and valid Mon–Fri
-            for day in ["monday", "tuesday", "wednesday", "thursday", "friday"]:
-                self._menus[day] = DailyMenu(day=day, items=items.copy())
+            self._menus = WeeklyMenu(items).menus()
 
     def get_menu_for_day(self, day: str) -> Optional[DailyMenu]:
         return self._menus.get(day.lower())
@@ -1,23 +1,18 @@
-from bs4 import BeautifulSoup
-import requests
+from bs4 import SoupStrainer
 import re
 import logging
 from datetime import date
-from scrapers.base import LunchScraper, MenuItem, DailyMenu
+from scrapers.base import LunchScraper, MenuItem, DailyMenu, make_soup
 from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
 class DistrictOneScraper(LunchScraper):
     URL = "https://www.districtone.se/lunch.html"
+    _MENU = SoupStrainer("div", class_="styles_contentContainer__lrPIa")
 
-    def __init__(self):
-        self._menus = {}
-        self.fetch()
-
-    def fetch(self):
-        response = requests.get(self.URL)
-        soup = BeautifulSoup(response.content, "html.parser")
+    def parse(self, raw: bytes) -> None:
+        soup = make_soup(raw, parse_only=self._MENU)
 
         weekday_map = {
             "måndag": "monday",
@@ -1,62 +1,53 @@
 # file: lindholmen_lunch/scrapers/encounter_asian.py
 
 import logging
-from typing import Dict, Optional
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import WebDriverException
+from typing import Dict, List, Optional
 import traceback
-from scrapers.base import LunchScraper, DailyMenu, MenuItem, get_chrome_options
+from scrapers.base import LunchScraper, DailyMenu, MenuItem, WeeklyMenu, browser_pool, wait_for_selector, make_soup
+from utils import metrics
 
 logger = logging.getLogger(__name__)
 
 class EncounterAsianScraper(LunchScraper):
     URL = "https://tamed.se/take-away-meny/encounter-sushi"
 
-    def __init__(self):
-        self._menus: Dict[str, DailyMenu] = {}
-
+    def fetch_raw(self) -> Optional[bytes]:
+        # Rendered by a MUI app from tamed.se's private API; without a verified endpoint
+        # and a recorded response there is no browser-free path to fall back from
         # Check if selenium is available
-        chrome_options = get_chrome_options(enable_javascript=True, load_images=False)
-        if chrome_options is None:
+        if not browser_pool.available:
             # Selenium not available, skip this scraper
             logger.warning(f"Selenium not available, skipping {self.__class__.__name__}")
-            return
+            return None
 
+        from selenium.common.exceptions import WebDriverException
         try:
-            with webdriver.Chrome(options=chrome_options) as driver:
-                driver.set_page_load_timeout(15)
+            with browser_pool.lease(page_load_timeout=15) as driver:
                 driver.get(self.URL)
 
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "ul[class*='MuiList-root']"))
-                )
+                render_seconds = wait_for_selector(driver, "ul[class*='MuiList-root']", timeout=10)
+                metrics.record(f"render_seconds.{self.__class__.__name__}", render_seconds)
+                logger.debug("Menu rendered after %.2fs", render_seconds)
 
                 html = driver.page_source
                 logger.debug("Fetched rendered HTML (first 500 chars):\n%s", html[:500])
-                self.soup = BeautifulSoup(html, "html.parser")
+                return html.encode("utf-8")
 
         except WebDriverException as e:
             logger.error("WebDriver error: %s", str(e))
             traceback.print_exc()
-            return
+            return None
 
         except Exception as e:
             logger.error("Error while loading or parsing Encounter Asian menu:")
             traceback.print_exc()
-            return
+            return None
 
-        self.fetch()
-
-    def fetch(self) -> None:
-        weekdays = ["monday", "tuesday", "wednesday", "thursday", "friday"]
+    def parse(self, raw: bytes) -> None:
+        soup = make_soup(raw)
         items = []
 
-        menu_list = self.soup.select_one("ul[class*='MuiList-root']")
+        menu_list = soup.select_one("ul[class*='MuiList-root']")
         if not menu_list:
             logger.warning("Menu list container not found.")
             return
@@ -82,34 +73,41 @@ class EncounterAsianScraper(LunchScraper):
             description = desc_elem.get_text(strip=True) if desc_elem else ""
             price = price_elem.get_text(strip=True) if price_elem else ""
 
-            # Extract category from prefix (e.g., SUSHI - Mix 12 bitar → SUSHI)
-            if " - " in full_name:
-                category, name = full_name.split(" - ", 1)
-            elif " " in full_name:
-                category, name = full_name.split(" ", 1)
-            else:
-                category = full_name
-                name = full_name
-
-            item = MenuItem(
-                name=name.strip(),
-                category=category.strip(),
-                description=description.strip(),
-                price=price.strip()
-            )
+            item = self._build_item(full_name, description, price)
             logger.debug("Parsed item: %s", item)
             items.append(item)
 
+        self._set_items(items)
+
+    def _set_items(self, items: List[MenuItem]) -> None:
         if not items:
             logger.warning("No menu items parsed.")
             return
 
-        for day in weekdays:
-            self._menus[day] = DailyMenu(day=day, items=list(items))
+        # The same take-away menu every weekday: one shared tuple of items
+        self._menus = WeeklyMenu(items).menus()
 
         logger.debug("Parsed %d items for Encounter Asian Cuisine.", len(items))
         logger.debug("DailyMenu contents: %s", self._menus)
 
+    @staticmethod
+    def _build_item(full_name: str, description: str, price: str) -> MenuItem:
+        # Extract category from prefix (e.g., SUSHI - Mix 12 bitar → SUSHI)
+        if " - " in full_name:
+            category, name = full_name.split(" - ", 1)
+        elif " " in full_name:
+            category, name = full_name.split(" ", 1)
+        else:
+            category = full_name
+            name = full_name
+
+        return MenuItem(
+            name=name.strip(),
+            category=category.strip(),
+            description=description.strip(),
+            price=price.strip()
+        )
+
     def get_menu_for_day(self, day: str) -> Optional[DailyMenu]:
         logger.debug("Looking up menu for: %s", day.lower())
         return self._menus.get(day.lower())
@@ -1,31 +1,18 @@
 # scrapers/kooperativet.py
 
-from bs4 import BeautifulSoup
-import requests
+from bs4 import SoupStrainer
 from typing import Dict, Optional
-from scrapers.base import LunchScraper, DailyMenu, MenuItem
+from scrapers.base import LunchScraper, DailyMenu, MenuItem, make_soup
 
 class KooperativetScraper(LunchScraper):
     URL = "https://www.kooperativet.se/"
     _PRICE = "130 kr"
+    _MENU = SoupStrainer("div", id=["monday", "tuesday", "wednesday", "thursday", "friday"])
 
-    def __init__(self):
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/122.0.0.0 Safari/537.36"
-            )
-        }
-        response = requests.get(self.URL, headers=headers)
-        response.raise_for_status()
-        self.soup = BeautifulSoup(response.text, "html.parser")
-        self._menus: Dict[str, DailyMenu] = {}
-        self.fetch()
-
-    def fetch(self) -> None:
+    def parse(self, raw: bytes) -> None:
+        soup = make_soup(raw, parse_only=self._MENU)
         for day in ["monday", "tuesday", "wednesday", "thursday", "friday"]:
-            section = self.soup.find("div", {"id": day})
+            section = soup.find("div", {"id": day})
             if not section:
                 continue
 
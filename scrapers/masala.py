@@ -2,7 +2,6 @@
 
 import json
 from typing import Dict, Optional
-from datetime import datetime
 from pathlib import Path
 from scrapers.base import LunchScraper, DailyMenu, MenuItem
 
@@ -10,14 +9,13 @@ class MasalaScraper(LunchScraper):
     URL = "https://masalakitchen.se/lunch/"
     JSON_PATH = Path("scrapers/masala_lunch_all_weeks.json")
 
-    def __init__(self):
-        with open(self.JSON_PATH, encoding="utf-8") as f:
-            self.menu_data = json.load(f)
-        self._menus: Dict[str, DailyMenu] = {}
-        self.fetch()
+    def fetch_raw(self) -> Optional[bytes]:
+        # The weekly rotation was OCR'd once into a local JSON file
+        return self.JSON_PATH.read_bytes()
 
-    def fetch(self) -> None:
-        current_week = datetime.today().isocalendar().week
+    def parse(self, raw: bytes) -> None:
+        self.menu_data = json.loads(raw)
+        current_week = self.week_number
         week_key = f"week{((current_week - 1) % 4) + 1}"
         daily_menus = self.menu_data["weeks"].get(week_key, {})
         standing_items = [MenuItem(**item, category="Stående meny") for item in self.menu_data.get("standing", [])]
@@ -2,27 +2,21 @@
 
 import re
 from typing import Dict, Optional
-import requests
 import logging
-from bs4 import BeautifulSoup
-from scrapers.base import LunchScraper, DailyMenu, MenuItem
+from bs4 import SoupStrainer
+from scrapers.base import LunchScraper, DailyMenu, MenuItem, WeeklyMenu, make_soup
 
 logger = logging.getLogger(__name__)
 
 class MatMinnenScraper(LunchScraper):
     URL = "https://matminnen.se/lunchmeny"
     _PRICE = "125 kr"
+    _MENU = SoupStrainer(class_="contentgroup__body")
 
-    def __init__(self):
-        response = requests.get(self.URL)
-        response.raise_for_status()
-        self.soup = BeautifulSoup(response.text, "html.parser")
-        self._menus: Dict[str, DailyMenu] = {}
-        self.fetch()
-
-    def fetch(self) -> None:
+    def parse(self, raw: bytes) -> None:
+        soup = make_soup(raw, parse_only=self._MENU)
         weekdays = ["måndag", "tisdag", "onsdag", "torsdag", "fredag"]
-        body = self.soup.select_one(".contentgroup__body")
+        body = soup.select_one(".contentgroup__body")
         if not body:
             return
         logging.debug("Print body: %s", body)
@@ -59,8 +53,7 @@ class MatMinnenScraper(LunchScraper):
             if current_day in weekdays:
                 items_by_day[current_day].append(item)
             elif current_day == "veckans sallad":
-                item.category = "Veckans sallad"
-                weekly_items.append(item)
+                weekly_items.append(item.replace(category="Veckans sallad"))
 
         logging.debug("Items by day: %s", items_by_day)
         # Save daily menus
@@ -72,15 +65,10 @@ class MatMinnenScraper(LunchScraper):
             "fredag": "friday",
         }
 
-        for swe_day, items in items_by_day.items():
-            eng_day = day_map[swe_day]
-            if items:
-                self._menus[eng_day] = DailyMenu(day=eng_day, items=items)
+        daily = {day_map[swe_day]: items for swe_day, items in items_by_day.items() if items}
 
-        # Add weekly items to all days
-        if weekly_items:
-            for menu in self._menus.values():
-                menu.items.extend(weekly_items)
+        # Weekly items follow each day's own items, on the days that have any
+        self._menus = WeeklyMenu(weekly_items, daily).menus(daily)
 
         logging.debug("Final menus: %s", self._menus)
 
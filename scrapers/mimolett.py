@@ -1,27 +1,17 @@
 # scrapers/mimolett.py
 
-from bs4 import BeautifulSoup
-from scrapers.base import LunchScraper, MenuItem, DailyMenu
+from bs4 import SoupStrainer
+from scrapers.base import LunchScraper, MenuItem, DailyMenu, WeeklyMenu, make_soup
 from typing import Dict, List, Optional
-import requests
 
 class MimolettScraper(LunchScraper):
     URL = "https://restaurangmimolett.se/lunch/"
     _PRICE = "129 kr"
+    CONDITIONAL_GET = True
+    _MENU = SoupStrainer("div", class_="menu-list")
 
-    def __init__(self):
-        self._menus: Dict[str, DailyMenu] = {}
-        self.fetch()
-
-    def fetch(self) -> None:
-        try:
-            response = requests.get(self.URL)
-            response.raise_for_status()
-        except Exception as e:
-            print(f"Failed to fetch Mimolett page: {e}")
-            return
-
-        soup = BeautifulSoup(response.text, "html.parser")
+    def parse(self, raw: bytes) -> None:
+        soup = make_soup(raw, parse_only=self._MENU)
         containers = soup.select("div.menu-list")
 
         items: List[MenuItem] = []
@@ -45,8 +35,7 @@ class MimolettScraper(LunchScraper):
                     ))
 
         # Mimolett serves same menu Mon–Fri
-        for day in ["monday", "tuesday", "wednesday", "thursday", "friday"]:
-            self._menus[day] = DailyMenu(day=day, items=items)
+        self._menus = WeeklyMenu(items).menus()
 
     def get_menu_for_day(self, day: str) -> Optional[DailyMenu]:
         return self._menus.get(day.lower())
@@ -1,26 +1,21 @@
-from bs4 import BeautifulSoup
-from scrapers.base import LunchScraper, MenuItem, DailyMenu
+from scrapers.base import LunchScraper, MenuItem, DailyMenu, WeeklyMenu, make_soup
 from typing import Dict, Optional
 from datetime import date
-import requests
 import os
 
 class MissFScraper(LunchScraper):
     URL = "https://www.missf.se/"
     LOCAL_FILE = "sample_miss_f.htm"
+    CONDITIONAL_GET = True
 
-    def __init__(self):
-        self._menus: Dict[str, DailyMenu] = {}
-        self.fetch()
-
-    def fetch(self):
+    def fetch_raw(self) -> Optional[bytes]:
         if os.path.exists(self.LOCAL_FILE):
-            with open(self.LOCAL_FILE, "r", encoding="utf-8") as f:
-                soup = BeautifulSoup(f, "html.parser")
-        else:
-            response = requests.get(self.URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            with open(self.LOCAL_FILE, "rb") as f:
+                return f.read()
+        return super().fetch_raw()
+
+    def parse(self, raw: bytes) -> None:
+        soup = make_soup(raw)
 
         menu_items = []
 
@@ -56,8 +51,7 @@ class MissFScraper(LunchScraper):
                 menu_items.append(MenuItem(name=title, description=desc_text, category=category, price=price))
 
         # Apply the same menu to all weekdays
-        for day in ["monday", "tuesday", "wednesday", "thursday", "friday"]:
-            self._menus[day] = DailyMenu(day=day, items=list(menu_items))  # copy list
+        self._menus = WeeklyMenu(menu_items).menus()
 
     def get_menu_for_day(self, day: str) -> Optional[DailyMenu]:
         return self._menus.get(day.lower())
@@ -1,20 +1,13 @@
-from bs4 import BeautifulSoup
-import requests
 from typing import Dict, Optional
-from scrapers.base import LunchScraper, DailyMenu, MenuItem
+from scrapers.base import LunchScraper, DailyMenu, MenuItem, WeeklyMenu, make_soup
 
 class OishiiScraper(LunchScraper):
     URL = "https://oishii.se/lunchmeny/"
+    CONDITIONAL_GET = True
 
-    def __init__(self):
-        response = requests.get(self.URL)
-        response.raise_for_status()
-        self.soup = BeautifulSoup(response.text, "html.parser")
-        self._menus: Dict[str, DailyMenu] = {}
-        self.fetch()
-
-    def fetch(self) -> None:
-        categories = self.soup.find_all("h1")
+    def parse(self, raw: bytes) -> None:
+        soup = make_soup(raw)
+        categories = soup.find_all("h1")
         items = []
 
         for category_tag in categories:
@@ -43,8 +36,7 @@ class OishiiScraper(LunchScraper):
 
 
         # Oishii's menu appears the same for all weekdays
-        for day in ["monday", "tuesday", "wednesday", "thursday", "friday"]:
-            self._menus[day] = DailyMenu(day=day, items=items)
+        self._menus = WeeklyMenu(items).menus()
 
     def get_menu_for_day(self, day: str) -> Optional[DailyMenu]:
         return self._menus.get(day.lower())
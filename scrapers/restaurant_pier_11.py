@@ -2,15 +2,15 @@
 
 import logging
 from typing import Dict, Optional
-import requests
-from bs4 import BeautifulSoup
-from scrapers.base import LunchScraper, MenuItem, DailyMenu
+from bs4 import SoupStrainer
+from scrapers.base import LunchScraper, MenuItem, DailyMenu, make_soup
 
 logger = logging.getLogger(__name__)
 
 class RestaurantPier11Scraper(LunchScraper):
     URL = "https://ericssonbynordrest.se/restaurang/restaurant-pier-11/#lunch-menu"
     _PRICE = "110 kr"
+    _MENU = SoupStrainer("div", class_="weekday-item")
 
     WEEKDAY_MAP = {
         "monday": "monday",
@@ -20,19 +20,8 @@ class RestaurantPier11Scraper(LunchScraper):
         "friday": "friday"
     }
 
-    def __init__(self):
-        self._menus: Dict[str, DailyMenu] = {}
-        self.fetch()
-
-    def fetch(self) -> None:
-        try:
-            response = requests.get(self.URL)
-            response.raise_for_status()
-        except Exception as e:
-            logger.error("Failed to fetch Pier 11 page: %s", e)
-            return
-
-        soup = BeautifulSoup(response.content, "html.parser")
+    def parse(self, raw: bytes) -> None:
+        soup = make_soup(raw, parse_only=self._MENU)
         weekday_items = soup.select("div.weekday-item")
 
         for weekday_div in weekday_items:
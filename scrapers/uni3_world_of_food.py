@@ -3,9 +3,8 @@
 import logging
 import re
 from typing import Dict, Optional
-import requests
 from bs4 import BeautifulSoup
-from scrapers.base import LunchScraper, MenuItem, DailyMenu
+from scrapers.base import LunchScraper, MenuItem, DailyMenu, http_get, make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -13,19 +12,13 @@ class Uni3WorldOfFoodScraper(LunchScraper):
     RSS_URL = "https://www.compass-group.se/menuapi/feed/rss/current-week?costNumber=448305&language=sv"
     _PRICE = "132 kr"
 
-    def __init__(self):
-        self._menus: Dict[str, DailyMenu] = {}
-        self.fetch()
+    def fetch_raw(self) -> Optional[bytes]:
+        response = http_get(self.RSS_URL)
+        response.raise_for_status()
+        return response.content
 
-    def fetch(self) -> None:
-        try:
-            response = requests.get(self.RSS_URL)
-            response.raise_for_status()
-        except Exception as e:
-            logger.error("Failed to fetch RSS feed: %s", e)
-            return
-
-        soup = BeautifulSoup(response.content, "xml")
+    def parse(self, raw: bytes) -> None:
+        soup = BeautifulSoup(raw, "xml")
         weekday_map = {
             "måndag": "monday",
             "tisdag": "tuesday",
@@ -46,7 +39,7 @@ class Uni3WorldOfFoodScraper(LunchScraper):
                 continue
 
             desc_html = item.find("description").get_text()
-            desc_soup = BeautifulSoup(desc_html, "html.parser")
+            desc_soup = make_soup(desc_html)
             items = []
 
             for p in desc_soup.find_all("p"):
@@ -0,0 +1,388 @@
+// Language switching: every [data-i18n] element shows its dictionary entry in the current language
+let dictionary = null;
+
+function currentLanguage() {
+    return document.documentElement.lang === 'sv' ? 'sv' : 'en';
+}
+
+function translate(key) {
+    if (!dictionary) dictionary = JSON.parse(document.getElementById('i18n').textContent);
+    const entry = dictionary[key];
+    return entry ? entry[currentLanguage()] : key;
+}
+
+function setText(el, key) {
+    el.dataset.i18n = key;
+    el.textContent = translate(key);
+}
+
+function applyLanguage(language) {
+    document.documentElement.lang = language;
+    document.querySelectorAll('[data-i18n]').forEach(el => setText(el, el.dataset.i18n));
+    document.querySelectorAll('[data-i18n-placeholder]').forEach(el => {
+        el.placeholder = translate(el.dataset.i18nPlaceholder);
+    });
+}
+
+function toggleLanguage() {
+    const language = currentLanguage() === 'sv' ? 'en' : 'sv';
+    applyLanguage(language);
+
+    // Save language preference
+    localStorage.setItem('language', language);
+}
+
+
+
+// Random restaurant selection
+function selectRandomRestaurant() {
+    const restaurants = Array.from(document.querySelectorAll('.restaurant-card'), card => card.id.replace('restaurant-', ''));
+    if (restaurants.length === 0) return;
+
+    // Clear previous highlights
+    document.querySelectorAll('.restaurant-card.highlighted').forEach(card => {
+        card.classList.remove('highlighted');
+    });
+
+    // Update floating button
+    const floatingButton = document.querySelector('.floating-random-button');
+    const buttonLabel = floatingButton && floatingButton.querySelector('[data-i18n]');
+
+    if (floatingButton) {
+        // Store original dimensions to prevent size changes
+        const originalWidth = floatingButton.offsetWidth;
+        const originalHeight = floatingButton.offsetHeight;
+        floatingButton.style.width = originalWidth + 'px';
+        floatingButton.style.height = originalHeight + 'px';
+        setText(buttonLabel, 'choosing');
+    }
+
+    setTimeout(() => {
+        const randomRestaurant = restaurants[Math.floor(Math.random() * restaurants.length)];
+        const restaurantCard = document.getElementById('restaurant-' + randomRestaurant);
+
+        if (restaurantCard) {
+            restaurantCard.classList.add('highlighted');
+            restaurantCard.scrollIntoView({ behavior: 'smooth', block: 'center' });
+        }
+
+        // Reset button
+        if (floatingButton) {
+            setText(buttonLabel, 'feeling_hungry');
+            // Remove fixed dimensions to allow natural sizing again
+            floatingButton.style.width = '';
+            floatingButton.style.height = '';
+        }
+    }, 1000);
+}
+
+// Go to top and reset random selection
+function goToTop() {
+    // Clear any highlighted restaurants
+    document.querySelectorAll('.restaurant-card.highlighted').forEach(card => {
+        card.classList.remove('highlighted');
+    });
+
+    // Scroll to top
+    window.scrollTo({ top: 0, behavior: 'smooth' });
+}
+
+// Load saved language preference
+document.addEventListener('DOMContentLoaded', function() {
+    const savedLanguage = localStorage.getItem('language');
+    if (savedLanguage === 'sv') {
+        // Switch to Swedish if saved
+        applyLanguage('sv');
+    }
+});
+
+
+// Day switcher: render another day's menus from the week feed instead of loading its page
+const API_VERSION = 1;
+let weekRequest = null;
+
+function loadWeek(url) {
+    if (!weekRequest) {
+        weekRequest = fetch(url).then(response => {
+            if (!response.ok) throw new Error('HTTP ' + response.status);
+            return response.json();
+        }).then(week => {
+            if (week.version !== API_VERSION) throw new Error('Unsupported feed version ' + week.version);
+            return week;
+        });
+        // Let a later click try again
+        weekRequest.catch(() => { weekRequest = null; });
+    }
+    return weekRequest;
+}
+
+function element(tag, className, text) {
+    const el = document.createElement(tag);
+    if (className) el.className = className;
+    if (text !== undefined) el.textContent = text;
+    return el;
+}
+
+// A translated span, like the page template's t(key)
+function label(parent, key) {
+    setText(parent.appendChild(element('span')), key);
+    return parent;
+}
+
+function formatUpdated(iso) {
+    if (!iso) return '';
+    // sv-SE formats as "2025-01-01 10:30", like the generated pages
+    return new Date(iso).toLocaleString('sv-SE', {
+        timeZone: 'Europe/Stockholm',
+        year: 'numeric', month: '2-digit', day: '2-digit', hour: '2-digit', minute: '2-digit'
+    });
+}
+
+function renderMenuItem(item) {
+    const row = element('div', 'menu-item');
+    const details = row.appendChild(element('div', 'menu-item-details'));
+    if (item.name && item.name.length > 50 && !item.description) {
+        // Long menu names (LsKitchen fix)
+        label(details.appendChild(element('div', 'menu-item-name')), 'todays_special');
+        details.appendChild(element('div', 'menu-item-description', item.name));
+    } else {
+        details.appendChild(element('div', 'menu-item-name', item.name || ''));
+        if (item.description) details.appendChild(element('div', 'menu-item-description', item.description));
+    }
+    const tags = (item.category ? [item.category] : []).concat(item.emoji_tags || []);
+    if (tags.length) {
+        const tagList = details.appendChild(element('div', 'emoji-tags'));
+        tags.forEach(tag => tagList.appendChild(element('span', 'emoji-tag', tag)));
+    }
+    if (item.price) row.appendChild(element('div', 'menu-item-price', item.price));
+    return row;
+}
+
+function renderRestaurant(restaurant, updated) {
+    const card = element('div', 'restaurant-card');
+    card.id = 'restaurant-' + restaurant.id;
+
+    const header = card.appendChild(element('div', 'restaurant-header'));
+    const info = header.appendChild(element('div', 'restaurant-info'));
+    info.appendChild(element('h2', 'restaurant-name', restaurant.name));
+    const meta = info.appendChild(element('div', 'restaurant-meta'));
+    [['icon-map', 'Lindholmen'], ['icon-clock', '11:00 - 14:00']].forEach(([icon, text]) => {
+        const metaItem = meta.appendChild(element('div', 'restaurant-meta-item'));
+        metaItem.appendChild(element('span', icon));
+        metaItem.appendChild(element('span', null, text));
+    });
+    label(info.appendChild(element('div', 'cuisine-badge')), 'restaurant');
+
+    const links = header.appendChild(element('div', 'restaurant-links'));
+    [['url', '🔗', 'Website'], ['map', '🗺️', 'Google Maps']].forEach(([key, label, title]) => {
+        if (!restaurant.links[key]) return;
+        const link = links.appendChild(element('a', null, label));
+        link.href = restaurant.links[key];
+        link.target = '_blank';
+        link.title = title;
+    });
+
+    const content = card.appendChild(element('div', 'restaurant-content'));
+    const section = content.appendChild(element('div', 'menu-section'));
+    if (restaurant.items.length) {
+        const heading = section.appendChild(element('h3'));
+        heading.appendChild(element('span', 'icon-menu'));
+        label(heading, 'todays_lunch');
+        const items = section.appendChild(element('div', 'menu-items'));
+        restaurant.items.forEach(item => items.appendChild(renderMenuItem(item)));
+        content.appendChild(element('div', 'separator'));
+    } else {
+        const empty = section.appendChild(element('p'));
+        empty.style.color = 'var(--muted-foreground)';
+        empty.style.fontStyle = 'italic';
+        label(empty, 'no_menu');
+    }
+    const offer = label(content.appendChild(element('div', 'special-offer', '✨ ')), 'last_updated');
+    offer.appendChild(document.createTextNode(' ' + formatUpdated(updated)));
+    return card;
+}
+
+function renderDay(container, data) {
+    container.textContent = '';
+    if (!data || !data.restaurants.length) {
+        const noData = container.appendChild(element('div', 'no-data'));
+        label(noData.appendChild(element('h2')), 'no_data_day');
+        return;
+    }
+    const grid = container.appendChild(element('div', 'restaurant-grid'));
+    data.restaurants.forEach(restaurant => grid.appendChild(renderRestaurant(restaurant, data.updated)));
+}
+
+function showDay(link) {
+    const container = document.getElementById('menus');
+    const day = link.dataset.day;
+    if (!container || container.dataset.day === day) return Promise.resolve();
+
+    return loadWeek(container.dataset.api).then(week => {
+        renderDay(container, week.days[day]);
+        container.dataset.day = day;
+        document.querySelectorAll('.day-switcher .day-button').forEach(button => {
+            button.classList.toggle('active', button === link);
+        });
+    }).catch(() => {
+        // No feed (e.g. opened from disk): fall back to the weekday page
+        window.location.href = link.href;
+    });
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    document.querySelectorAll('.day-switcher .day-button').forEach(link => {
+        link.addEventListener('click', event => {
+            event.preventDefault();
+            showDay(link);
+        });
+    });
+});
+
+// Menu search: the week's inverted index (api/search.json, built by utils/search.py), searched in the browser
+const MIN_INFIX_LENGTH = 3;
+const STOPWORDS = new Set('med och pa i av samt eller en ett serveras till fran som with and or of the a an in on served'.split(' '));
+let searchRequest = null;
+
+// Lowercase without diacritics, like utils/search.py's fold()
+function fold(text) {
+    return text.normalize('NFKD').replace(/\p{M}/gu, '').toLowerCase();
+}
+
+function loadSearchIndex(url) {
+    if (!searchRequest) {
+        searchRequest = fetch(url).then(response => {
+            if (!response.ok) throw new Error('HTTP ' + response.status);
+            return response.json();
+        }).then(index => {
+            if (index.version !== API_VERSION) throw new Error('Unsupported index version ' + index.version);
+            // Postings are stored as gaps between ascending document numbers
+            index.postings = index.postings.map(gaps => {
+                let total = 0;
+                return gaps.map(gap => (total += gap));
+            });
+            return index;
+        });
+        searchRequest.catch(() => { searchRequest = null; });
+    }
+    return searchRequest;
+}
+
+// First term not sorting before `word`: terms starting with it follow from here
+function lowerBound(terms, word) {
+    let low = 0;
+    let high = terms.length;
+    while (low < high) {
+        const middle = (low + high) >> 1;
+        if (terms[middle] < word) low = middle + 1;
+        else high = middle;
+    }
+    return low;
+}
+
+// Documents matching every query word; same ranking as utils/search.py's search()
+function searchMenus(index, query, day, limit) {
+    const words = (fold(query).match(/[a-z0-9]+/g) || []).filter(word => !STOPWORDS.has(word));
+    if (!words.length) return [];
+
+    let scores = null;
+    for (const word of words) {
+        const wordScores = new Map();
+        const add = (term, weight) => index.postings[term].forEach(doc => {
+            if ((wordScores.get(doc) || 0) < weight) wordScores.set(doc, weight);
+        });
+        for (let i = lowerBound(index.terms, word); i < index.terms.length && index.terms[i].startsWith(word); i++) {
+            add(i, 2);
+        }
+        if (word.length >= MIN_INFIX_LENGTH) {
+            index.terms.forEach((term, i) => {
+                if (!term.startsWith(word) && term.includes(word)) add(i, 1);
+            });
+        }
+        if (scores === null) {
+            scores = wordScores;
+        } else {
+            const both = new Map();
+            scores.forEach((score, doc) => {
+                if (wordScores.has(doc)) both.set(doc, score + wordScores.get(doc));
+            });
+            scores = both;
+        }
+        if (!scores.size) return [];
+    }
+
+    const docs = index.docs;
+    const dayIndex = index.days.indexOf(day);
+    const notServed = doc => (docs[doc][3].includes(dayIndex) ? 0 : 1);
+    return Array.from(scores.keys()).sort((a, b) =>
+        scores.get(b) - scores.get(a) || notServed(a) - notServed(b) || docs[b][3].length - docs[a][3].length || a - b
+    ).slice(0, limit).map(doc => docs[doc]);
+}
+
+// Switch to a day the dish is served (the shown day if it is) and highlight its restaurant
+function openResult(restaurant, days) {
+    const container = document.getElementById('menus');
+    const day = days.includes(container.dataset.day) ? container.dataset.day : days[0];
+    const link = document.querySelector('.day-switcher .day-button[data-day="' + day + '"]');
+    (link ? showDay(link) : Promise.resolve()).then(() => {
+        document.querySelectorAll('.restaurant-card.highlighted').forEach(card => card.classList.remove('highlighted'));
+        const card = document.getElementById('restaurant-' + restaurant);
+        if (card) {
+            card.classList.add('highlighted');
+            card.scrollIntoView({ behavior: 'smooth', block: 'center' });
+        }
+    });
+}
+
+function renderSearchResults(list, index, results) {
+    list.textContent = '';
+    if (!results.length) {
+        label(list.appendChild(element('li', 'search-empty')), 'search_no_results');
+        return;
+    }
+    results.forEach(([restaurant, name, description, days]) => {
+        const row = list.appendChild(element('li', 'search-result'));
+        row.appendChild(element('span', 'search-result-name', name || description));
+        const restaurantId = index.restaurants[restaurant];
+        const meta = row.appendChild(element('span', 'search-result-meta',
+            restaurantId.replace('Scraper', '').replace(/_/g, ' ') + ' · '));
+        days.forEach((day, i) => {
+            if (i) meta.appendChild(document.createTextNode(', '));
+            label(meta, 'day_' + index.days[day]);
+        });
+        row.addEventListener('click', () => {
+            list.textContent = '';
+            openResult(restaurantId, days.map(day => index.days[day]));
+        });
+    });
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const search = document.querySelector('.menu-search');
+    if (!search || !window.fetch) return;
+    const input = search.querySelector('.search-input');
+    const list = search.querySelector('.search-results');
+    search.hidden = false;
+
+    // Fetched on first use, not with the page
+    input.addEventListener('focus', () => loadSearchIndex(search.dataset.index).catch(() => {}), { once: true });
+    input.addEventListener('input', () => {
+        const query = input.value;
+        if (!query.trim()) {
+            list.textContent = '';
+            return;
+        }
+        loadSearchIndex(search.dataset.index).then(index => {
+            // Ignore answers to queries the user has typed past
+            if (input.value !== query) return;
+            renderSearchResults(list, index, searchMenus(index, query, document.getElementById('menus').dataset.day, 20));
+        }).catch(() => {});
+    });
+});
+
+// Offline cache: the service worker serves the last menu instantly and refreshes it in the background
+if ('serviceWorker' in navigator) {
+    window.addEventListener('load', function() {
+        navigator.serviceWorker.register(document.body.dataset.serviceWorker).catch(() => {});
+    });
+}
@@ -0,0 +1,69 @@
+// Service worker generated by generate_html.py; do not edit docs/sw.js by hand.
+//
+// The cache version changes with the day's menu data and the hashed assets, so
+// a new deploy installs a fresh cache and drops the old one. Pages and the
+// week feed are served stale-while-revalidate: the last menu shows instantly,
+// and the network response replaces it in the cache for the next visit.
+
+const CACHE_VERSION = {{ cache_version|tojson }};
+const CACHE_NAME = 'lunch-' + CACHE_VERSION;
+const PRECACHE = {{ precache|tojson }};
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(CACHE_NAME)
+            .then(cache => cache.addAll(PRECACHE))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(names => Promise.all(
+                names.filter(name => name.startsWith('lunch-') && name !== CACHE_NAME)
+                    .map(name => caches.delete(name))
+            ))
+            .then(() => self.clients.claim())
+    );
+});
+
+// Hashed assets never change under the same URL
+function cacheFirst(request) {
+    return caches.match(request).then(cached => cached || fetch(request).then(response => {
+        if (response.ok) {
+            const copy = response.clone();
+            caches.open(CACHE_NAME).then(cache => cache.put(request, copy));
+        }
+        return response;
+    }));
+}
+
+function staleWhileRevalidate(event) {
+    const request = event.request;
+    const network = fetch(request).then(response => {
+        if (response.ok) {
+            const copy = response.clone();
+            caches.open(CACHE_NAME).then(cache => cache.put(request, copy));
+        }
+        return response;
+    });
+    return caches.match(request, { ignoreSearch: request.mode === 'navigate' }).then(cached => {
+        if (!cached) return network;
+        // Keep the worker alive until the cache is refreshed
+        event.waitUntil(network.catch(() => undefined));
+        return cached;
+    });
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (request.method !== 'GET' || url.origin !== self.location.origin) return;
+
+    if (url.pathname.includes('/static/')) {
+        event.respondWith(cacheFirst(request));
+    } else {
+        event.respondWith(staleWhileRevalidate(event));
+    }
+});
@@ -0,0 +1,54 @@
+# tests/test_archive.py
+
+import os
+import sqlite3
+
+import pytest
+
+from utils import archive
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+@pytest.fixture
+def path(tmp_path, monkeypatch):
+    # Items are tagged from data/food_tags.json
+    monkeypatch.chdir(REPO_ROOT)
+    return str(tmp_path / "archive.sqlite3")
+
+def monday(*names):
+    return {"monday": {"KooperativetScraper": {"items": [{"name": name, "category": "Dagens"} for name in names]}}}
+
+def names(path):
+    return [row["name"] for row in archive.query(path=path)]
+
+def test_reingesting_a_day_replaces_its_menu(path):
+    assert archive.ingest_days(monday("Fiskgryta", "Pasta"), "2025-W23", path) == 1
+    assert archive.ingest_days(monday("Fiskgryta", "Pasta"), "2025-W23", path) == 0
+    assert archive.ingest_days(monday("Fiskgryta"), "2025-W23", path) == 1
+    assert names(path) == ["Fiskgryta"]
+
+    archive.ingest_days(monday("Pasta"), "2025-W24", path)
+    assert names(path) == ["Fiskgryta", "Pasta"]
+
+def test_tags_are_keys_matched_whole(path):
+    archive.ingest_days(monday("Fiskgryta"), "2025-W23", path)
+    assert "fish" in archive.query(path=path)[0]["tags"].split()
+    assert archive.count_days(tag="fish", path=path) == 1
+    assert archive.count_days(tag="fis", path=path) == 0
+
+def test_version_1_archive_is_migrated(path):
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE menu_items (restaurant TEXT, week TEXT, day TEXT, position INTEGER, name TEXT, "
+            "category TEXT, description TEXT, price TEXT, tags TEXT, archived_at TEXT, "
+            "PRIMARY KEY (restaurant, week, day, name, category, description, price)) WITHOUT ROWID"
+        )
+        connection.executemany("INSERT INTO menu_items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", [
+            ("KooperativetScraper", "2025-W23", "monday", 0, "Fiskgryta", "", "", "", "🐟", "2025-06-02T10:00:00"),
+            ("KooperativetScraper", "2025-W23", "monday", 1, "Pasta", "", "", "", "", "2025-06-02T10:00:00"),
+            ("KooperativetScraper", "2025-W23", "monday", 1, "Pizza", "", "", "", "", "2025-06-02T11:00:00"),
+        ])
+    connection.close()
+
+    assert names(path) == ["Fiskgryta", "Pizza"]
+    assert archive.count_days(tag="fish", path=path) == 1
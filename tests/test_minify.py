@@ -0,0 +1,72 @@
+# tests/test_minify.py
+
+import os
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+import generate_html
+from utils.minify import minify_html
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The elements minify_html may drop surrounding whitespace at (its _BLOCK_TAG list)
+BLOCK_TAGS = ["html", "head", "body", "title", "header", "footer", "main", "nav", "section",
+              "div", "p", "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "li", "br", "noscript"]
+
+LUNCH_DATA = {
+    "KooperativetScraper": {"day": "monday", "items": [
+        {"name": "Köttbullar", "description": "med  gräddsås\n och lingon", "category": "Kött",
+         "price": "125 kr", "emoji_tags": ["🥩"]},
+        {"name": "Falafel", "description": None, "category": "Vegetariskt", "price": None, "emoji_tags": ["🥦"]},
+    ]},
+    "OishiiScraper": {"day": "monday", "items": [
+        {"name": "Lax <nigiri>", "description": "8 bitar", "category": None, "price": "129 kr", "emoji_tags": []},
+    ]},
+}
+
+ASSETS = {name: f"static/{name}" for name in ("styles.css", "app.js", "icon.svg", "week.json", "search.json",
+                                              "sw.js", "manifest.webmanifest")}
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    # Templates are loaded relative to the repository root
+    monkeypatch.chdir(REPO_ROOT)
+
+def rendered_text(html: str) -> str:
+    """The page's visible text, with whitespace collapsed as a browser does and block boundaries as newlines."""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style"]):
+        tag.decompose()
+    for tag in soup.find_all(BLOCK_TAGS):
+        tag.insert_before("\x01")
+        tag.append("\x01")
+    text = re.sub(r"\s+", " ", soup.get_text())
+    return re.sub(r"[ \x01]*\x01[ \x01]*", "\n", text).strip()
+
+@pytest.mark.parametrize("page", ["summary", "index"])
+def test_minified_page_renders_the_same_text(page):
+    if page == "summary":
+        html = generate_html.render_lunch_summary("monday", LUNCH_DATA, {}, "2025-06-02 10:00")
+    else:
+        html = generate_html.render_index_page(LUNCH_DATA, {}, "monday", "2025-06-02 10:00", ASSETS)
+    minified = minify_html(html)
+
+    assert len(minified) < len(html)
+    assert rendered_text(minified) == rendered_text(html)
+    assert "Köttbullar" in rendered_text(minified)
+
+def test_inline_whitespace_is_collapsed_not_removed():
+    html = "<div>\n  <p>Lax   <b>med</b>\n dill</p>\n</div>"
+    assert minify_html(html) == "<div><p>Lax <b>med</b> dill</p></div>"
+
+def test_scripts_and_pre_are_kept_verbatim():
+    html = "<body>\n<pre>  a\n   b</pre>\n<script>if (a  <  b) { x(); }</script>\n</body>"
+    minified = minify_html(html)
+    assert "<pre>  a\n   b</pre>" in minified
+    assert "<script>if (a  <  b) { x(); }</script>" in minified
+
+def test_comments_are_removed_and_style_is_minified():
+    html = "<head><!-- note -->\n<style>\n  a  {  color: red ; }\n</style></head>"
+    assert minify_html(html) == "<head><style>a{color:red}</style></head>"
@@ -0,0 +1,100 @@
+# tests/test_search.py
+
+import json
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from utils import search
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_JS = os.path.join(REPO_ROOT, "templates", "static", "app.js")
+
+def menu(*items):
+    return {"items": [{"name": name, "description": description, "category": "Lunch"} for name, description in items]}
+
+WEEK = {
+    "monday": {
+        "KooperativetScraper": menu(("Kycklingcurry", "med ris"), ("Räkor", "och aioli")),
+        "OishiiScraper": menu(("Lax nigiri", "8 bitar")),
+    },
+    "tuesday": {
+        "KooperativetScraper": menu(("Kycklingsoppa", None), ("Kycklingcurry", "med ris"),
+                                    ("Curry på linser", "Vegansk")),
+    },
+    "wednesday": None,
+}
+QUERIES = ["kyckling", "curry", "rakor", "RÄKOR", "fish", "lax bitar", "med", "curry lins", "pizza", "ky", ""]
+
+@pytest.fixture(scope="module")
+def index():
+    # Food tag names come from data/food_tags.json
+    cwd = os.getcwd()
+    os.chdir(REPO_ROOT)
+    try:
+        return search.build_index(WEEK)
+    finally:
+        os.chdir(cwd)
+
+def names(results):
+    return [doc[1] for doc in results]
+
+def test_index_lists_each_item_once_with_its_days(index):
+    decoded = search.decode(index)
+    assert decoded["days"] == ["monday", "tuesday"]
+    assert decoded["restaurants"] == ["KooperativetScraper", "OishiiScraper"]
+    curry = [doc for doc in decoded["docs"] if doc[1] == "Kycklingcurry"]
+    assert curry == [[0, "Kycklingcurry", "med ris", [0, 1]]]
+    assert decoded["terms"] == sorted(decoded["terms"])
+    assert "med" not in decoded["terms"]  # stopword
+    assert all(postings == sorted(postings) for postings in decoded["postings"])
+
+def test_prefix_infix_folding_and_tags(index):
+    decoded = search.decode(index)
+    assert names(search.search(decoded, "kyck")) == ["Kycklingcurry", "Kycklingsoppa"]
+    # Prefix matches rank above matches inside a compound
+    assert names(search.search(decoded, "curry")) == ["Curry på linser", "Kycklingcurry"]
+    assert names(search.search(decoded, "Rakor")) == names(search.search(decoded, "räkor")) == ["Räkor"]
+    assert "Lax nigiri" in names(search.search(decoded, "fish"))
+    assert names(search.search(decoded, "lax bitar")) == ["Lax nigiri"]
+    assert search.search(decoded, "lax pizza") == []
+    assert search.search(decoded, "med") == []
+
+def test_dishes_served_on_the_day_rank_first(index):
+    decoded = search.decode(index)
+    assert names(search.search(decoded, "curry", day="tuesday")) == ["Curry på linser", "Kycklingcurry"]
+    assert names(search.search(decoded, "ris kyckling", day="monday")) == ["Kycklingcurry"]
+    # Then dishes served on more days
+    assert names(search.search(decoded, "kyckling", day="tuesday")) == ["Kycklingcurry", "Kycklingsoppa"]
+    assert names(search.search(decoded, "soppa", day="monday")) == ["Kycklingsoppa"]
+    assert len(search.search(decoded, "l", limit=2)) == 2
+
+def test_app_js_uses_the_same_tokenizer_settings():
+    with open(APP_JS, encoding="utf-8") as f:
+        source = f.read()
+    stopwords = re.search(r"const STOPWORDS = new Set\('([^']*)'", source).group(1).split()
+    assert frozenset(stopwords) == search.STOPWORDS
+    assert int(re.search(r"const MIN_INFIX_LENGTH = (\d+);", source).group(1)) == search.MIN_INFIX_LENGTH
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+def test_app_js_returns_the_same_results(index):
+    with open(APP_JS, encoding="utf-8") as f:
+        source = f.read()
+    # The search code only: the rest of app.js needs a DOM
+    functions = source[source.index("const MIN_INFIX_LENGTH"):source.index("function loadSearchIndex")]
+    functions += source[source.index("function lowerBound"):source.index("function openResult")]
+    script = functions + """
+const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const index = input.index;
+index.postings = index.postings.map(gaps => { let total = 0; return gaps.map(gap => (total += gap)); });
+console.log(JSON.stringify(input.queries.map(([query, day]) => searchMenus(index, query, day, 20))));
+"""
+    cases = [(query, day) for query in QUERIES for day in ("monday", "tuesday")]
+    output = subprocess.run(["node", "-e", script], input=json.dumps({"index": index, "queries": cases}),
+                            capture_output=True, text=True, encoding="utf-8", check=True).stdout
+
+    decoded = search.decode(index)
+    assert json.loads(output) == [search.search(decoded, query, day) for query, day in cases]
@@ -0,0 +1,74 @@
+# tests/test_store.py
+
+import os
+import shutil
+from datetime import date, timedelta
+
+import pytest
+
+from utils import store
+from utils.archive import week_label
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+THIS_WEEK = week_label(date.today())
+LAST_WEEK = week_label(date.today() - timedelta(weeks=1))
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    # Both stores read data/food_tags.json and the JSON store writes data/lunch_data_<day>.json
+    (tmp_path / "data").mkdir()
+    shutil.copy(os.path.join(REPO_ROOT, "data", "food_tags.json"), tmp_path / "data")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+@pytest.fixture(params=["json", "sqlite"])
+def menu_store(request, data_dir):
+    if request.param == "sqlite":
+        return store.SqliteStore(str(data_dir / "data" / "lunch.sqlite3"))
+    return store.JsonStore(str(data_dir / "data" / "lunch_week.json"))
+
+def menu(day, *names):
+    return {"day": day, "items": [{"name": name, "category": "Dagens", "description": "", "price": "125 kr"}
+                                  for name in names]}
+
+def scrape(menu_store, week, results_by_day):
+    run_id = menu_store.start_run(week, list(results_by_day))
+    by_scraper = {}
+    for day, results in results_by_day.items():
+        for scraper_name, day_menu in results.items():
+            by_scraper.setdefault(scraper_name, {})[day] = day_menu
+    for scraper_name, menus in by_scraper.items():
+        menu_store.save_menus(run_id, scraper_name, menus)
+    return menu_store.finish_run(run_id, results_by_day)
+
+def items(lunch_data, scraper_name):
+    return [item["name"] for item in lunch_data[scraper_name]["items"]]
+
+def test_saved_menus_load_back_tagged(menu_store):
+    assert scrape(menu_store, THIS_WEEK, {
+        "monday": {"KooperativetScraper": menu("monday", "Fiskgryta", "Pasta"), "OishiiScraper": menu("monday", "Lax")},
+    })
+    monday = menu_store.load_day("monday")
+
+    assert list(monday) == ["KooperativetScraper", "OishiiScraper"]
+    assert items(monday, "KooperativetScraper") == ["Fiskgryta", "Pasta"]
+    assert monday["KooperativetScraper"]["items"][0]["emoji_tags"]
+    assert menu_store.load_day("tuesday") is None
+
+def test_a_new_scrape_replaces_the_day(menu_store):
+    scrape(menu_store, THIS_WEEK, {"monday": {"KooperativetScraper": menu("monday", "Fiskgryta", "Pasta")}})
+    key = menu_store.day_key("monday")
+    assert not scrape(menu_store, THIS_WEEK, {"monday": {"KooperativetScraper": menu("monday", "Fiskgryta", "Pasta")}})
+    assert menu_store.day_key("monday") == key
+
+    scrape(menu_store, THIS_WEEK, {"monday": {"KooperativetScraper": menu("monday", "Pizza")}})
+    assert items(menu_store.load_day("monday"), "KooperativetScraper") == ["Pizza"]
+    assert menu_store.day_key("monday") != key
+
+def test_has_day_means_scraped_this_week(menu_store):
+    scrape(menu_store, LAST_WEEK, {"monday": {"KooperativetScraper": menu("monday", "Pasta")}})
+    assert not menu_store.has_day("monday")
+
+    scrape(menu_store, THIS_WEEK, {"tuesday": {"KooperativetScraper": menu("tuesday", "Pasta")}})
+    assert menu_store.has_day("tuesday")
+    assert not menu_store.has_day("monday")
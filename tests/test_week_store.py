@@ -0,0 +1,73 @@
+# tests/test_week_store.py
+
+import json
+
+import pytest
+
+from utils import week_store
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    # Without a store file, load_week() falls back to data/lunch_data_<day>.json in the working directory
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+def menu(day, *names):
+    return {"day": day, "items": [{"name": name, "category": "Dagens", "description": None, "price": "125 kr"}
+                                  for name in names]}
+
+def test_days_round_trip_through_the_store():
+    week = week_store._empty_week()
+    monday = {"KooperativetScraper": menu("monday", "Köttbullar", "Falafel"), "OishiiScraper": menu("monday", "Lax")}
+    tuesday = {"KooperativetScraper": menu("tuesday", "Falafel", "Fiskgratäng")}
+    week_store.set_day(week, "monday", monday)
+    week_store.set_day(week, "tuesday", tuesday)
+
+    assert week_store.day_data(week, "monday") == monday
+    assert week_store.day_data(week, "tuesday") == tuesday
+    assert week_store.day_data(week, "friday") is None
+    # Falafel is served on both days but stored once
+    assert [item["name"] for item in week["items"]["KooperativetScraper"]] == ["Köttbullar", "Falafel", "Fiskgratäng"]
+
+def test_replacing_a_day_drops_unused_items_and_renumbers():
+    week = week_store._empty_week()
+    week_store.set_day(week, "monday", {"KooperativetScraper": menu("monday", "Köttbullar", "Falafel"),
+                                        "OishiiScraper": menu("monday", "Lax")})
+    week_store.set_day(week, "tuesday", {"KooperativetScraper": menu("tuesday", "Falafel")})
+    week_store.set_day(week, "monday", {"KooperativetScraper": menu("monday", "Pasta")})
+
+    assert "OishiiScraper" not in week["items"]
+    assert [item["name"] for item in week["items"]["KooperativetScraper"]] == ["Falafel", "Pasta"]
+    assert week_store.day_data(week, "tuesday") == {"KooperativetScraper": menu("tuesday", "Falafel")}
+    assert week_store.day_data(week, "monday") == {"KooperativetScraper": menu("monday", "Pasta")}
+
+def test_update_saves_and_reloads(data_dir):
+    path = str(data_dir / "lunch_week.json")
+    monday = {"KooperativetScraper": menu("monday", "Köttbullar")}
+
+    assert week_store.update({"monday": monday, "tuesday": {}}, path, "2025-W23")
+    assert not week_store.update({"monday": monday}, path, "2025-W23")  # unchanged, not rewritten
+    assert week_store.has_day("monday", "2025-W23", path)
+    assert not week_store.has_day("monday", "2025-W24", path)
+    assert not week_store.has_day("tuesday", "2025-W23", path)
+    assert week_store.day_data(week_store.load_week(path), "monday") == monday
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["version"] == week_store.STORE_VERSION
+
+def test_days_without_results_keep_their_menus(data_dir):
+    path = str(data_dir / "lunch_week.json")
+    monday = {"KooperativetScraper": menu("monday", "Köttbullar")}
+    week_store.update({"monday": monday}, path)
+    week_store.update({"monday": {}, "tuesday": {"KooperativetScraper": menu("tuesday", "Pasta")}}, path)
+
+    week = week_store.load_week(path)
+    assert week_store.day_data(week, "monday") == monday
+    assert week_store.day_data(week, "tuesday") == {"KooperativetScraper": menu("tuesday", "Pasta")}
+
+def test_store_is_built_from_older_per_day_files(data_dir):
+    (data_dir / "data").mkdir()
+    monday = {"KooperativetScraper": menu("monday", "Köttbullar")}
+    (data_dir / "data" / "lunch_data_monday.json").write_text(json.dumps(monday), encoding="utf-8")
+
+    week = week_store.load_week(str(data_dir / "data" / "lunch_week.json"))
+    assert week_store.day_data(week, "monday") == monday
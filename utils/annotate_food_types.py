@@ -1,53 +1,193 @@
+import hashlib
 import json
 import re
+import threading
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from utils import manifest, metrics
 
 def load_keywords():
     with open("data/food_tags.json", encoding="utf-8") as f:
         return json.load(f)
 
-import json
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex alternation of `words` nested by shared prefix, preferring the longest match."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
 
-def load_keywords():
-    with open("data/food_tags.json", encoding="utf-8") as f:
-        return json.load(f)
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A word ends here: the longer continuations are optional (and tried first)
+        return f"(?:{body})?" if "" in node else body
 
-def annotate_file(filename: str):
-    with open(filename, encoding="utf-8") as f:
-        data = json.load(f)
+    return build(trie)
 
-    tag_data = load_keywords()
+class FoodTagMatcher:
+    """
+    All keywords of `food_tags.json` compiled once, so a text is tagged in a
+    single pass instead of one substring search per keyword.
 
-    for scraper_name, menu in data.items():
-        # Combine name, description, and category into a searchable text block
-        text_parts = []
-        for item in menu.get("items", []):
-            text_parts.append(item.get("name", ""))
-            text_parts.append(item.get("description", ""))
-            text_parts.append(item.get("category", ""))
+    Keywords match anywhere in the text, as plain substrings: Swedish compounds
+    like "regnbågslax" or "fiskgryta" must still hit "lax" and "fisk". A keyword
+    without spaces can only occur inside one whitespace-separated token, so
+    tokens are matched with one compiled regex and memoized (menu vocabulary is
+    small); the few multi-word keywords are looked up in the whole text.
+    Tags are memoized by normalized text too, since weekly items repeat every day.
+    """
+    def __init__(self, tag_data: dict):
+        keyword_tags: Dict[str, Set[str]] = defaultdict(set)
+        for tag, info in tag_data.items():
+            for keyword in info["keywords"]:
+                if keyword.strip():
+                    keyword_tags[keyword.lower()].add(tag)
 
-        full_text = " ".join(text_parts).lower()
+        words = {keyword: tags for keyword, tags in keyword_tags.items() if len(keyword.split()) == 1}
+        self._phrases = [(keyword, frozenset(tags)) for keyword, tags in keyword_tags.items() if keyword not in words]
 
-        matched_tags = []
+        # The scan reports only the longest keyword starting at each position, so a
+        # keyword carries the tags of every keyword it contains ("fiskgratäng" ⊃ "fisk")
+        self._word_tags: Dict[str, FrozenSet[str]] = {
+            word: frozenset().union(*(tags for other, tags in words.items() if other in word))
+            for word in words
+        }
+        # Zero-width lookahead: try every position, so overlapping keywords are all found
+        self._pattern = re.compile(f"(?=({_trie_pattern(words)}))")
+        self._token_cache: Dict[str, FrozenSet[str]] = {}
+        self._text_cache: Dict[str, FrozenSet[str]] = {}
+        self._emoji_cache: Dict[FrozenSet[str], Tuple[str, ...]] = {}
 
-        for tag, info in tag_data.items():
-            keywords = [kw.lower() for kw in info["keywords"]]
-            emoji = info["emoji"]
-            priority = info.get("priority", 100)  # Default priority if missing
-            if any(kw in full_text for kw in keywords):
-                matched_tags.append((priority, emoji))
+        # Changes whenever food_tags.json changes in content, not just in formatting
+        self.fingerprint = hashlib.sha256(
+            json.dumps(tag_data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+
+        self._emoji = {tag: info["emoji"] for tag, info in tag_data.items()}
+        self._priority = {tag: info.get("priority", 100) for tag, info in tag_data.items()}  # Default priority if missing
+
+    def _token_tags(self, token: str) -> FrozenSet[str]:
+        tags = self._token_cache.get(token)
+        if tags is None:
+            found = {match.group(1) for match in self._pattern.finditer(token)}
+            tags = frozenset().union(*(self._word_tags[word] for word in found))
+            self._token_cache[token] = tags
+        return tags
+
+    def tags(self, text: str) -> FrozenSet[str]:
+        """Every tag with a keyword occurring in `text` (case-insensitive, whitespace-insensitive)."""
+        tokens = text.lower().split()
+        text = " ".join(tokens)
+        tags = self._text_cache.get(text)
+        if tags is None:
+            tags = self._text_cache[text] = frozenset(self._match(text, tokens))
+        return tags
+
+    def _match(self, text: str, tokens: List[str]) -> Set[str]:
+        cache = self._token_cache
+        tags: Set[str] = set()
+        for token in tokens:
+            token_tags = cache.get(token)
+            if token_tags is None:
+                token_tags = self._token_tags(token)
+            if token_tags:
+                tags |= token_tags
+        for phrase, phrase_tags in self._phrases:
+            if phrase in text:
+                tags |= phrase_tags
+        return tags
+
+    def emojis(self, tags: Iterable[str]) -> List[str]:
+        """Emojis for `tags`, sorted by priority, without duplicates."""
+        tags = frozenset(tags)
+        cached = self._emoji_cache.get(tags)
+        if cached is not None:
+            return list(cached)
 
-        # Sort by priority and keep only unique emojis
         sorted_emojis = []
         seen = set()
-        for _, emoji in sorted(matched_tags):
+        for _, emoji in sorted((self._priority[tag], self._emoji[tag]) for tag in tags):
             if emoji not in seen:
                 sorted_emojis.append(emoji)
                 seen.add(emoji)
+        self._emoji_cache[tags] = tuple(sorted_emojis)
+        return sorted_emojis
+
+    def tag_items(self, items: List[dict]) -> Tuple[List[List[str]], List[str]]:
+        """
+        Tag serialized menu items in one pass.
+        Returns (emojis per item, emojis for the whole restaurant).
+        """
+        per_item = []
+        restaurant_tags: Set[str] = set()
+        for item in items:
+            # Combine name, description, and category into a searchable text block
+            text = " ".join(item.get(field) or "" for field in ("name", "description", "category"))
+            tags = self.tags(text)
+            per_item.append(self.emojis(tags))
+            restaurant_tags |= tags
+        return per_item, self.emojis(restaurant_tags)
+
+_matcher: Optional[FoodTagMatcher] = None
+_matcher_lock = threading.Lock()
 
-        menu["emoji_tags"] = sorted_emojis
+def get_matcher() -> FoodTagMatcher:
+    """Return the process-wide matcher, reading food_tags.json on first use only."""
+    global _matcher
+    with _matcher_lock:
+        if _matcher is None:
+            _matcher = FoodTagMatcher(load_keywords())
+        return _matcher
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def annotate_menus(data: dict) -> dict:
+    """Set `emoji_tags` on every item and restaurant of a day's lunch data, in place."""
+    matcher = get_matcher()
+    for scraper_name, menu in data.items():
+        items = menu.get("items", [])
+        # Tag each dish on its own; the restaurant gets the union of its dishes' tags
+        item_emojis, menu["emoji_tags"] = matcher.tag_items(items)
+        for item, emojis in zip(items, item_emojis):
+            item["emoji_tags"] = emojis
+    return data
+
+def annotation_key(data: dict) -> str:
+    """Hash of the menu content (ignoring existing tags) plus the food tag definitions."""
+    content = {
+        scraper_name: {
+            **{key: value for key, value in menu.items() if key != "emoji_tags"},
+            "items": [
+                {key: value for key, value in item.items() if key != "emoji_tags"}
+                for item in menu.get("items", [])
+            ],
+        }
+        for scraper_name, menu in data.items()
+    }
+    digest = hashlib.sha256(json.dumps(content, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    digest.update(get_matcher().fingerprint.encode("ascii"))
+    return digest.hexdigest()
+
+@metrics.stage("annotate")
+def write_annotated(filename: str, data: dict) -> bool:
+    """
+    Annotate `data` and write it to `filename`, unless the file already holds
+    this content annotated with the current tags. Returns True if it was written.
+    """
+    key = annotation_key(data)
+    if manifest.is_current(filename, key):
+        print(f"[INFO] {filename} unchanged, not rewritten")
+        return False
 
-    print(f"[INFO] Annotated emoji tags in {filename} (prioritized & fuzzy match)")
+    manifest.write_json_atomic(filename, annotate_menus(data))
+    manifest.record(filename, key)
+    print(f"[INFO] Annotated emoji tags in {filename} (per item, prioritized)")
+    return True
 
+def annotate_file(filename: str) -> bool:
+    with open(filename, encoding="utf-8") as f:
+        data = json.load(f)
+    return write_annotated(filename, data)
@@ -0,0 +1,196 @@
+import argparse
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils import manifest
+from utils.annotate_food_types import get_matcher
+
+# Every menu item ever scraped, by ISO week, day and restaurant. Past weeks are
+# kept; a re-scrape of a day replaces that restaurant's archived menu for the day.
+ARCHIVE_PATH = os.path.join("data", "menu_archive.sqlite3")
+
+# The primary key doubles as the (restaurant, week, day) index.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS menu_items (
+    restaurant  TEXT NOT NULL,  -- scraper name, e.g. "KooperativetScraper"
+    week        TEXT NOT NULL,  -- ISO week, e.g. "2025-W23"
+    day         TEXT NOT NULL,  -- "monday" .. "friday"
+    position    INTEGER NOT NULL,
+    name        TEXT NOT NULL,
+    category    TEXT NOT NULL,
+    description TEXT NOT NULL,
+    price       TEXT NOT NULL,
+    tags        TEXT NOT NULL,  -- food_tags.json keys, space separated, e.g. "fish vegetarian"
+    archived_at TEXT NOT NULL,
+    PRIMARY KEY (restaurant, week, day, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS menu_items_week ON menu_items (week, day);
+"""
+# PRAGMA user_version of the current schema. Version 1 keyed items by their
+# fields (re-archiving only ever added rows) and stored emoji tags.
+SCHEMA_VERSION = 2
+
+ITEM_FIELDS = ("name", "category", "description", "price")
+
+WEEKDAY_ORDER = "CASE day WHEN 'monday' THEN 1 WHEN 'tuesday' THEN 2 WHEN 'wednesday' THEN 3 " \
+                "WHEN 'thursday' THEN 4 WHEN 'friday' THEN 5 ELSE 6 END"
+
+def week_label(day: date) -> str:
+    """ISO week label, e.g. "2025-W23" (the same labels as scraper snapshots)."""
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+def _tags(fields: Tuple[str, ...]) -> str:
+    name, category, description, _ = fields
+    return " ".join(sorted(get_matcher().tags(f"{name} {description} {category}")))
+
+def _migrate(connection: sqlite3.Connection) -> None:
+    """
+    Move a version 1 archive to the current schema. Of the items archived at
+    the same position of a menu, the last one archived is kept; tags are recomputed.
+    """
+    # One transaction: executescript() would commit halfway through
+    connection.execute("BEGIN")
+    (tables,) = connection.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'menu_items'").fetchone()
+    if tables:
+        old_rows = connection.execute(
+            "SELECT restaurant, week, day, position, name, category, description, price, archived_at "
+            "FROM menu_items ORDER BY archived_at"
+        ).fetchall()
+        latest = {row[:4]: row for row in old_rows}
+        connection.execute("DROP TABLE menu_items")
+        for statement in SCHEMA.split(";"):
+            connection.execute(statement)
+        connection.executemany(
+            "INSERT INTO menu_items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(*row[:8], _tags(row[4:8]), row[8]) for row in latest.values()],
+        )
+    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+def connect(path: str = ARCHIVE_PATH) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    connection = sqlite3.connect(path)
+    if connection.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        with connection:
+            _migrate(connection)
+    connection.executescript(SCHEMA)
+    return connection
+
+def ingest_days(days: Dict[str, dict], week: str, path: str = ARCHIVE_PATH) -> int:
+    """
+    Archive `days` ({day: {scraper name: menu}}) of `week` in one transaction.
+    Each restaurant's menu for a day replaces the one archived before, so dishes
+    dropped from a corrected menu leave the archive. Returns the number of
+    restaurant menus that were new or changed.
+    """
+    archived_at = datetime.now().isoformat(timespec="seconds")
+    changed = 0
+    with closing(connect(path)) as connection, connection:
+        for day, lunch_data in days.items():
+            for restaurant, menu in lunch_data.items():
+                key = (restaurant, week, day)
+                items = [tuple(item.get(field) or "" for field in ITEM_FIELDS) for item in menu.get("items", [])]
+                stored = connection.execute(
+                    "SELECT name, category, description, price FROM menu_items "
+                    "WHERE restaurant = ? AND week = ? AND day = ? ORDER BY position", key
+                ).fetchall()
+                # Unchanged menus keep the time they were first archived
+                if stored == items:
+                    continue
+                connection.execute("DELETE FROM menu_items WHERE restaurant = ? AND week = ? AND day = ?", key)
+                connection.executemany(
+                    "INSERT INTO menu_items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(*key, position, *fields, _tags(fields), archived_at) for position, fields in enumerate(items)],
+                )
+                changed += 1
+    return changed
+
+def ingest_files(filenames: Iterable[str], path: str = ARCHIVE_PATH) -> int:
+    """
+    Bulk-archive existing data/lunch_data_<day>.json files. Each file is filed
+    under the ISO week it was last updated in (from the data manifest, else its mtime).
+    """
+    by_week: Dict[str, Dict[str, dict]] = {}
+    for filename in filenames:
+        day = os.path.basename(filename)[len("lunch_data_"):-len(".json")]
+        updated = manifest.last_updated(filename)
+        when = updated.date() if updated else date.fromtimestamp(os.path.getmtime(filename))
+        with open(filename, encoding="utf-8") as f:
+            by_week.setdefault(week_label(when), {})[day] = json.load(f)
+    return sum(ingest_days(days, week, path) for week, days in sorted(by_week.items()))
+
+def _where(restaurant: Optional[str], tag: Optional[str], text: Optional[str],
+           since: Optional[str], until: Optional[str]) -> Tuple[str, list]:
+    conditions = []
+    params = []
+    if restaurant:
+        conditions.append("restaurant = ?")
+        params.append(restaurant if restaurant.endswith("Scraper") else restaurant + "Scraper")
+    if tag:
+        # Whole tag keys only: "fish" must not match "shellfish"
+        conditions.append("instr(' ' || tags || ' ', ?) > 0")
+        params.append(f" {tag} ")
+    if text:
+        conditions.append("(name LIKE ? OR description LIKE ? OR category LIKE ?)")
+        params.extend([f"%{text}%"] * 3)
+    if since:
+        conditions.append("week >= ?")
+        params.append(since)
+    if until:
+        conditions.append("week <= ?")
+        params.append(until)
+    return (f"WHERE {' AND '.join(conditions)}" if conditions else ""), params
+
+def query(restaurant: Optional[str] = None, tag: Optional[str] = None, text: Optional[str] = None,
+          since: Optional[str] = None, until: Optional[str] = None, path: str = ARCHIVE_PATH) -> List[dict]:
+    """
+    Archived items, oldest first, filtered by restaurant (scraper name, with or
+    without the "Scraper" suffix), food tag key ("fish"), text in name/description/category
+    (case-insensitive for ASCII) and ISO week range (inclusive).
+    """
+    where, params = _where(restaurant, tag, text, since, until)
+    with closing(connect(path)) as connection:
+        connection.row_factory = sqlite3.Row
+        rows = connection.execute(
+            f"SELECT * FROM menu_items {where} ORDER BY week, {WEEKDAY_ORDER}, restaurant, position", params
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+def count_days(restaurant: Optional[str] = None, tag: Optional[str] = None, text: Optional[str] = None,
+               since: Optional[str] = None, until: Optional[str] = None, path: str = ARCHIVE_PATH) -> int:
+    """On how many days at least one item matched, e.g. how often a restaurant served fish."""
+    where, params = _where(restaurant, tag, text, since, until)
+    with closing(connect(path)) as connection:
+        return connection.execute(
+            f"SELECT COUNT(*) FROM (SELECT DISTINCT week, day FROM menu_items {where})", params
+        ).fetchone()[0]
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive and query historical lunch menus.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest_parser = commands.add_parser("ingest", help="Archive existing per-day data files")
+    ingest_parser.add_argument("files", nargs="+", help="data/lunch_data_<day>.json files")
+    query_parser = commands.add_parser("query", help="List archived items")
+    for option in ("--restaurant", "--tag", "--text", "--since", "--until"):
+        query_parser.add_argument(option)
+    args = parser.parse_args()
+
+    if args.command == "ingest":
+        print(f"[INFO] Archived {ingest_files(args.files)} new or changed menus in {ARCHIVE_PATH}")
+        return
+
+    start = time.perf_counter()
+    rows = query(args.restaurant, args.tag, args.text, args.since, args.until)
+    elapsed = time.perf_counter() - start
+    for row in rows:
+        print(f"{row['week']} {row['day']:<9} {row['restaurant']:<24} {row['tags']:<16} {row['name']} {row['description']}")
+    days = len({(row["week"], row["day"]) for row in rows})
+    print(f"[INFO] {len(rows)} items on {days} days ({elapsed * 1000:.1f} ms)")
+
+if __name__ == "__main__":
+    main()
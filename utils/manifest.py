@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Optional
+
+# Content key and last change time of every generated data file, keyed by file name
+MANIFEST_PATH = os.path.join("data", "manifest.json")
+
+_lock = threading.Lock()
+
+# Read once at import: os.umask can only be queried by setting it, which is not thread-safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def write_bytes_atomic(path: str, data: bytes) -> None:
+    """
+    Write `data` via a temp file and rename, so readers never see a partial file.
+    The file gets the usual permissions for new files (mkstemp's are owner-only),
+    so static servers running as another user can read the output.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    """Atomically write `data` to `path` unless the file already holds exactly these bytes."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    write_bytes_atomic(path, data)
+    return True
+
+def write_json_atomic(path: str, data) -> None:
+    """Write `data` as JSON (indent=2, UTF-8) atomically."""
+    write_bytes_atomic(path, json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"))
+
+def load_manifest(path: str = MANIFEST_PATH) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def is_current(filename: str, key: str, path: str = MANIFEST_PATH) -> bool:
+    """True when `filename` exists and was last written from content with this key."""
+    entry = load_manifest(path).get(os.path.basename(filename))
+    return bool(entry) and entry.get("key") == key and os.path.exists(filename)
+
+def record(filename: str, key: str, path: str = MANIFEST_PATH) -> None:
+    """
+    Note that `filename` was just written from content with this key. The
+    "updated" time only moves when the key changes: re-exporting a derived
+    file with the same content is not an update.
+    """
+    with _lock:
+        manifest = load_manifest(path)
+        entry = manifest.get(os.path.basename(filename)) or {}
+        if entry.get("key") != key or not entry.get("updated"):
+            entry = {"key": key, "updated": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+        manifest[os.path.basename(filename)] = entry
+        write_json_atomic(path, dict(sorted(manifest.items())))
+
+def last_updated(filename: str, path: str = MANIFEST_PATH) -> Optional[datetime]:
+    """When the content of `filename` last changed, if the manifest knows it."""
+    entry = load_manifest(path).get(os.path.basename(filename))
+    if not entry or not entry.get("updated"):
+        return None
+    return datetime.fromisoformat(entry["updated"])
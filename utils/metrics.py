@@ -0,0 +1,143 @@
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+_lock = threading.Lock()
+_metrics: Dict[str, List[float]] = defaultdict(list)
+_counters: Dict[str, int] = defaultdict(int)
+
+_started_at = datetime.now(timezone.utc)
+_started = time.perf_counter()
+
+STAGE_PREFIX = "stage_seconds."
+
+# cProfile state for --profile: one profiler at a time, keeping only the slowest stage
+_profiling = False
+_profiler_slot = threading.Lock()
+_slowest_profile = None  # (seconds, stage name, cProfile.Profile)
+
+def record(name: str, value: float) -> None:
+    """Record one observation of the metric `name` (e.g. "render_seconds.LsKitchenScraper")."""
+    with _lock:
+        _metrics[name].append(value)
+
+def increment(name: str, amount: int = 1) -> None:
+    """Add `amount` to the counter `name` (e.g. "retries.BistrotScraper")."""
+    with _lock:
+        _counters[name] += amount
+
+def get_metrics() -> Dict[str, List[float]]:
+    """Return a copy of every metric recorded so far in this process."""
+    with _lock:
+        return {name: list(values) for name, values in _metrics.items()}
+
+def get_counters() -> Dict[str, int]:
+    with _lock:
+        return dict(_counters)
+
+def enable_profiling() -> None:
+    """Profile every stage with cProfile so the slowest one can be dumped at the end of the run."""
+    global _profiling
+    _profiling = True
+
+@contextmanager
+def stage(name: str, profile: bool = True):
+    """
+    Time a pipeline stage and record it as "stage_seconds.<name>".
+    Usable as a context manager or a decorator.
+
+    With profiling enabled the stage also runs under cProfile, unless another
+    stage is already being profiled (pass profile=False for stages that wrap others).
+    """
+    global _slowest_profile
+    profiler = None
+    if _profiling and profile and _profiler_slot.acquire(blocking=False):
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        record(f"{STAGE_PREFIX}{name}", elapsed)
+        if profiler is not None:
+            profiler.disable()
+            _profiler_slot.release()
+            with _lock:
+                if _slowest_profile is None or elapsed > _slowest_profile[0]:
+                    _slowest_profile = (elapsed, name, profiler)
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MiB (None where `resource` is unavailable, e.g. Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere
+    if sys.platform == "darwin":
+        peak /= 1024
+    return round(peak / 1024, 1)
+
+def build_report() -> dict:
+    """Summarize stage durations, counters and other metrics recorded in this process."""
+    metrics = get_metrics()
+    stages = {}
+    other = {}
+    for name, values in metrics.items():
+        if name.startswith(STAGE_PREFIX):
+            stages[name[len(STAGE_PREFIX):]] = {
+                "count": len(values),
+                "total_seconds": round(sum(values), 4),
+                "max_seconds": round(max(values), 4),
+            }
+        else:
+            other[name] = values
+
+    return {
+        "started": _started_at.isoformat(timespec="seconds"),
+        "wall_seconds": round(time.perf_counter() - _started, 3),
+        "peak_rss_mb": peak_rss_mb(),
+        # Slowest first, like the scraper timing log
+        "stages": dict(sorted(stages.items(), key=lambda kv: kv[1]["total_seconds"], reverse=True)),
+        "counters": dict(sorted(get_counters().items())),
+        "metrics": other,
+    }
+
+def write_report(path: str, **extra) -> dict:
+    """Write the run report (plus any `extra` fields) to `path` as JSON and return it."""
+    report = build_report()
+    report.update(extra)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return report
+
+def dump_slowest_profile(path: str, limit: int = 25) -> Optional[str]:
+    """
+    Print the top `limit` functions (by cumulative time) of the slowest profiled
+    stage and save its full stats to `path`. Returns the stage name, if any.
+    """
+    with _lock:
+        slowest = _slowest_profile
+    if slowest is None:
+        print("[INFO] No stage was profiled.")
+        return None
+
+    elapsed, name, profiler = slowest
+    print(f"[INFO] Slowest profiled stage: {name} ({elapsed:.2f}s)")
+    stats = pstats.Stats(profiler)
+    stats.sort_stats("cumulative").print_stats(limit)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    stats.dump_stats(path)
+    print(f"[INFO] Saved profile of {name} to {path}")
+    return name
@@ -0,0 +1,52 @@
+import re
+
+# Elements whose content is kept as written (style content is minified as CSS)
+_RAW_ELEMENT = re.compile(r"<(script|style|pre|textarea)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+# Whitespace next to these tags never renders, so it can be dropped instead of collapsed
+_BLOCK_TAG = re.compile(
+    r"\s*(</?(?:html|head|body|meta|link|title|header|footer|main|nav|section|div|p|h[1-6]|ul|ol|li|br|noscript)\b[^>]*>)\s*",
+    re.IGNORECASE,
+)
+_COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_STRING = re.compile(r"\"[^\"]*\"|'[^']*'")
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+
+def minify_css(css: str) -> str:
+    """Drop comments and the whitespace around CSS punctuation. Quoted strings are left alone."""
+    strings = []
+
+    def stash(match):
+        strings.append(match.group(0))
+        return f"\x00{len(strings) - 1}\x00"
+
+    css = _CSS_STRING.sub(stash, _CSS_COMMENT.sub("", css))
+    css = _CSS_PUNCTUATION.sub(r"\1", _WHITESPACE.sub(" ", css))
+    css = css.replace(": ", ":").replace(";}", "}").strip()
+    return re.sub(r"\x00(\d+)\x00", lambda match: strings[int(match.group(1))], css)
+
+def minify_html(html: str) -> str:
+    """
+    Remove comments and indentation from HTML without changing how it renders:
+    whitespace runs collapse to one space, and disappear next to block-level tags.
+    Scripts, <pre> and <textarea> are kept verbatim; inline styles are minified.
+    """
+    raw = []
+
+    def stash(match):
+        element = match.group(0)
+        if match.group(1).lower() == "style":
+            start = element.index(">") + 1
+            end = element.rindex("<")
+            element = element[:start] + minify_css(element[start:end]) + element[end:]
+        raw.append(element)
+        # Scripts and styles render nothing, so they are treated like block tags
+        return f"<\x00{len(raw) - 1}\x00>"
+
+    html = _RAW_ELEMENT.sub(stash, html)
+    html = _WHITESPACE.sub(" ", _COMMENT.sub("", html))
+    html = _BLOCK_TAG.sub(r"\1", html)
+    html = re.sub(r"\s*<\x00(\d+)\x00>\s*", lambda match: raw[int(match.group(1))], html)
+    return html.strip()
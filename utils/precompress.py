@@ -0,0 +1,89 @@
+import gzip
+import os
+from typing import List, NamedTuple, Optional
+
+from utils import manifest, metrics
+
+try:
+    import brotli
+except ImportError:  # .br siblings are skipped without the optional `brotli` package
+    brotli = None
+
+# Text files worth serving pre-compressed (nginx gzip_static / brotli_static)
+COMPRESSIBLE_EXTENSIONS = (".html", ".json", ".css", ".js", ".xml", ".txt", ".svg", ".webmanifest")
+ENCODINGS = (".gz", ".br")
+
+class CompressedFile(NamedTuple):
+    path: str
+    size: int
+    gzip_size: int
+    brotli_size: Optional[int]
+
+def gzip_bytes(data: bytes) -> bytes:
+    """Gzip at maximum level with mtime 0 and no file name, so equal input gives equal bytes."""
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+def brotli_bytes(data: bytes) -> Optional[bytes]:
+    if brotli is None:
+        return None
+    return brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+
+def _write_sibling(path: str, data: Optional[bytes], size: int) -> Optional[int]:
+    """
+    Write `data` to `path` unless it holds these bytes already. A sibling that is
+    no smaller than the original is removed instead: serving it would only cost.
+    """
+    if data is None or len(data) >= size:
+        if os.path.exists(path):
+            os.remove(path)
+        return None
+    manifest.write_if_changed(path, data)
+    return len(data)
+
+def compress_file(path: str) -> CompressedFile:
+    """Write `<path>.gz` and `<path>.br` next to `path`."""
+    with open(path, "rb") as f:
+        data = f.read()
+    gzip_size = _write_sibling(path + ".gz", gzip_bytes(data), len(data))
+    brotli_size = _write_sibling(path + ".br", brotli_bytes(data), len(data))
+    return CompressedFile(path, len(data), gzip_size or len(data), brotli_size)
+
+@metrics.stage("precompress")
+def compress_tree(directory: str) -> List[CompressedFile]:
+    """
+    Pre-compress every text file under `directory` and delete siblings whose
+    original is gone (e.g. a previous build of a hashed asset).
+    """
+    results = []
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            stem, ext = os.path.splitext(path)
+            if ext in ENCODINGS:
+                if not os.path.exists(stem):
+                    os.remove(path)
+            elif ext in COMPRESSIBLE_EXTENSIONS:
+                results.append(compress_file(path))
+
+    for result in results:
+        metrics.increment("bytes_output", result.size)
+        metrics.increment("bytes_output_gzip", result.gzip_size)
+    return results
+
+def print_size_report(results: List[CompressedFile]) -> None:
+    """Print size and compression ratio (original / compressed) of every file."""
+    def ratio(size: int, compressed: Optional[int]) -> str:
+        return f"{size / compressed:5.1f}x" if compressed else "    -"
+
+    print(f"{'file':<40} {'bytes':>8} {'gzip':>8} {'ratio':>6} {'brotli':>8} {'ratio':>6}")
+    for result in results:
+        print(f"{result.path:<40} {result.size:>8} {result.gzip_size:>8} {ratio(result.size, result.gzip_size):>6} "
+              f"{result.brotli_size or '-':>8} {ratio(result.size, result.brotli_size):>6}")
+
+    size = sum(result.size for result in results)
+    gzip_size = sum(result.gzip_size for result in results)
+    brotli_size = sum(result.brotli_size or result.size for result in results)
+    print(f"{'total':<40} {size:>8} {gzip_size:>8} {ratio(size, gzip_size):>6} "
+          f"{brotli_size if brotli else '-':>8} {ratio(size, brotli_size) if brotli else '    -':>6}")
+    if brotli is None:
+        print("[INFO] brotli is not installed, .br files were not written")
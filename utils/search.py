@@ -0,0 +1,126 @@
+import bisect
+import heapq
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+from utils.annotate_food_types import get_matcher
+
+# Words too common in menus to be worth a search term, in both menu languages
+STOPWORDS = frozenset("""
+    med och pa i av samt eller en ett serveras till fran som
+    with and or of the a an in on served
+""".split())
+MIN_TERM_LENGTH = 2
+# Query words at least this long also match inside terms, so "curry" finds "kycklingcurry"
+MIN_INFIX_LENGTH = 3
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+def fold(text: str) -> str:
+    """Lowercase `text` and drop diacritics ("Räkor Crème" -> "rakor creme"); app.js folds queries the same way."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN.findall(fold(text))
+            if len(token) >= MIN_TERM_LENGTH and token not in STOPWORDS]
+
+def build_index(days: Dict[str, Optional[dict]], version: int = 1) -> dict:
+    """
+    An inverted index over the item names, descriptions and categories of
+    `days` ({day label: lunch data}), plus each item's food tag names in
+    English ("fish", "chicken"), so English words find Swedish dishes.
+
+    An item served on several days is one document listing those days.
+    `terms` is sorted, so every term starting with a prefix is one contiguous
+    range (found by binary search); `postings[i]` are the documents containing
+    `terms[i]`, as gaps between ascending document numbers.
+    """
+    matcher = get_matcher()
+    labels = [label for label, data in days.items() if data]
+    restaurants: Dict[str, int] = {}
+    documents: Dict[Tuple[int, str, str, str], List[int]] = {}
+    for day_index, label in enumerate(labels):
+        for scraper_name, menu in days[label].items():
+            restaurant = restaurants.setdefault(scraper_name, len(restaurants))
+            for item in menu.get("items", []):
+                key = (restaurant, *(item.get(field) or "" for field in ("name", "description", "category")))
+                served = documents.setdefault(key, [])
+                if not served or served[-1] != day_index:
+                    served.append(day_index)
+
+    postings: Dict[str, List[int]] = {}
+    docs = []
+    for number, ((restaurant, name, description, category), served) in enumerate(documents.items()):
+        docs.append([restaurant, name, description, served])
+        text = f"{name} {description} {category}"
+        words = set(tokenize(text)) | set(matcher.tags(text))
+        for word in words:
+            postings.setdefault(word, []).append(number)
+
+    terms = sorted(postings)
+    return {
+        "version": version,
+        "days": labels,
+        "restaurants": list(restaurants),
+        "docs": docs,
+        "terms": terms,
+        "postings": [_gaps(postings[term]) for term in terms],
+    }
+
+def _gaps(numbers: List[int]) -> List[int]:
+    return [number - previous for previous, number in zip([0] + numbers, numbers)]
+
+def _ungap(gaps: List[int]) -> List[int]:
+    numbers = []
+    total = 0
+    for gap in gaps:
+        total += gap
+        numbers.append(total)
+    return numbers
+
+def decode(index: dict) -> dict:
+    """The index with plain document numbers in its postings, ready for search() (app.js does this on load)."""
+    return {**index, "postings": [_ungap(gaps) for gaps in index["postings"]]}
+
+def matching_terms(terms: List[str], word: str) -> Tuple[List[int], List[int]]:
+    """Indices of the terms starting with `word`, and of those containing it elsewhere."""
+    start = bisect.bisect_left(terms, word)
+    end = bisect.bisect_left(terms, word + "\uffff", start)
+    prefix = list(range(start, end))
+    infix = []
+    if len(word) >= MIN_INFIX_LENGTH:
+        infix = [i for i, term in enumerate(terms) if word in term and not term.startswith(word)]
+    return prefix, infix
+
+def search(index: dict, query: str, day: Optional[str] = None, limit: int = 20) -> List[list]:
+    """
+    Documents of a decode()d index containing every word of `query` (as a
+    prefix or, for longer words, anywhere in a term). Prefix matches rank
+    first, then documents served on `day`, then those served on more days.
+    The same algorithm runs in the browser (app.js).
+    """
+    words = [word for word in _TOKEN.findall(fold(query)) if word not in STOPWORDS]
+    if not words:
+        return []
+    scores: Optional[Dict[int, int]] = None
+    for word in words:
+        prefix, infix = matching_terms(index["terms"], word)
+        word_scores: Dict[int, int] = {}
+        # Prefix matches last, so they overwrite the lower infix score
+        for weight, found in ((1, infix), (2, prefix)):
+            for term in found:
+                word_scores.update(dict.fromkeys(index["postings"][term], weight))
+        if scores is None:
+            scores = word_scores
+        else:
+            scores = {doc: score + word_scores[doc] for doc, score in scores.items() if doc in word_scores}
+        if not scores:
+            return []
+    day_index = index["days"].index(day) if day in index["days"] else -1
+    docs = index["docs"]
+    ranked = heapq.nsmallest(
+        limit, scores, key=lambda doc: (-scores[doc], day_index not in docs[doc][3], -len(docs[doc][3]), doc)
+    )
+    return [docs[doc] for doc in ranked]
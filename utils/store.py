@@ -0,0 +1,244 @@
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
+
+from utils import manifest, week_store
+from utils.annotate_food_types import annotate_menus, get_matcher
+from utils.archive import week_label
+
+# Where scraped menus are kept: "json" (data/lunch_week.json plus the exported
+# data/lunch_data_<day>.json files) or "sqlite" (data/lunch.sqlite3). main.py
+# and generate_html.py only go through get_store(), so either works for both.
+STORE_BACKEND = os.environ.get("LUNCH_STORE", "json")
+SQLITE_STORE_PATH = os.path.join("data", "lunch.sqlite3")
+
+ITEM_FIELDS = week_store.ITEM_FIELDS
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+class JsonStore:
+    """
+    The week store (utils/week_store.py). Nothing is written until the run is
+    finished: the week is one file, rewritten once with every scraper's results.
+    """
+    def __init__(self, path: str = week_store.WEEK_STORE_PATH):
+        self.path = path
+        self._run_ids = itertools.count(1)
+        self._run_weeks: Dict[int, str] = {}
+
+    def has_day(self, day: str) -> bool:
+        """True when `day` of the current ISO week is stored."""
+        return week_store.has_day(day, week_label(date.today()), self.path)
+
+    def start_run(self, week: str, days: List[str]) -> int:
+        run_id = next(self._run_ids)
+        self._run_weeks[run_id] = week
+        return run_id
+
+    def save_menus(self, run_id: int, scraper_name: str, menus: Dict[str, dict]) -> None:
+        pass
+
+    def finish_run(self, run_id: int, results_by_day: Dict[str, Dict[str, dict]]) -> List[str]:
+        written = [self.path] if week_store.update(results_by_day, self.path, self._run_weeks.pop(run_id, None)) else []
+        # Annotated with food tags; left untouched when neither menus nor tags changed
+        days = [day for day, results in results_by_day.items() if results]
+        return written + week_store.export_days(days, path=self.path)
+
+    def load_day(self, day: str) -> Optional[dict]:
+        """A day's lunch data, tagged (exported files are annotated already; this covers older files)."""
+        filename = week_store.day_file(day)
+        # The per-day files are derived from the week store and not committed
+        if not os.path.exists(filename):
+            week_store.export_days([day], missing_only=True, path=self.path)
+        if not os.path.exists(filename):
+            return None
+        with open(filename, encoding="utf-8") as f:
+            return annotate_menus(json.load(f))
+
+    def last_updated(self, day: str) -> Optional[datetime]:
+        return manifest.last_updated(week_store.day_file(day))
+
+    def day_key(self, day: str) -> str:
+        """sha256 of data/lunch_data_<day>.json, or of nothing when there is no data for the day."""
+        digest = hashlib.sha256()
+        try:
+            with open(week_store.day_file(day), "rb") as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            pass
+        return digest.hexdigest()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS restaurants (
+    id       INTEGER PRIMARY KEY,
+    name     TEXT NOT NULL UNIQUE,  -- scraper name, e.g. "KooperativetScraper"
+    position INTEGER                -- order of SCRAPERS in the last finished run
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY,
+    week        TEXT NOT NULL,      -- ISO week, e.g. "2025-W23"
+    days        TEXT NOT NULL,      -- comma separated
+    started_at  TEXT NOT NULL,
+    finished_at TEXT,
+    items       INTEGER
+);
+CREATE TABLE IF NOT EXISTS items (
+    id            INTEGER PRIMARY KEY,
+    restaurant_id INTEGER NOT NULL REFERENCES restaurants (id),
+    week          TEXT NOT NULL,
+    day           TEXT NOT NULL,
+    position      INTEGER NOT NULL,
+    name          TEXT NOT NULL,
+    category      TEXT NOT NULL,
+    description   TEXT NOT NULL,
+    price         TEXT NOT NULL,
+    run_id        INTEGER NOT NULL REFERENCES runs (id)  -- the run that last changed this menu
+);
+CREATE TABLE IF NOT EXISTS tags (
+    item_id INTEGER NOT NULL REFERENCES items (id) ON DELETE CASCADE,
+    tag     TEXT NOT NULL,          -- food_tags.json key, e.g. "fish"
+    PRIMARY KEY (item_id, tag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS items_day ON items (day, week);
+CREATE INDEX IF NOT EXISTS items_week ON items (week);
+CREATE INDEX IF NOT EXISTS items_restaurant ON items (restaurant_id, week, day);
+CREATE INDEX IF NOT EXISTS tags_tag ON tags (tag);
+"""
+
+class SqliteStore:
+    """
+    Menus in SQLite (WAL mode), one row per item and restaurant, week and day.
+    Every scraper worker commits its own menus as soon as it is done, on its own
+    connection; WAL lets the generators read while the scrapers write. A day is
+    served from the latest week it was scraped in.
+    """
+    def __init__(self, path: str = SQLITE_STORE_PATH):
+        self.path = path
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("PRAGMA foreign_keys = ON")
+        with self._schema_lock:
+            if not self._schema_ready:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                connection.execute("PRAGMA journal_mode = WAL")
+                connection.executescript(SCHEMA)
+                self._schema_ready = True
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def has_day(self, day: str) -> bool:
+        """True when `day` of the current ISO week is stored."""
+        with closing(self._connect()) as connection:
+            return connection.execute(
+                "SELECT 1 FROM items WHERE day = ? AND week = ? LIMIT 1", (day, week_label(date.today()))
+            ).fetchone() is not None
+
+    def start_run(self, week: str, days: List[str]) -> int:
+        with closing(self._connect()) as connection, connection:
+            return connection.execute(
+                "INSERT INTO runs (week, days, started_at) VALUES (?, ?, ?)", (week, ",".join(days), _now())
+            ).lastrowid
+
+    def save_menus(self, run_id: int, scraper_name: str, menus: Dict[str, dict]) -> None:
+        """Replace the stored menus of one scraper for each day in `menus` ({day: menu}), in one transaction."""
+        matcher = get_matcher()
+        with closing(self._connect()) as connection, connection:
+            (week,) = connection.execute("SELECT week FROM runs WHERE id = ?", (run_id,)).fetchone()
+            connection.execute("INSERT OR IGNORE INTO restaurants (name) VALUES (?)", (scraper_name,))
+            (restaurant_id,) = connection.execute(
+                "SELECT id FROM restaurants WHERE name = ?", (scraper_name,)
+            ).fetchone()
+
+            for day, menu in menus.items():
+                items = [tuple(item.get(field) or "" for field in ITEM_FIELDS) for item in menu.get("items", [])]
+                key = (restaurant_id, week, day)
+                stored = connection.execute(
+                    "SELECT name, category, description, price FROM items "
+                    "WHERE restaurant_id = ? AND week = ? AND day = ? ORDER BY position", key
+                ).fetchall()
+                # Unchanged menus keep the run that last changed them, and so their update time
+                if stored == items:
+                    continue
+
+                connection.execute("DELETE FROM items WHERE restaurant_id = ? AND week = ? AND day = ?", key)
+                for position, fields in enumerate(items):
+                    item_id = connection.execute(
+                        "INSERT INTO items (restaurant_id, week, day, position, name, category, description, "
+                        "price, run_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", (*key, position, *fields, run_id)
+                    ).lastrowid
+                    name, category, description, _ = fields
+                    connection.executemany(
+                        "INSERT INTO tags (item_id, tag) VALUES (?, ?)",
+                        [(item_id, tag) for tag in sorted(matcher.tags(f"{name} {description} {category}"))],
+                    )
+
+    def finish_run(self, run_id: int, results_by_day: Dict[str, Dict[str, dict]]) -> List[str]:
+        """Close the run and keep the scrapers' order for display. Returns [path] if the run changed any menu."""
+        order = list(dict.fromkeys(name for results in results_by_day.values() for name in results))
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "UPDATE restaurants SET position = ? WHERE name = ?", list(enumerate(order))
+            )
+            (changed,) = connection.execute("SELECT COUNT(*) FROM items WHERE run_id = ?", (run_id,)).fetchone()
+            connection.execute("UPDATE runs SET finished_at = ?, items = ? WHERE id = ?", (_now(), changed, run_id))
+        return [self.path] if changed else []
+
+    def _latest_week(self, connection: sqlite3.Connection, day: str) -> Optional[str]:
+        return connection.execute("SELECT MAX(week) FROM items WHERE day = ?", (day,)).fetchone()[0]
+
+    def _day_rows(self, day: str) -> list:
+        with closing(self._connect()) as connection:
+            week = self._latest_week(connection, day)
+            return connection.execute(
+                "SELECT restaurants.name, items.name, category, description, price FROM items "
+                "JOIN restaurants ON restaurants.id = items.restaurant_id WHERE day = ? AND week = ? "
+                "ORDER BY restaurants.position IS NULL, restaurants.position, restaurants.name, items.position",
+                (day, week),
+            ).fetchall()
+
+    def load_day(self, day: str) -> Optional[dict]:
+        """A day's lunch data in the per-day file format, tagged, or None if it was never scraped."""
+        rows = self._day_rows(day)
+        if not rows:
+            return None
+        data: Dict[str, dict] = {}
+        for scraper_name, *fields in rows:
+            data.setdefault(scraper_name, {"day": day, "items": []})["items"].append(dict(zip(ITEM_FIELDS, fields)))
+        return annotate_menus(data)
+
+    def last_updated(self, day: str) -> Optional[datetime]:
+        with closing(self._connect()) as connection:
+            updated = connection.execute(
+                "SELECT MAX(runs.started_at) FROM items JOIN runs ON runs.id = items.run_id "
+                "WHERE day = ? AND items.week = ?", (day, self._latest_week(connection, day))
+            ).fetchone()[0]
+        return datetime.fromisoformat(updated) if updated else None
+
+    def day_key(self, day: str) -> str:
+        return hashlib.sha256(json.dumps(self._day_rows(day), ensure_ascii=False).encode("utf-8")).hexdigest()
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_store():
+    """The process-wide store for STORE_BACKEND."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            if STORE_BACKEND == "sqlite":
+                _store = SqliteStore()
+            elif STORE_BACKEND == "json":
+                _store = JsonStore()
+            else:
+                raise ValueError(f"Unknown LUNCH_STORE {STORE_BACKEND!r} (expected 'json' or 'sqlite')")
+        return _store
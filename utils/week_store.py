@@ -0,0 +1,134 @@
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+
+from utils import manifest
+from utils.annotate_food_types import write_annotated
+
+# The scraped week: each restaurant's items stored once, with the item indices served per day
+# and the ISO week each day was scraped in. data/lunch_data_<day>.json are exported from it
+# (see export_days) and not committed.
+WEEK_STORE_PATH = os.path.join("data", "lunch_week.json")
+STORE_VERSION = 1
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday"]
+ITEM_FIELDS = ("name", "category", "description", "price")
+
+def day_file(day: str) -> str:
+    return os.path.join("data", f"lunch_data_{day}.json")
+
+def _empty_week() -> dict:
+    return {"version": STORE_VERSION, "items": {}, "days": {}, "weeks": {}}
+
+def load_week(path: str = WEEK_STORE_PATH) -> dict:
+    """
+    The stored week. Without a store, one is built from existing per-day files,
+    so checkouts from before the store existed keep their data.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    week = _empty_week()
+    for day in WEEKDAYS:
+        try:
+            with open(day_file(day), encoding="utf-8") as f:
+                set_day(week, day, json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            continue
+    return week
+
+def has_day(day: str, iso_week: str, path: str = WEEK_STORE_PATH) -> bool:
+    """True when `day` is stored and was scraped in `iso_week` (e.g. "2025-W23")."""
+    week = load_week(path)
+    return bool(week["days"].get(day)) and week.get("weeks", {}).get(day) == iso_week
+
+def set_day(week: dict, day: str, results: Dict[str, dict], iso_week: Optional[str] = None) -> None:
+    """
+    Replace the menus of `day` with `results` ({scraper name: {"day", "items"}}),
+    reusing stored items, and record the ISO week they were scraped in.
+    """
+    menus = {}
+    for scraper_name, menu in results.items():
+        items = week["items"].setdefault(scraper_name, [])
+        index = {tuple(item.get(field) for field in ITEM_FIELDS): i for i, item in enumerate(items)}
+        positions = []
+        for item in menu.get("items", []):
+            key = tuple(item.get(field) for field in ITEM_FIELDS)
+            if key not in index:
+                index[key] = len(items)
+                items.append(dict(zip(ITEM_FIELDS, key)))
+            positions.append(index[key])
+        menus[scraper_name] = positions
+    week["days"][day] = menus
+    if iso_week:
+        week.setdefault("weeks", {})[day] = iso_week
+    _drop_unused(week)
+
+def _drop_unused(week: dict) -> None:
+    """Remove items no day refers to any more and renumber the rest."""
+    for scraper_name in list(week["items"]):
+        used = sorted({i for menus in week["days"].values() for i in menus.get(scraper_name, [])})
+        items = week["items"][scraper_name]
+        if len(used) == len(items):
+            continue
+        if not used:
+            del week["items"][scraper_name]
+            continue
+        renumber = {old: new for new, old in enumerate(used)}
+        week["items"][scraper_name] = [items[i] for i in used]
+        for menus in week["days"].values():
+            if scraper_name in menus:
+                menus[scraper_name] = [renumber[i] for i in menus[scraper_name]]
+
+def day_data(week: dict, day: str) -> Optional[dict]:
+    """`day` in the per-day file format ({scraper name: {"day", "items"}}), or None if it was never scraped."""
+    menus = week["days"].get(day)
+    if menus is None:
+        return None
+    return {
+        scraper_name: {"day": day, "items": [dict(week["items"][scraper_name][i]) for i in positions]}
+        for scraper_name, positions in menus.items()
+    }
+
+def _dumps(week: dict) -> bytes:
+    text = json.dumps(week, indent=2, ensure_ascii=False)
+    # Index lists on one line each, so a changed day is a one-line diff
+    text = re.sub(r"\[\s+([\d,\s]+?)\s+\]", lambda match: "[" + re.sub(r"\s+", " ", match.group(1)) + "]", text)
+    return (text + "\n").encode("utf-8")
+
+def save_week(week: dict, path: str = WEEK_STORE_PATH) -> bool:
+    """Write the store unless it already holds exactly this week. Returns True if it was written."""
+    return manifest.write_if_changed(path, _dumps(week))
+
+def update(results_by_day: Dict[str, Dict[str, dict]], path: str = WEEK_STORE_PATH,
+           iso_week: Optional[str] = None) -> bool:
+    """
+    Store freshly scraped days ({day: {scraper name: menu}}) of `iso_week`;
+    days without any results keep their old menus.
+    """
+    week = load_week(path)
+    for day, results in results_by_day.items():
+        if results:
+            set_day(week, day, results, iso_week)
+    return save_week(week, path)
+
+def export_days(days: Iterable[str] = WEEKDAYS, missing_only: bool = False,
+                path: str = WEEK_STORE_PATH) -> List[str]:
+    """
+    Write data/lunch_data_<day>.json (annotated with food tags) for every stored
+    day in `days`, skipping files that are already current. Returns the files written.
+    """
+    week = load_week(path)
+    written = []
+    for day in days:
+        filename = day_file(day)
+        data = day_data(week, day)
+        if data is None or (missing_only and os.path.exists(filename)):
+            continue
+        if write_annotated(filename, data):
+            written.append(filename)
+    return written